@@ -0,0 +1,124 @@
+"""
+Benchmark overhead of the access token middleware on the ingestion route and on page routes.
+
+Calls an application with a stub `POST /api/tasks/{task_id}/{event}` route (same shape as the ingestion route,
+without database access) and a stub page route directly through ASGI, without a network or HTTP client:
+- none: no middleware;
+- legacy: `BaseHTTPMiddleware` subclass reading settings on every request;
+- asgi: pure ASGI `AccessTokenMiddleware` used now.
+
+Usage:
+    uv run python scripts/benchmark_auth_middleware.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import time
+import typing as tp
+import uuid
+
+import fastapi
+from fastapi import HTTPException, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+from starlette.types import Message
+
+from taskiq_dashboard.api.middlewares import AccessTokenMiddleware
+from taskiq_dashboard.infrastructure import get_settings
+
+
+class LegacyAccessTokenMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: tp.Callable[[Request], tp.Awaitable[Response]]) -> Response:
+        if not request.url.path.startswith('/api/'):
+            return await call_next(request)
+
+        token = request.headers.get('access-token')
+        if not token:
+            raise HTTPException(status_code=401, detail='Missing or invalid Authorization header')
+
+        settings = get_settings()
+        if settings.api.token.get_secret_value() != token:
+            raise HTTPException(status_code=401, detail='Invalid access token')
+        return await call_next(request)
+
+
+def build_application(middleware: str) -> fastapi.FastAPI:
+    app = fastapi.FastAPI()
+
+    @app.post('/api/tasks/{task_id}/{event}', status_code=204)
+    async def handle_event(task_id: uuid.UUID, event: str, body: dict[str, tp.Any]) -> None: ...
+
+    @app.get('/')
+    async def page() -> fastapi.responses.HTMLResponse:
+        return fastapi.responses.HTMLResponse('<html></html>')
+
+    token = get_settings().api.token.get_secret_value()
+    if middleware == 'legacy':
+        app.add_middleware(LegacyAccessTokenMiddleware)
+    elif middleware == 'asgi':
+        app.add_middleware(AccessTokenMiddleware, token=token)
+    return app
+
+
+async def call(app: fastapi.FastAPI, method: str, path: str, headers: list[tuple[bytes, bytes]], body: bytes) -> int:
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': method,
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'root_path': '',
+        'query_string': b'',
+        'headers': headers,
+        'server': ('test', 80),
+        'client': ('test', 12345),
+    }
+    status_code = 0
+
+    async def receive() -> Message:
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    async def send(message: Message) -> None:
+        nonlocal status_code
+        if message['type'] == 'http.response.start':
+            status_code = message['status']
+
+    await app(scope, receive, send)
+    return status_code
+
+
+async def measure(app: fastapi.FastAPI, method: str, path: str, requests: int) -> float:
+    token = get_settings().api.token.get_secret_value().encode()
+    headers = [(b'content-type', b'application/json'), (b'access-token', token)]
+    body = b'{"taskName": "benchmark.task", "worker": "benchmark", "queuedAt": "2025-01-01T00:00:00"}'
+    assert await call(app, method, path, headers, body) in {200, 204}  # noqa: S101
+    started_at = time.perf_counter()
+    for _ in range(requests):
+        await call(app, method, path, headers, body)
+    return (time.perf_counter() - started_at) * 1_000_000 / requests
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=20_000, help='requests per measurement')
+    arguments = parser.parse_args()
+
+    routes = (('ingestion', 'POST', f'/api/tasks/{uuid.uuid4()}/queued'), ('page', 'GET', '/'))
+    for route, method, path in routes:
+        timings = {}
+        for middleware in ('none', 'legacy', 'asgi'):
+            app = build_application(middleware)
+            timings[middleware] = await measure(app, method, path, arguments.requests)
+        print(  # noqa: T201
+            f'{route:<10} | '
+            + ' | '.join(
+                f'{middleware} {timing:6.1f} us ({timing - timings["none"]:+6.1f})'
+                for middleware, timing in timings.items()
+            )
+        )
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+"""
+Benchmark event ingestion latency while `CleanupService` removes old tasks from a local SQLite file.
+
+Compares a single unbounded DELETE (batch size covering all expired tasks) with batched deletes.
+
+Usage:
+    uv run python scripts/benchmark_cleanup.py --tasks 200000 --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import datetime as dt
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+import sqlalchemy as sa
+
+from taskiq_dashboard.domain.dto.task import QueuedTask
+from taskiq_dashboard.domain.dto.task_status import TaskStatus
+from taskiq_dashboard.infrastructure import SqliteSettings
+from taskiq_dashboard.infrastructure.database.schemas import SqliteTask
+from taskiq_dashboard.infrastructure.database.session_provider import AsyncPostgresSessionProvider
+from taskiq_dashboard.infrastructure.repositories.task import TaskRepository
+from taskiq_dashboard.infrastructure.services.cleanup_service import CleanupService
+from taskiq_dashboard.infrastructure.services.schema_service import SchemaService
+from taskiq_dashboard.infrastructure.settings import CleanupSettings
+
+
+async def populate(session_provider: AsyncPostgresSessionProvider, count: int) -> None:
+    finished_at = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=60)
+    for offset in range(0, count, 10_000):
+        rows = [
+            {
+                'id': uuid.uuid4(),
+                'name': f'benchmark.task_{index % 10}',
+                'status': TaskStatus.COMPLETED.value,
+                'worker': 'benchmark',
+                'args': [index],
+                'kwargs': {},
+                'labels': {},
+                'queued_at': finished_at,
+                'started_at': finished_at,
+                'finished_at': finished_at,
+            }
+            for index in range(offset, min(offset + 10_000, count))
+        ]
+        async with session_provider.session() as session:
+            await session.execute(sa.insert(SqliteTask), rows)
+
+
+async def ingest(repository: TaskRepository, stop: asyncio.Event) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    errors = 0
+    while not stop.is_set():
+        event = QueuedTask(task_name='benchmark.live', worker='benchmark', queued_at=dt.datetime.now(dt.timezone.utc))
+        started_at = time.perf_counter()
+        try:
+            await repository.create_task(uuid.uuid4(), event)
+        except sa.exc.OperationalError:
+            errors += 1
+        latencies.append(time.perf_counter() - started_at)
+        await asyncio.sleep(0.005)
+    return latencies, errors
+
+
+async def run(database: Path, count: int, batch_size: int, batch_pause_seconds: float) -> None:
+    session_provider = AsyncPostgresSessionProvider(SqliteSettings(dsn=f'sqlite+aiosqlite:///{database}'))
+    await SchemaService(session_provider, table_name='tasks').create_schema()
+    await populate(session_provider, count)
+    repository = TaskRepository(session_provider, SqliteTask)
+    settings = CleanupSettings(
+        ttl_days=30,
+        max_tasks=10 * count,
+        batch_size=batch_size,
+        batch_pause_seconds=batch_pause_seconds,
+    )
+    cleanup_service = CleanupService(session_provider, SqliteTask, settings)
+
+    stop = asyncio.Event()
+    ingestion = asyncio.create_task(ingest(repository, stop))
+    started_at = time.perf_counter()
+    result = await cleanup_service.cleanup()
+    cleanup_seconds = time.perf_counter() - started_at
+    stop.set()
+    latencies, errors = await ingestion
+    await session_provider.close()
+
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    p99_ms = latencies_ms[int(len(latencies_ms) * 0.99)]
+    label = 'single delete' if batch_size >= count else f'batch {batch_size}'
+    print(  # noqa: T201
+        f'{label:<14} deleted {result.deleted_by_ttl} in {result.batches_count:>4} batches, {cleanup_seconds:6.2f} s | '
+        f'ingestion p50 {statistics.median(latencies_ms):7.1f} ms, p99 {p99_ms:7.1f} ms, '
+        f'max {latencies_ms[-1]:7.1f} ms, errors {errors}'
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tasks', type=int, default=200_000, help='number of expired tasks to clean up')
+    parser.add_argument('--batch-size', type=int, default=1000, help='cleanup batch size')
+    parser.add_argument('--batch-pause', type=float, default=0.1, help='pause between batches in seconds')
+    arguments = parser.parse_args()
+
+    for batch_size in (arguments.tasks, arguments.batch_size):
+        with tempfile.TemporaryDirectory() as directory:
+            await run(Path(directory) / 'benchmark.db', arguments.tasks, batch_size, arguments.batch_pause)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
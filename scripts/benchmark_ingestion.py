@@ -0,0 +1,126 @@
+"""
+Benchmark requests per second of task event ingestion routes on a single core.
+
+Sends `queued` events and batches of 10 events straight to the application through ASGI, with the real
+middleware stack and a no-op event writer, so only request handling is measured (no network, no database):
+- fastapi: `handle_task_event` / `handle_task_events_batch` routes (fast path disabled);
+- fast path: `EventIngestionMiddleware` used by default.
+
+Usage:
+    uv run python scripts/benchmark_ingestion.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+import fastapi
+from dishka import Provider, Scope, make_async_container, provide
+from starlette.types import Message
+
+from taskiq_dashboard.api.application import get_application
+from taskiq_dashboard.domain.dto.ingestion import IngestionMetrics
+from taskiq_dashboard.domain.dto.task import ExecutedTask, QueuedTask, StartedTask
+from taskiq_dashboard.domain.services import AbstractEventWriter
+from taskiq_dashboard.infrastructure import get_settings
+
+
+class NullEventWriter(AbstractEventWriter):
+    async def write(self, events: list[tuple[uuid.UUID, QueuedTask | StartedTask | ExecutedTask]]) -> None:
+        pass
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def metrics(self) -> IngestionMetrics:
+        return IngestionMetrics(is_write_behind_enabled=False)
+
+
+class BenchmarkProvider(Provider):
+    @provide(scope=Scope.APP)
+    def provide_event_writer(self) -> AbstractEventWriter:
+        return NullEventWriter()
+
+
+def build_application(*, is_fast_path_enabled: bool) -> fastapi.FastAPI:
+    get_settings().ingestion.is_fast_path_enabled = is_fast_path_enabled
+    app = get_application()
+    app.state.dishka_container = make_async_container(BenchmarkProvider())
+    return app
+
+
+async def call(app: fastapi.FastAPI, path: str, body: bytes) -> int:
+    token = get_settings().api.token.get_secret_value().encode()
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'POST',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'root_path': '',
+        'query_string': b'',
+        'headers': [(b'content-type', b'application/json'), (b'access-token', token)],
+        'server': ('test', 80),
+        'client': ('test', 12345),
+    }
+    status_code = 0
+
+    async def receive() -> Message:
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    async def send(message: Message) -> None:
+        nonlocal status_code
+        if message['type'] == 'http.response.start':
+            status_code = message['status']
+
+    await app(scope, receive, send)
+    return status_code
+
+
+async def measure(app: fastapi.FastAPI, path: str, body: bytes, requests: int) -> float:
+    status_code = await call(app, path, body)
+    if status_code != 204:  # noqa: PLR2004
+        raise RuntimeError(f'Unexpected response status {status_code}')
+    started_at = time.perf_counter()
+    for _ in range(requests):
+        await call(app, path, body)
+    return requests / (time.perf_counter() - started_at)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=20_000, help='requests per measurement')
+    arguments = parser.parse_args()
+
+    task_id = uuid.uuid4()
+    queued = {
+        'args': [1, 'two'],
+        'kwargs': {'three': 3},
+        'labels': {'queue': 'default'},
+        'taskName': 'benchmark.task',
+        'worker': 'benchmark',
+        'queuedAt': '2025-01-01T00:00:00+00:00',
+    }
+    batch = {'events': [{'taskId': str(uuid.uuid4()), 'event': 'queued', 'data': queued} for _ in range(10)]}
+    scenarios = (
+        ('single event', f'/api/tasks/{task_id}/queued', json.dumps(queued).encode()),
+        ('batch of 10', '/api/tasks/batch', json.dumps(batch).encode()),
+    )
+    for scenario, path, body in scenarios:
+        results = []
+        for label, is_fast_path_enabled in (('fastapi', False), ('fast path', True)):
+            app = build_application(is_fast_path_enabled=is_fast_path_enabled)
+            rate = await measure(app, path, body, arguments.requests)
+            results.append(f'{label} {rate:>8.0f} req/s')
+        print(f'{scenario:<13} | ' + ' | '.join(results))  # noqa: T201
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,111 @@
+"""
+Benchmark events per second sent by `DashboardMiddleware` from a single worker process with different HTTP settings.
+
+The dashboard is replaced by a Granian server (in a separate process, HTTP mode `auto` as used by the dashboard)
+answering `204 No Content` to every request, so only the client side is measured: serialization, the connection
+pool and the protocol overhead. Every event is sent with a separate request (batching disabled).
+
+Usage:
+    uv run python scripts/benchmark_middleware_client.py --events 5000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import time
+import typing as tp
+import uuid
+
+import httpx
+from starlette.types import Receive, Scope, Send
+from taskiq import TaskiqMessage
+
+from taskiq_dashboard import DashboardMiddleware
+
+
+ADDRESS = '127.0.0.1'
+SETTINGS: dict[str, dict[str, tp.Any]] = {
+    'HTTP/1.1, 100 connections': {'max_connections': 100, 'max_keepalive_connections': 20},
+    'HTTP/1.1, 100 keep-alive connections': {'max_connections': 100, 'max_keepalive_connections': 100},
+    'HTTP/1.1, 10 connections': {'max_connections': 10, 'max_keepalive_connections': 10},
+    'HTTP/2, 1 connection': {'http2': True, 'max_connections': 1, 'max_keepalive_connections': 1},
+}
+
+
+async def dashboard_stub(scope: Scope, receive: Receive, send: Send) -> None:
+    if scope['type'] != 'http':
+        return
+    more_body = True
+    while more_body:
+        more_body = (await receive()).get('more_body', False)
+    await send({'type': 'http.response.start', 'status': 204, 'headers': []})
+    await send({'type': 'http.response.body', 'body': b''})
+
+
+def serve(port: int) -> None:
+    from granian.server.embed import Server  # noqa: PLC0415
+
+    asyncio.run(Server(dashboard_stub, address=ADDRESS, port=port, interface='asgi', log_enabled=False).serve())
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind((ADDRESS, 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for_server(url: str) -> None:
+    async with httpx.AsyncClient() as client:
+        for _ in range(100):
+            try:
+                await client.get(url)
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+            else:
+                return
+    msg = f'Server at {url} is not available'
+    raise RuntimeError(msg)
+
+
+async def run(url: str, events_count: int, concurrency: int, settings: dict[str, tp.Any]) -> tuple[float, int]:
+    middleware = DashboardMiddleware(url=url, api_token='supersecret', max_pending_events=None, **settings)
+    await middleware.startup()
+    messages = [
+        TaskiqMessage(task_id=uuid.uuid4().hex, task_name='benchmark.task', labels={}, args=[1, 2], kwargs={'a': 'b'})
+        for _ in range(events_count)
+    ]
+    started_at = time.perf_counter()
+    for message in messages:
+        # a busy worker keeps a bounded number of events in flight
+        while len(middleware._pending) >= concurrency:
+            await asyncio.wait(list(middleware._pending), return_when=asyncio.FIRST_COMPLETED)
+        await middleware.post_send(message)
+    await asyncio.gather(*middleware._pending, return_exceptions=True)
+    elapsed = time.perf_counter() - started_at
+    await middleware.shutdown()
+    return events_count / elapsed, middleware.counters.sent
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=5_000, help='number of events sent with each setting')
+    parser.add_argument('--concurrency', type=int, default=200, help='number of events in flight')
+    arguments = parser.parse_args()
+
+    port = free_port()
+    server = multiprocessing.Process(target=serve, args=(port,), daemon=True)
+    server.start()
+    url = f'http://{ADDRESS}:{port}'
+    try:
+        await wait_for_server(url)
+        for name, settings in SETTINGS.items():
+            events_per_second, sent_count = await run(url, arguments.events, arguments.concurrency, settings)
+            print(f'{name:<40} {events_per_second:8.0f} events/s ({sent_count} sent)')  # noqa: T201
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""
+Benchmark execution time percentiles per task name on a local SQLite file.
+
+Compares exact percentiles read with `ORDER BY execution_time LIMIT 1 OFFSET n` from the tasks table
+with percentiles merged from latency sketches kept by `TaskRepository` on ingestion.
+
+Usage:
+    uv run python scripts/benchmark_percentiles.py --tasks 200000 --hours 24
+"""
+
+import argparse
+import asyncio
+import datetime as dt
+import random
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+import sqlalchemy as sa
+
+from taskiq_dashboard.domain.dto.task import ExecutedTask, QueuedTask, StartedTask
+from taskiq_dashboard.infrastructure import SqliteSettings
+from taskiq_dashboard.infrastructure.database.schemas import SqliteTask, SqliteTaskStats
+from taskiq_dashboard.infrastructure.database.session_provider import AsyncPostgresSessionProvider
+from taskiq_dashboard.infrastructure.repositories.stats import StatsRepository
+from taskiq_dashboard.infrastructure.repositories.task import TaskRepository
+from taskiq_dashboard.infrastructure.services.schema_service import SchemaService
+
+
+TASK_NAMES_COUNT = 10
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+async def populate(repository: TaskRepository, count: int, hours: int) -> None:
+    rng = random.Random(42)
+    now = dt.datetime.now(dt.timezone.utc)
+    for offset in range(0, count, 1000):
+        events: list[tuple[uuid.UUID, QueuedTask | StartedTask | ExecutedTask]] = []
+        for index in range(offset, min(offset + 1000, count)):
+            task_id = uuid.uuid4()
+            execution_time = rng.lognormvariate(0, 1)
+            finished_at = now - dt.timedelta(seconds=rng.uniform(0, hours * 3600))
+            started_at = finished_at - dt.timedelta(seconds=execution_time)
+            name = f'benchmark.task_{index % TASK_NAMES_COUNT}'
+            events.append((task_id, StartedTask(task_name=name, worker='benchmark', started_at=started_at)))
+            events.append((task_id, ExecutedTask(finished_at=finished_at, execution_time=execution_time)))
+        await repository.apply_events(events)
+
+
+async def exact_percentiles(
+    session_provider: AsyncPostgresSessionProvider,
+    since: dt.datetime,
+) -> dict[str, list[float]]:
+    percentiles: dict[str, list[float]] = {}
+    async with session_provider.session() as session:
+        counts = await session.execute(
+            sa.select(SqliteTask.name, sa.func.count())
+            .where(SqliteTask.finished_at >= since, SqliteTask.execution_time.is_not(None))
+            .group_by(SqliteTask.name)
+        )
+        for name, count in counts.all():
+            for quantile in QUANTILES:
+                query = (
+                    sa.select(SqliteTask.execution_time)
+                    .where(SqliteTask.name == name, SqliteTask.finished_at >= since)
+                    .where(SqliteTask.execution_time.is_not(None))
+                    .order_by(SqliteTask.execution_time)
+                    .limit(1)
+                    .offset(int(quantile * (count - 1)))
+                )
+                percentiles.setdefault(name, []).append((await session.execute(query)).scalar_one())
+    return percentiles
+
+
+async def run(database: Path, count: int, hours: int) -> None:
+    session_provider = AsyncPostgresSessionProvider(SqliteSettings(dsn=f'sqlite+aiosqlite:///{database}'))
+    await SchemaService(session_provider, table_name='tasks').create_schema()
+    repository = TaskRepository(session_provider, SqliteTask)
+    await populate(repository, count, hours)
+    stats_repository = StatsRepository(session_provider, SqliteTaskStats)
+
+    for period_hours in (1, hours):
+        until = dt.datetime.now(dt.timezone.utc)
+        since = until - dt.timedelta(hours=period_hours)
+        started_at = time.perf_counter()
+        exact = await exact_percentiles(session_provider, since)
+        exact_ms = (time.perf_counter() - started_at) * 1000
+        started_at = time.perf_counter()
+        stats = await stats_repository.get_task_stats(since=since, until=until)
+        sketch_ms = (time.perf_counter() - started_at) * 1000
+        exact_p99 = sum(values[-1] for values in exact.values()) / len(exact)
+        sketch_p99 = sum(task_stats.duration_p99 or 0.0 for task_stats in stats) / len(stats)
+        print(  # noqa: T201
+            f'last {period_hours:>3} h | exact {exact_ms:8.1f} ms, sketch {sketch_ms:7.1f} ms | '
+            f'mean p99 exact {exact_p99:.3f} s, sketch {sketch_p99:.3f} s'
+        )
+    await session_provider.close()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tasks', type=int, default=200_000, help='number of executed tasks')
+    parser.add_argument('--hours', type=int, default=24, help='period the tasks are spread over')
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        await run(Path(directory) / 'benchmark.db', arguments.tasks, arguments.hours)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+"""
+Benchmark rendering of the task list page with different template caching modes.
+
+Renders `home.html` (full page) and `partial/task_list.html` (htmx infinite scroll fragment)
+for lists of 30, 300 and 3000 tasks:
+- uncached: `env.cache = None`, every render and every row include parses and compiles templates again;
+- auto reload: compiled templates are cached, files are checked for changes on every lookup;
+- cached: compiled templates are cached and compiled in advance, files are never checked.
+
+Usage:
+    uv run python scripts/benchmark_templates.py --repeat 5
+"""
+
+import argparse
+import datetime as dt
+import pathlib
+import time
+import typing as tp
+import uuid
+
+from fastapi.templating import Jinja2Templates
+from starlette.requests import Request
+
+from taskiq_dashboard.api.application import get_application
+from taskiq_dashboard.domain.dto.task import TaskSummary
+from taskiq_dashboard.domain.dto.task_status import TaskStatus
+
+
+TEMPLATES_DIRECTORY = pathlib.Path(__file__).parents[1] / 'taskiq_dashboard' / 'api' / 'templates'
+ROWS = (30, 300, 3000)
+
+
+def build_templates(mode: str) -> Jinja2Templates:
+    templates = Jinja2Templates(directory=TEMPLATES_DIRECTORY)
+    if mode == 'uncached':
+        templates.env.cache = None
+    templates.env.auto_reload = mode == 'auto reload'
+    if mode == 'cached':
+        for template_name in templates.env.list_templates():
+            templates.env.get_template(template_name)
+    return templates
+
+
+def build_context(request: Request, rows: int) -> dict[str, tp.Any]:
+    now = dt.datetime.now(dt.timezone.utc)
+    tasks = [
+        TaskSummary(
+            id=uuid.uuid4(),
+            name=f'benchmark.task_{index % 10}',
+            status=TaskStatus.COMPLETED,
+            worker='benchmark',
+            queued_at=now,
+            started_at=now,
+            finished_at=now,
+            execution_time=0.1,
+        )
+        for index in range(rows)
+    ]
+    return {
+        'request': request,
+        'results': [task.model_dump() for task in tasks],
+        'next_cursor': 'cursor',
+        'q': '',
+        'status': 'null',
+        'limit': rows,
+        'sort_by': 'started_at',
+        'sort_order': 'desc',
+        'min_duration': '',
+        'max_duration': '',
+    }
+
+
+def render_ms(templates: Jinja2Templates, template_name: str, context: dict[str, tp.Any], repeat: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        # the template is looked up on every render, like `TemplateResponse` does
+        templates.get_template(template_name).render(context)
+    return (time.perf_counter() - started_at) * 1000 / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='renders of every page per measurement')
+    arguments = parser.parse_args()
+
+    app = get_application()
+    request = Request({'type': 'http', 'app': app, 'router': app.router, 'method': 'GET', 'path': '/', 'headers': []})
+    for template_name in ('home.html', 'partial/task_list.html'):
+        for rows in ROWS:
+            context = build_context(request, rows)
+            timings = []
+            for mode in ('uncached', 'auto reload', 'cached'):
+                timings.append(
+                    f'{mode} {render_ms(build_templates(mode), template_name, context, arguments.repeat):8.2f} ms'
+                )
+            print(f'{template_name:<24} {rows:>5} rows | ' + ' | '.join(timings))  # noqa: T201
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark `TaskRepository.update_task` on a local SQLite file.
+
+Compares the legacy implementation (SELECT, optional placeholder INSERT inside a savepoint, UPDATE)
+with the single `INSERT ... ON CONFLICT DO UPDATE` statement used now.
+
+Usage:
+    uv run python scripts/benchmark_update_task.py --tasks 2000
+"""
+
+import argparse
+import asyncio
+import datetime as dt
+import tempfile
+import time
+import uuid
+from contextlib import suppress
+from pathlib import Path
+
+import sqlalchemy as sa
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from taskiq_dashboard.domain.dto.task import ExecutedTask, QueuedTask, StartedTask
+from taskiq_dashboard.domain.dto.task_status import TaskStatus
+from taskiq_dashboard.infrastructure import SqliteSettings
+from taskiq_dashboard.infrastructure.database.schemas import SqliteTask
+from taskiq_dashboard.infrastructure.database.session_provider import AsyncPostgresSessionProvider
+from taskiq_dashboard.infrastructure.repositories.task import TaskRepository
+from taskiq_dashboard.infrastructure.services.schema_service import SchemaService
+
+
+class LegacyTaskRepository(TaskRepository):
+    async def update_task(
+        self,
+        task_id: uuid.UUID,
+        task_arguments: StartedTask | ExecutedTask,
+    ) -> None:
+        async with self._session_provider.session() as session:
+            await self._legacy_update_task(session, task_id, task_arguments)
+
+    async def _legacy_update_task(
+        self,
+        session: AsyncSession,
+        task_id: uuid.UUID,
+        task_arguments: StartedTask | ExecutedTask,
+    ) -> None:
+        existing_task_query = sa.select(self.task.id).where(self.task.id == task_id)
+        result = await session.execute(existing_task_query)
+        if result.scalar_one_or_none() is None:
+            with suppress(IntegrityError):
+                async with session.begin_nested():
+                    await session.execute(
+                        sa.insert(self.task).values(
+                            id=task_id,
+                            name='unknown',
+                            status=TaskStatus.QUEUED.value,
+                            worker='unknown',
+                            args=[],
+                            kwargs={},
+                            labels={},
+                        )
+                    )
+        update_query = sa.update(self.task).where(self.task.id == task_id)
+        if isinstance(task_arguments, StartedTask):
+            update_query = update_query.values(
+                status=TaskStatus.IN_PROGRESS.value,
+                started_at=task_arguments.started_at,
+                args=task_arguments.args,
+                kwargs=task_arguments.kwargs,
+                labels=task_arguments.labels,
+                name=task_arguments.task_name,
+                worker=task_arguments.worker or '',
+            )
+        else:
+            task_status = TaskStatus.FAILURE if task_arguments.error is not None else TaskStatus.COMPLETED
+            update_query = update_query.values(
+                status=task_status.value,
+                finished_at=task_arguments.finished_at,
+                result=task_arguments.return_value.get('return_value'),
+                error=task_arguments.error,
+            )
+        await session.execute(update_query)
+
+
+def build_events(count: int) -> list[tuple[uuid.UUID, QueuedTask, StartedTask, ExecutedTask]]:
+    now = dt.datetime.now(dt.timezone.utc)
+    events = []
+    for index in range(count):
+        name = f'benchmark.task_{index % 10}'
+        events.append(
+            (
+                uuid.uuid4(),
+                QueuedTask(task_name=name, worker='benchmark', args=[index], kwargs={}, labels={}, queued_at=now),
+                StartedTask(task_name=name, worker='benchmark', args=[index], kwargs={}, labels={}, started_at=now),
+                ExecutedTask(finished_at=now, execution_time=0.1, return_value={'return_value': {'index': index}}),
+            )
+        )
+    return events
+
+
+async def run(repository_class: type[TaskRepository], database: Path, count: int, *, out_of_order: bool) -> float:
+    session_provider = AsyncPostgresSessionProvider(SqliteSettings(dsn=f'sqlite+aiosqlite:///{database}'))
+    await SchemaService(session_provider, table_name='tasks').create_schema()
+    repository = repository_class(session_provider, SqliteTask)
+    events = build_events(count)
+    if not out_of_order:
+        for task_id, queued, _, _ in events:
+            await repository.create_task(task_id, queued)
+
+    started_at = time.perf_counter()
+    for task_id, _, started, executed in events:
+        if out_of_order:
+            await repository.update_task(task_id, executed)
+            await repository.update_task(task_id, started)
+        else:
+            await repository.update_task(task_id, started)
+            await repository.update_task(task_id, executed)
+    elapsed = time.perf_counter() - started_at
+
+    await session_provider.close()
+    return 2 * count / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tasks', type=int, default=2000, help='number of tasks, each produces two update events')
+    arguments = parser.parse_args()
+
+    for out_of_order in (False, True):
+        scenario = 'executed before started' if out_of_order else 'in order'
+        for label, repository_class in (('legacy', LegacyTaskRepository), ('upsert', TaskRepository)):
+            with tempfile.TemporaryDirectory() as directory:
+                rate = await run(
+                    repository_class, Path(directory) / 'benchmark.db', arguments.tasks, out_of_order=out_of_order
+                )
+            print(f'{scenario:<24} {label:<7} {rate:>10.0f} events/sec')  # noqa: T201
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -7,12 +7,24 @@ from dishka.integrations.fastapi import setup_dishka
 from fastapi.staticfiles import StaticFiles
 
 from taskiq_dashboard import dependencies
-from taskiq_dashboard.api.middlewares import AccessTokenMiddleware
-from taskiq_dashboard.api.routers import action_router, event_router, schedule_router, system_router, task_router
+from taskiq_dashboard.api.middlewares import (
+    AccessTokenMiddleware,
+    EventIngestionMiddleware,
+    RequestDecompressionMiddleware,
+)
+from taskiq_dashboard.api.routers import (
+    action_router,
+    event_router,
+    schedule_router,
+    stats_router,
+    system_router,
+    task_router,
+)
 from taskiq_dashboard.api.routers.exception_handlers import exception_handler__not_found
+from taskiq_dashboard.api.templates import configure_templates
 from taskiq_dashboard.domain.dto.task_status import TaskStatus
 from taskiq_dashboard.domain.repositories import AbstractTaskRepository
-from taskiq_dashboard.domain.services import AbstractCleanupService, AbstractSchemaService
+from taskiq_dashboard.domain.services import AbstractCleanupService, AbstractEventWriter, AbstractSchemaService
 from taskiq_dashboard.infrastructure import get_settings
 from taskiq_dashboard.infrastructure.services.cleanup_service import PeriodicCleanupRunner
 
@@ -38,13 +50,19 @@ async def lifespan(app: fastapi.FastAPI) -> tp.AsyncGenerator[None, None]:
     if settings.cleanup.is_enabled and settings.cleanup.is_cleanup_on_startup_enabled:
         await cleanup_service.cleanup()
     cleanup_runner: PeriodicCleanupRunner | None = None
-    if settings.cleanup.is_enabled:
+    is_partitioning_enabled = settings.storage_type == 'postgres' and settings.postgres.is_partitioning_enabled
+    if settings.cleanup.is_enabled or is_partitioning_enabled:
+        # partitions for upcoming days are created on the same schedule as cleanup
         cleanup_runner = PeriodicCleanupRunner(
             cleanup_service=cleanup_service,
             interval_hours=settings.cleanup.periodic_interval_hours,
+            schema_service=schema_service,
         )
         await cleanup_runner.start()
 
+    event_writer = await app.state.dishka_container.get(AbstractEventWriter)
+    await event_writer.start()
+
     if app.state.broker is not None:
         await app.state.broker.startup()
 
@@ -64,11 +82,16 @@ async def lifespan(app: fastapi.FastAPI) -> tp.AsyncGenerator[None, None]:
     if app.state.broker is not None:
         await app.state.broker.shutdown()
 
+    # accepted events are written before the database connections are closed
+    await event_writer.stop()
+
     await app.state.dishka_container.close()
 
 
 def get_application(root_path: str = '') -> fastapi.FastAPI:
     docs_path = '/docs'
+    settings = get_settings()
+    configure_templates(settings.templates)
     app = fastapi.FastAPI(
         title='Taskiq Dashboard',
         summary='Taskiq administration dashboard',
@@ -84,7 +107,12 @@ def get_application(root_path: str = '') -> fastapi.FastAPI:
     app.include_router(router=event_router)
     app.include_router(router=action_router)
     app.include_router(router=schedule_router)
+    app.include_router(router=stats_router)
     app.mount('/static', StaticFiles(directory=pathlib.Path(__file__).parent / 'static'), name='static')
-    app.add_middleware(AccessTokenMiddleware)  # type: ignore[invalid-argument-type]
     setup_dishka(container=dependencies.container, app=app)
+    # the last added middleware runs first: token is checked before bodies are decompressed and events handled
+    if settings.ingestion.is_fast_path_enabled:
+        app.add_middleware(EventIngestionMiddleware)
+    app.add_middleware(RequestDecompressionMiddleware, max_body_size=settings.ingestion.max_decompressed_body_bytes)
+    app.add_middleware(AccessTokenMiddleware, token=settings.api.token.get_secret_value())
     return app
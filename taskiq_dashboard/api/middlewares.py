@@ -1,22 +1,202 @@
-import typing as tp
+import hmac
+import json
+import logging
+import re
+import uuid
 
-from fastapi import HTTPException, Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+import pydantic
+from starlette import status
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from taskiq_dashboard.infrastructure import get_settings
+from taskiq_dashboard.api.routers.event import TaskEventBatch
+from taskiq_dashboard.domain.dto.task import ExecutedTask, QueuedTask, StartedExecutedTask, StartedTask, TaskEventData
+from taskiq_dashboard.domain.services import AbstractEventWriter, EventQueueFullError
+from taskiq_dashboard.infrastructure.compression import (
+    DecompressedSizeError,
+    DecompressionError,
+    UnsupportedEncodingError,
+    decompress,
+)
 
 
-class AccessTokenMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: tp.Callable[[Request], tp.Awaitable[Response]]) -> Response:
-        if not request.url.path.startswith('/api/'):
-            return await call_next(request)
+API_PATH_PREFIX = '/api/'
+EVENT_PATH_PATTERN = re.compile(
+    r'/api/tasks/(?:(?P<task_id>[^/]+)/(?P<event>queued|started|executed|started_executed)|batch)'
+)
+EVENT_MODELS: dict[str, type[TaskEventData]] = {
+    'queued': QueuedTask,
+    'started': StartedTask,
+    'executed': ExecutedTask,
+    'started_executed': StartedExecutedTask,
+}
 
-        token = request.headers.get('access-token')
+logger = logging.getLogger(__name__)
+
+
+def _route_path(scope: Scope) -> str:
+    # path includes the root path when the dashboard is served under a prefix
+    path: str = scope['path']
+    root_path: str = scope.get('root_path', '')
+    if root_path and path.startswith(root_path):
+        return path[len(root_path) :]
+    return path
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            break
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body', False):
+            break
+    return b''.join(chunks)
+
+
+class AccessTokenMiddleware:
+    """
+    Reject requests to API routes (`/api/...`) without the valid `access-token` header.
+
+    Pure ASGI middleware: requests to other routes (pages, htmx fragments, static files) are passed
+    to the application without any extra work, API requests only have their headers scanned.
+    """
+
+    def __init__(self, app: ASGIApp, token: str) -> None:
+        self.app = app
+        self._token = token.encode()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or not _route_path(scope).startswith(API_PATH_PREFIX):
+            await self.app(scope, receive, send)
+            return
+
+        token = next((value for name, value in scope['headers'] if name == b'access-token'), None)
         if not token:
-            raise HTTPException(status_code=401, detail='Missing or invalid Authorization header')
+            response = JSONResponse({'detail': 'Missing or invalid Authorization header'}, status_code=401)
+            await response(scope, receive, send)
+            return
+        if not hmac.compare_digest(token, self._token):
+            response = JSONResponse({'detail': 'Invalid access token'}, status_code=401)
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+class RequestDecompressionMiddleware:
+    """
+    Decompress API request bodies sent with `Content-Encoding: gzip` or `zstd`.
+
+    The body is replaced before routing, so event routes and the ingestion fast path receive plain JSON.
+    Decompressed size is limited, a small compressed body can't expand beyond `max_body_size` bytes.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int) -> None:
+        self.app = app
+        self._max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or not _route_path(scope).startswith(API_PATH_PREFIX):
+            await self.app(scope, receive, send)
+            return
+        encoding = next((value for name, value in scope['headers'] if name == b'content-encoding'), None)
+        if encoding is None or encoding.strip().lower() == b'identity':
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            body = decompress(
+                await _read_body(receive), encoding.strip().lower().decode('latin-1'), self._max_body_size
+            )
+        except UnsupportedEncodingError as error:
+            response = JSONResponse({'detail': str(error)}, status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        except DecompressionError as error:
+            response = JSONResponse({'detail': str(error)}, status_code=status.HTTP_400_BAD_REQUEST)
+        except DecompressedSizeError as error:
+            response = JSONResponse({'detail': str(error)}, status_code=status.HTTP_413_CONTENT_TOO_LARGE)
+        else:
+            headers = [
+                (name, value)
+                for name, value in scope['headers']
+                if name not in {b'content-encoding', b'content-length'}
+            ]
+            headers.append((b'content-length', str(len(body)).encode()))
+            is_body_sent = False
+
+            async def receive_decompressed() -> Message:
+                nonlocal is_body_sent
+                if is_body_sent:
+                    return await receive()
+                is_body_sent = True
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+
+            await self.app({**scope, 'headers': headers}, receive_decompressed, send)
+            return
+        await response(scope, receive, send)
+
+
+class EventIngestionMiddleware:
+    """
+    Receive task events (`POST /api/tasks/{task_id}/{event}` and `POST /api/tasks/batch`) bypassing FastAPI.
+
+    Workers send an event for every task state change, so these requests skip routing, dependency
+    injection scopes and the intermediate `dict` body: the body is parsed and validated into event DTOs
+    in a single pass and handed to the event writer resolved once from the application container.
+    Requests with a malformed task id fall through to the FastAPI routes, which also document the API.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._event_writer: AbstractEventWriter | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['method'] != 'POST':
+            await self.app(scope, receive, send)
+            return
+        match = EVENT_PATH_PATTERN.fullmatch(_route_path(scope))
+        task_id: uuid.UUID | None = None
+        if match is not None and match['task_id'] is not None:
+            try:
+                task_id = uuid.UUID(match['task_id'])
+            except ValueError:
+                match = None
+        if match is None:
+            await self.app(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        try:
+            if task_id is None:
+                batch = TaskEventBatch.model_validate_json(body)
+                events = [(item.task_id, item.data) for item in batch.events]
+            else:
+                events = [(task_id, EVENT_MODELS[match['event']].model_validate_json(body))]
+        except pydantic.ValidationError as error:
+            # serialized by pydantic, input of a malformed body is bytes
+            errors = json.loads(error.json(include_url=False, include_context=False))
+            detail = [{**item, 'loc': ['body', *item['loc']]} for item in errors]
+            response: Response = JSONResponse({'detail': detail}, status_code=status.HTTP_422_UNPROCESSABLE_CONTENT)
+            await response(scope, receive, send)
+            return
+
+        try:
+            await (await self._get_event_writer(scope)).write(events)
+        except EventQueueFullError as error:
+            response = JSONResponse(
+                {'detail': str(error)},
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={'Retry-After': str(error.retry_after_seconds)},
+            )
+        else:
+            if task_id is None:
+                logger.info('Task events batch', extra={'events_count': len(events)})
+            else:
+                logger.info('Task %s event', match['event'], extra={'task_id': task_id})
+            response = Response(status_code=status.HTTP_204_NO_CONTENT)
+        await response(scope, receive, send)
 
-        settings = get_settings()
-        if settings.api.token.get_secret_value() != token:
-            raise HTTPException(status_code=401, detail='Invalid access token')
-        return await call_next(request)
+    async def _get_event_writer(self, scope: Scope) -> AbstractEventWriter:
+        if self._event_writer is None:
+            self._event_writer = await scope['app'].state.dishka_container.get(AbstractEventWriter)
+        return self._event_writer
@@ -3,12 +3,21 @@ import uuid
 from logging import getLogger
 
 import fastapi
+import pydantic
 from dishka.integrations import fastapi as dishka_fastapi
 from fastapi.responses import Response
+from pydantic.alias_generators import to_camel
 from starlette import status
 
-from taskiq_dashboard.domain.dto.task import ExecutedTask, QueuedTask, StartedTask
-from taskiq_dashboard.domain.repositories import AbstractTaskRepository
+from taskiq_dashboard.domain.dto.task import (
+    MAX_EVENT_BATCH_SIZE,
+    ExecutedTask,
+    QueuedTask,
+    StartedExecutedTask,
+    StartedTask,
+    TaskEventData,
+)
+from taskiq_dashboard.domain.services import AbstractEventWriter, EventQueueFullError
 
 
 router = fastapi.APIRouter(
@@ -19,14 +28,55 @@ router = fastapi.APIRouter(
 logger = getLogger(__name__)
 
 
+class _TaskEventBase(pydantic.BaseModel):
+    task_id: uuid.UUID
+
+    model_config = pydantic.ConfigDict(
+        alias_generator=to_camel,
+        validate_by_alias=True,
+        validate_by_name=True,
+    )
+
+
+class QueuedTaskEvent(_TaskEventBase):
+    event: tp.Literal['queued']
+    data: QueuedTask
+
+
+class StartedTaskEvent(_TaskEventBase):
+    event: tp.Literal['started']
+    data: StartedTask
+
+
+class ExecutedTaskEvent(_TaskEventBase):
+    event: tp.Literal['executed']
+    data: ExecutedTask
+
+
+class StartedExecutedTaskEvent(_TaskEventBase):
+    event: tp.Literal['started_executed']
+    data: StartedExecutedTask
+
+
+class TaskEventBatch(pydantic.BaseModel):
+    events: list[
+        tp.Annotated[
+            QueuedTaskEvent | StartedTaskEvent | ExecutedTaskEvent | StartedExecutedTaskEvent,
+            pydantic.Field(discriminator='event'),
+        ]
+    ] = pydantic.Field(max_length=MAX_EVENT_BATCH_SIZE)
+
+
 @router.post(
     '/{task_id}/{event}',
     name='Receive task event',
 )
 async def handle_task_event(
     task_id: uuid.UUID,
-    event: tp.Annotated[tp.Literal['queued', 'started', 'executed'], fastapi.Path(title='Event type')],
-    task_repository: dishka_fastapi.FromDishka[AbstractTaskRepository],
+    event: tp.Annotated[
+        tp.Literal['queued', 'started', 'executed', 'started_executed'], fastapi.Path(title='Event type')
+    ],
+    event_writer: dishka_fastapi.FromDishka[AbstractEventWriter],
     body: tp.Annotated[dict[str, tp.Any], fastapi.Body(title='Event data')],
 ) -> Response:
     """
@@ -34,24 +84,56 @@ async def handle_task_event(
 
     This endpoint receives task events such as 'queued', 'started', and 'executed'
     from the TaskiqAdminMiddleware. It processes the event based on the task ID
-    and event type.
+    and event type. 'started_executed' is sent instead of 'started' and 'executed'
+    for tasks finished within the middleware coalescing window.
 
     Args:
         task_id: The unique identifier of the task.
-        event: The type of event (e.g., 'queued', 'started', 'executed').
+        event: The type of event (e.g., 'queued', 'started', 'executed', 'started_executed').
     """
-    task_arguments: QueuedTask | StartedTask | ExecutedTask
+    task_arguments: TaskEventData
     match event:
         case 'queued':
             task_arguments = QueuedTask.model_validate(body)
-            await task_repository.create_task(task_id, task_arguments)
-            logger.info('Task queued event', extra={'task_id': task_id})
         case 'started':
             task_arguments = StartedTask.model_validate(body)
-            await task_repository.update_task(task_id, task_arguments)
-            logger.info('Task started event', extra={'task_id': task_id})
         case 'executed':
             task_arguments = ExecutedTask.model_validate(body)
-            await task_repository.update_task(task_id, task_arguments)
-            logger.info('Task executed event', extra={'task_id': task_id})
+        case 'started_executed':
+            task_arguments = StartedExecutedTask.model_validate(body)
+    await _write_events(event_writer, [(task_id, task_arguments)])
+    logger.info('Task %s event', event, extra={'task_id': task_id})
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post(
+    '/batch',
+    name='Receive task events batch',
+)
+async def handle_task_events_batch(
+    event_writer: dishka_fastapi.FromDishka[AbstractEventWriter],
+    body: TaskEventBatch,
+) -> Response:
+    """
+    Handle a batch of task events from DashboardMiddleware with enabled batching.
+
+    All events are applied within a single database transaction. Events of one task are applied
+    in the order of task lifecycle (queued, started, executed).
+    """
+    await _write_events(event_writer, [(item.task_id, item.data) for item in body.events])
+    logger.info('Task events batch', extra={'events_count': len(body.events)})
     return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+async def _write_events(
+    event_writer: AbstractEventWriter,
+    events: list[tuple[uuid.UUID, TaskEventData]],
+) -> None:
+    try:
+        await event_writer.write(events)
+    except EventQueueFullError as error:
+        raise fastapi.HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(error),
+            headers={'Retry-After': str(error.retry_after_seconds)},
+        ) from error
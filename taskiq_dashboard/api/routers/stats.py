@@ -0,0 +1,151 @@
+import datetime as dt
+import typing as tp
+
+import fastapi
+import pydantic
+from dishka.integrations import fastapi as dishka_fastapi
+from fastapi.responses import HTMLResponse
+
+from taskiq_dashboard.api.templates import jinja_templates
+from taskiq_dashboard.domain.dto.stats import TaskStatsSummary, TaskTimeseries
+from taskiq_dashboard.domain.repositories import AbstractStatsRepository
+
+
+router = fastapi.APIRouter(
+    prefix='/stats',
+    tags=['Stats'],
+    route_class=dishka_fastapi.DishkaRoute,
+)
+
+PERIODS: dict[str, dt.timedelta] = {
+    '1h': dt.timedelta(hours=1),
+    '24h': dt.timedelta(days=1),
+    '7d': dt.timedelta(days=7),
+}
+TIMESERIES_INTERVALS: dict[str, dt.timedelta] = {
+    '1h': dt.timedelta(minutes=1),
+    '24h': dt.timedelta(minutes=15),
+    '7d': dt.timedelta(hours=1),
+}
+
+
+class StatsFilter(pydantic.BaseModel):
+    period: tp.Literal['1h', '24h', '7d'] = '1h'
+    name: str | None = None
+
+    model_config = pydantic.ConfigDict(
+        extra='ignore',
+    )
+
+
+class TimeseriesFilter(StatsFilter):
+    worker: str | None = None
+
+
+async def _get_stats_summary(repository: AbstractStatsRepository, query: StatsFilter) -> TaskStatsSummary:
+    until = dt.datetime.now(dt.timezone.utc)
+    since = until - PERIODS[query.period]
+    tasks = await repository.get_task_stats(since=since, until=until, name=query.name or None)
+    return TaskStatsSummary(since=since, until=until, tasks=tasks)
+
+
+@router.get(
+    '/',
+    name='Task stats view',
+    response_class=HTMLResponse,
+)
+async def stats_page(
+    request: fastapi.Request,
+    repository: dishka_fastapi.FromDishka[AbstractStatsRepository],
+    query: tp.Annotated[StatsFilter, fastapi.Query(...)],
+) -> HTMLResponse:
+    summary = await _get_stats_summary(repository, query)
+    return jinja_templates.TemplateResponse(
+        request,
+        'stats_page.html',
+        {
+            'request': request,
+            'summary': summary,
+            'periods': list(PERIODS),
+            **query.model_dump(),
+        },
+    )
+
+
+@router.get(
+    '/summary',
+    name='Task stats summary',
+)
+async def stats_summary(
+    repository: dishka_fastapi.FromDishka[AbstractStatsRepository],
+    query: tp.Annotated[StatsFilter, fastapi.Query(...)],
+) -> TaskStatsSummary:
+    """
+    Per task name counters and execution durations over the period, read from ingestion rollups.
+    """
+    return await _get_stats_summary(repository, query)
+
+
+async def _get_timeseries(repository: AbstractStatsRepository, query: TimeseriesFilter) -> TaskTimeseries:
+    until = dt.datetime.now(dt.timezone.utc)
+    since = until - PERIODS[query.period]
+    interval = TIMESERIES_INTERVALS[query.period]
+    points = await repository.get_task_timeseries(
+        since=since,
+        until=until,
+        interval=interval,
+        name=query.name or None,
+        worker=query.worker or None,
+    )
+    return TaskTimeseries(
+        since=since,
+        until=until,
+        interval_seconds=int(interval.total_seconds()),
+        points=points,
+    )
+
+
+@router.get(
+    '/timeseries',
+    name='Task stats timeseries',
+)
+async def stats_timeseries(
+    repository: dishka_fastapi.FromDishka[AbstractStatsRepository],
+    query: tp.Annotated[TimeseriesFilter, fastapi.Query(...)],
+) -> TaskTimeseries:
+    """
+    Queued, started, completed and failed tasks per time bucket over the period.
+
+    Buckets are one minute for the last hour, 15 minutes for the last day and one hour for the last week.
+    """
+    return await _get_timeseries(repository, query)
+
+
+@router.get(
+    '/timeseries/chart',
+    name='Task stats timeseries chart',
+    response_class=HTMLResponse,
+)
+async def stats_timeseries_chart(
+    request: fastapi.Request,
+    repository: dishka_fastapi.FromDishka[AbstractStatsRepository],
+    query: tp.Annotated[TimeseriesFilter, fastapi.Query(...)],
+) -> HTMLResponse:
+    timeseries = await _get_timeseries(repository, query)
+    return jinja_templates.TemplateResponse(
+        request,
+        'partial/timeseries_chart.html',
+        {
+            'request': request,
+            'timeseries': timeseries,
+            'max_count': max(
+                (
+                    max(point.queued_count, point.started_count, point.completed_count + point.failed_count)
+                    for point in timeseries.points
+                ),
+                default=0,
+            ),
+            'periods': list(PERIODS),
+            **query.model_dump(),
+        },
+    )
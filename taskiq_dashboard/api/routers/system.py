@@ -2,6 +2,9 @@ import fastapi
 from dishka.integrations import fastapi as dishka_fastapi
 from pydantic import BaseModel
 
+from taskiq_dashboard.domain.dto.ingestion import IngestionMetrics
+from taskiq_dashboard.domain.services import AbstractEventWriter
+
 
 router = fastapi.APIRouter(tags=['System'], route_class=dishka_fastapi.DishkaRoute)
 
@@ -26,3 +29,10 @@ async def get_readiness() -> HealthCheckResponse:
         status='ready',
         app_name='taskiq dashboard',
     )
+
+
+@router.get('/api/metrics/ingestion', name='Ingestion metrics', summary='Counters of received task events')
+async def get_ingestion_metrics(
+    event_writer: dishka_fastapi.FromDishka[AbstractEventWriter],
+) -> IngestionMetrics:
+    return event_writer.metrics()
@@ -1,3 +1,6 @@
+import asyncio
+import csv
+import io
 import json
 import typing as tp
 import uuid
@@ -6,13 +9,24 @@ from urllib.parse import urlencode
 import fastapi
 import pydantic
 from dishka.integrations import fastapi as dishka_fastapi
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 
 from taskiq_dashboard.api.templates import jinja_templates
+from taskiq_dashboard.domain.dto.task import Task, TaskCursor, TaskSummary
 from taskiq_dashboard.domain.dto.task_status import TaskStatus
 from taskiq_dashboard.domain.repositories import AbstractTaskRepository
+from taskiq_dashboard.domain.services import AbstractTaskBroadcaster
 
 
+STREAM_KEEPALIVE_SECONDS = 15
+MIN_SEARCH_LENGTH = 2
+# tasks serialized before a chunk of the export is sent
+EXPORT_CHUNK_SIZE = 500
+EXPORT_MEDIA_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
 router = fastapi.APIRouter(
     prefix='',
     tags=['Tasks'],
@@ -25,8 +39,11 @@ class TaskFilter(pydantic.BaseModel):
     status: TaskStatus | None = None
     limit: int = 30
     offset: int = 0
-    sort_by: tp.Literal['started_at', 'finished_at'] = 'started_at'
+    cursor: str | None = None
+    sort_by: tp.Literal['started_at', 'finished_at', 'execution_time'] = 'started_at'
     sort_order: tp.Literal['asc', 'desc'] = 'desc'
+    min_duration: float | None = pydantic.Field(default=None, ge=0)
+    max_duration: float | None = pydantic.Field(default=None, ge=0)
 
     @pydantic.field_validator('status', mode='before')
     @classmethod
@@ -38,6 +55,35 @@ class TaskFilter(pydantic.BaseModel):
             return None
         return value  # ty: ignore[invalid-return-type]
 
+    @pydantic.field_validator('cursor', mode='after')
+    @classmethod
+    def validate_cursor(
+        cls,
+        value: str | None,
+    ) -> str | None:
+        if not value:
+            return None
+        TaskCursor.decode(value)
+        return value
+
+    @pydantic.field_validator('min_duration', 'max_duration', mode='before')
+    @classmethod
+    def validate_duration(
+        cls,
+        value: float | str | None,
+    ) -> float | str | None:
+        if isinstance(value, str) and not value.strip():
+            return None
+        return value
+
+    @pydantic.field_serializer('min_duration', 'max_duration', mode='plain')
+    def serialize_duration(
+        self,
+        value: float | None,
+    ) -> float | str:
+        # empty string keeps the url and the filter inputs blank
+        return '' if value is None else value
+
     @pydantic.field_serializer('status', mode='plain')
     def serialize_status(
         self,
@@ -47,11 +93,31 @@ class TaskFilter(pydantic.BaseModel):
             return 'null'
         return str(value.value)
 
+    def matches(self, task: TaskSummary) -> bool:
+        """Check that task would be shown in the task list filtered by this query."""
+        if self.status is not None and task.status != self.status:
+            return False
+        if self.min_duration is not None or self.max_duration is not None or self.sort_by == 'execution_time':
+            if task.execution_time is None:
+                return False
+            if self.min_duration is not None and task.execution_time < self.min_duration:
+                return False
+            if self.max_duration is not None and task.execution_time > self.max_duration:
+                return False
+        search = self.q.strip().lower()
+        if len(search) < MIN_SEARCH_LENGTH:
+            return True
+        return search in task.name.lower() or task.id.hex.startswith(search.replace('-', ''))
+
     model_config = pydantic.ConfigDict(
         extra='ignore',
     )
 
 
+class TaskExportFilter(TaskFilter):
+    format: tp.Literal['ndjson', 'csv'] = 'ndjson'
+
+
 @router.get(
     '/',
     name='Task list view',
@@ -68,14 +134,21 @@ async def search_tasks(
         status=query.status,
         limit=query.limit,
         offset=query.offset,
+        cursor=TaskCursor.decode(query.cursor) if query.cursor else None,
         sort_by=query.sort_by,
         sort_order=query.sort_order,
+        min_duration=query.min_duration,
+        max_duration=query.max_duration,
     )
+    next_cursor = None
+    if len(tasks) >= query.limit:
+        last_task = tasks[-1]
+        next_cursor = TaskCursor(sort_value=getattr(last_task, query.sort_by), task_id=last_task.id).encode()
     headers: dict[str, str] = {}
     template_name = 'home.html'
     if hx_request:
         headers = {
-            'HX-Push-Url': '/?' + urlencode(query.model_dump(exclude={'limit', 'offset'})),
+            'HX-Push-Url': '/?' + urlencode(query.model_dump(exclude={'limit', 'offset', 'cursor'})),
         }
         template_name = 'partial/task_list.html'
     return jinja_templates.TemplateResponse(
@@ -84,12 +157,100 @@ async def search_tasks(
         {
             'request': request,
             'results': [task.model_dump() for task in tasks],
+            'next_cursor': next_cursor,
             **query.model_dump(),
         },
         headers=headers,
     )
 
 
+@router.get(
+    '/tasks/stream',
+    name='Task stream',
+    response_class=StreamingResponse,
+)
+async def stream_tasks(
+    request: fastapi.Request,
+    task_broadcaster: dishka_fastapi.FromDishka[AbstractTaskBroadcaster],
+    query: tp.Annotated[TaskFilter, fastapi.Query(...)],
+) -> StreamingResponse:
+    """
+    Stream rows of changed tasks matching the filter as server-sent events.
+    """
+    template = jinja_templates.get_template('partial/task_list_item.html')
+
+    async def events() -> tp.AsyncGenerator[str, None]:
+        async with task_broadcaster.subscribe() as tasks:
+            while not await request.is_disconnected():
+                try:
+                    task = await asyncio.wait_for(anext(tasks), timeout=STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ': keepalive\n\n'
+                    continue
+                if not query.matches(task):
+                    continue
+                row = template.render(request=request, task=task.model_dump())
+                yield 'event: task\n' + ''.join(f'data: {line}\n' for line in row.splitlines()) + '\n'
+
+    return StreamingResponse(
+        events(),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+@router.get(
+    '/tasks/export',
+    name='Task export',
+    response_class=StreamingResponse,
+)
+async def export_tasks(
+    repository: dishka_fastapi.FromDishka[AbstractTaskRepository],
+    query: tp.Annotated[TaskExportFilter, fastapi.Query(...)],
+) -> StreamingResponse:
+    """
+    Stream all tasks matching the filter as NDJSON or CSV, pagination parameters are ignored.
+    """
+    tasks = repository.stream_tasks(
+        name=query.q,
+        status=query.status,
+        sort_by=query.sort_by,
+        sort_order=query.sort_order,
+        min_duration=query.min_duration,
+        max_duration=query.max_duration,
+    )
+    return StreamingResponse(
+        _serialize_tasks(tasks, query.format),
+        media_type=EXPORT_MEDIA_TYPES[query.format],
+        headers={'Content-Disposition': f'attachment; filename="tasks.{query.format}"'},
+    )
+
+
+async def _serialize_tasks(
+    tasks: tp.AsyncIterator[Task],
+    export_format: tp.Literal['ndjson', 'csv'],
+) -> tp.AsyncGenerator[str, None]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if export_format == 'csv':
+        writer.writerow(Task.model_fields)
+    count = 0
+    async for task in tasks:
+        if export_format == 'ndjson':
+            buffer.write(task.model_dump_json() + '\n')
+        else:
+            writer.writerow(
+                json.dumps(value, ensure_ascii=False) if isinstance(value, dict | list) else value
+                for value in task.model_dump(mode='json').values()
+            )
+        count += 1
+        if count % EXPORT_CHUNK_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
 @router.get(
     '/tasks/{task_id:uuid}',
     name='Task details view',
@@ -115,7 +276,7 @@ async def task_details(
             status_code=404,
         )
     result_json = None
-    if task.result:
+    if task.result is not None:
         result_json = json.dumps(task.result, indent=2, ensure_ascii=False)
     return jinja_templates.TemplateResponse(
         request,
@@ -2,6 +2,21 @@ import pathlib
 
 from fastapi.templating import Jinja2Templates
 
+from taskiq_dashboard.infrastructure.settings import TemplateSettings
+
 
 jinja_templates = Jinja2Templates(directory=pathlib.Path(__file__).parent / 'templates')
-jinja_templates.env.cache = None
+
+
+def configure_templates(settings: TemplateSettings) -> None:
+    """
+    Configure caching of compiled templates.
+
+    Compiled templates are kept in the environment cache, so pages and htmx fragments are not parsed
+    again on every response. With auto reload enabled every render checks template files for changes
+    and recompiles changed ones, otherwise all templates can be compiled once at startup.
+    """
+    jinja_templates.env.auto_reload = settings.is_auto_reload_enabled
+    if settings.is_precompile_enabled and not settings.is_auto_reload_enabled:
+        for template_name in jinja_templates.env.list_templates():
+            jinja_templates.env.get_template(template_name)
@@ -0,0 +1,39 @@
+(function () {
+    const tbody = document.getElementById("task-list-body");
+    let source = null;
+    let streamQuery = null;
+
+    // new tasks are shown on top only when the list is ordered by the newest first
+    function isNewestFirst(params) {
+        return (params.get("sort_by") || "started_at") === "started_at" && (params.get("sort_order") || "desc") === "desc";
+    }
+
+    function connect() {
+        const params = new URLSearchParams(window.location.search);
+        ["limit", "offset", "cursor"].forEach((name) => params.delete(name));
+        if (source && params.toString() === streamQuery) return;
+        if (source) source.close();
+        streamQuery = params.toString();
+        source = new EventSource("{{ url_for('Task stream') }}?" + streamQuery);
+        source.addEventListener("task", (event) => {
+            const template = document.createElement("template");
+            template.innerHTML = event.data.trim();
+            const row = template.content.firstElementChild;
+            if (!row) return;
+            const existingRow = document.getElementById(row.id);
+            if (existingRow) {
+                const checkbox = existingRow.querySelector(".task-checkbox");
+                if (checkbox && checkbox.checked) row.querySelector(".task-checkbox").checked = true;
+                existingRow.replaceWith(row);
+            } else if (isNewestFirst(params)) {
+                const emptyRow = document.getElementById("task-list-empty");
+                if (emptyRow) emptyRow.remove();
+                tbody.prepend(row);
+            }
+        });
+    }
+
+    connect();
+    // search and status filters change the url, the stream must follow them
+    document.body.addEventListener("htmx:pushedIntoHistory", connect);
+})();
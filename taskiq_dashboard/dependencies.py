@@ -1,14 +1,31 @@
+import datetime as dt
 import typing as tp
 
 from dishka import Provider, Scope, make_async_container, provide
 
-from taskiq_dashboard.domain.repositories import AbstractTaskRepository
-from taskiq_dashboard.domain.services import AbstractCleanupService, AbstractSchemaService
+from taskiq_dashboard.domain.repositories import AbstractStatsRepository, AbstractTaskRepository
+from taskiq_dashboard.domain.services import (
+    AbstractCleanupService,
+    AbstractEventWriter,
+    AbstractSchemaService,
+    AbstractTaskBroadcaster,
+)
 from taskiq_dashboard.infrastructure import Settings, get_settings
-from taskiq_dashboard.infrastructure.database.schemas import PostgresTask, SqliteTask
+from taskiq_dashboard.infrastructure.database.schemas import (
+    PostgresTask,
+    PostgresTaskStats,
+    SqliteTask,
+    SqliteTaskStats,
+)
 from taskiq_dashboard.infrastructure.database.session_provider import AsyncPostgresSessionProvider
-from taskiq_dashboard.infrastructure.repositories import TaskRepository
-from taskiq_dashboard.infrastructure.services import CleanupService, SchemaService
+from taskiq_dashboard.infrastructure.repositories import StatsRepository, TaskRepository, TimeseriesCache
+from taskiq_dashboard.infrastructure.services import (
+    CleanupService,
+    DirectEventWriter,
+    InMemoryTaskBroadcaster,
+    SchemaService,
+    WriteBehindEventWriter,
+)
 
 
 class TaskiqDashboardProvider(Provider):
@@ -30,15 +47,34 @@ class TaskiqDashboardProvider(Provider):
         yield session_provider
         await session_provider.close()
 
+    @provide
+    def provide_timeseries_cache(self) -> TimeseriesCache:
+        return TimeseriesCache()
+
     @provide
     def provide_task_service(
         self,
         settings: Settings,
         session_provider: AsyncPostgresSessionProvider,
+        timeseries_cache: TimeseriesCache,
     ) -> AbstractTaskRepository:
         return TaskRepository(
             session_provider=session_provider,
             task_model=PostgresTask if settings.storage_type == 'postgres' else SqliteTask,
+            timeseries_cache=timeseries_cache,
+        )
+
+    @provide
+    def provide_stats_repository(
+        self,
+        settings: Settings,
+        session_provider: AsyncPostgresSessionProvider,
+        timeseries_cache: TimeseriesCache,
+    ) -> AbstractStatsRepository:
+        return StatsRepository(
+            session_provider=session_provider,
+            stats_model=PostgresTaskStats if settings.storage_type == 'postgres' else SqliteTaskStats,
+            timeseries_cache=timeseries_cache,
         )
 
     @provide
@@ -47,9 +83,14 @@ class TaskiqDashboardProvider(Provider):
         settings: Settings,
         session_provider: AsyncPostgresSessionProvider,
     ) -> AbstractSchemaService:
+        is_partitioning_enabled = settings.storage_type == 'postgres' and settings.postgres.is_partitioning_enabled
         return SchemaService(
             session_provider=session_provider,
             table_name='taskiq_dashboard__tasks' if settings.storage_type == 'postgres' else 'tasks',
+            partition_interval=(
+                dt.timedelta(days=settings.postgres.partition_interval_days) if is_partitioning_enabled else None
+            ),
+            premade_partitions_count=settings.postgres.premade_partitions_count,
         )
 
     @provide
@@ -64,6 +105,28 @@ class TaskiqDashboardProvider(Provider):
             settings=settings.cleanup,
         )
 
+    @provide
+    def provide_task_broadcaster(self) -> AbstractTaskBroadcaster:
+        return InMemoryTaskBroadcaster()
+
+    @provide
+    def provide_event_writer(
+        self,
+        settings: Settings,
+        task_repository: AbstractTaskRepository,
+        task_broadcaster: AbstractTaskBroadcaster,
+    ) -> AbstractEventWriter:
+        if settings.ingestion.is_write_behind_enabled:
+            return WriteBehindEventWriter(
+                task_repository=task_repository,
+                task_broadcaster=task_broadcaster,
+                settings=settings.ingestion,
+            )
+        return DirectEventWriter(
+            task_repository=task_repository,
+            task_broadcaster=task_broadcaster,
+        )
+
 
 container = make_async_container(
     TaskiqDashboardProvider(),
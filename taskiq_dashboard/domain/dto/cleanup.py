@@ -5,3 +5,4 @@ from dataclasses import dataclass
 class CleanupResult:
     deleted_by_ttl: int = 0
     deleted_by_count: int = 0
+    batches_count: int = 0
@@ -0,0 +1,20 @@
+import pydantic
+
+
+class IngestionMetrics(pydantic.BaseModel):
+    """Counters of received task events and state of the write-behind queue."""
+
+    is_write_behind_enabled: bool
+
+    queue_depth: int = 0
+    queue_capacity: int = 0
+
+    accepted_count: int = 0
+    rejected_count: int = 0
+    written_count: int = 0
+    dropped_count: int = 0
+
+    flush_count: int = 0
+    failed_flush_count: int = 0
+    last_flush_seconds: float | None = None
+    max_flush_seconds: float | None = None
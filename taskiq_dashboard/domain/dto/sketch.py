@@ -0,0 +1,61 @@
+import math
+
+import pydantic
+
+
+# quantiles are returned within 1% of the exact value
+RELATIVE_ACCURACY = 0.01
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+# shorter durations are counted as this one, keeps the number of bins bounded
+MIN_TRACKED_SECONDS = 0.0001
+
+
+class LatencySketch(pydantic.BaseModel):
+    """
+    Mergeable quantile sketch of durations in seconds (DDSketch with logarithmic bins).
+
+    A value is counted in the bin `ceil(log(value, GAMMA))`, so every quantile is answered with
+    relative error below `RELATIVE_ACCURACY`. Sketches are merged by adding counts of the same bins,
+    which lets the database merge them per time bucket and over any period.
+    """
+
+    bins: dict[int, int] = pydantic.Field(default_factory=dict)
+
+    @staticmethod
+    def bin_index(value: float) -> int:
+        return math.ceil(math.log(max(value, MIN_TRACKED_SECONDS), GAMMA))
+
+    @staticmethod
+    def bin_value(index: int) -> float:
+        """Value representing the bin, relative error to any value of the bin is at most `RELATIVE_ACCURACY`."""
+        return 2 * GAMMA**index / (GAMMA + 1)
+
+    @property
+    def count(self) -> int:
+        return sum(self.bins.values())
+
+    def add(self, value: float) -> None:
+        index = self.bin_index(value)
+        self.bins[index] = self.bins.get(index, 0) + 1
+
+    def merge(self, other: 'LatencySketch') -> None:
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+
+    def quantile(self, quantile: float) -> float | None:
+        """
+        Estimate the value below which the given fraction (0..1) of the values lies.
+
+        Returns:
+            Estimated value or None for an empty sketch.
+        """
+        total = self.count
+        if not total:
+            return None
+        rank = quantile * (total - 1)
+        seen = 0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if seen > rank:
+                return self.bin_value(index)
+        return self.bin_value(max(self.bins))
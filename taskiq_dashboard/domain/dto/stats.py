@@ -0,0 +1,70 @@
+import datetime as dt
+
+import pydantic
+
+
+class TaskStats(pydantic.BaseModel):
+    """Counters of task events, execution durations and queue wait times for one task name over a period."""
+
+    name: str
+
+    queued_count: int = 0
+    started_count: int = 0
+    completed_count: int = 0
+    failed_count: int = 0
+
+    duration_sum: float = 0.0
+    duration_min: float | None = None
+    duration_max: float | None = None
+    duration_p50: float | None = None
+    duration_p95: float | None = None
+    duration_p99: float | None = None
+
+    # time from queued to started
+    wait_p50: float | None = None
+    wait_p95: float | None = None
+    wait_p99: float | None = None
+
+    model_config = pydantic.ConfigDict(
+        from_attributes=True,
+    )
+
+    @pydantic.computed_field
+    @property
+    def duration_avg(self) -> float | None:
+        finished_count = self.completed_count + self.failed_count
+        if not finished_count:
+            return None
+        return self.duration_sum / finished_count
+
+
+class TaskStatsSummary(pydantic.BaseModel):
+    since: dt.datetime
+    until: dt.datetime
+    tasks: list[TaskStats]
+
+
+class TaskTimeseriesPoint(pydantic.BaseModel):
+    """Counters of task events in one time bucket."""
+
+    bucket: dt.datetime
+
+    queued_count: int = 0
+    started_count: int = 0
+    completed_count: int = 0
+    failed_count: int = 0
+
+    @pydantic.computed_field
+    @property
+    def failure_rate(self) -> float | None:
+        finished_count = self.completed_count + self.failed_count
+        if not finished_count:
+            return None
+        return self.failed_count / finished_count
+
+
+class TaskTimeseries(pydantic.BaseModel):
+    since: dt.datetime
+    until: dt.datetime
+    interval_seconds: int
+    points: list[TaskTimeseriesPoint]
@@ -1,3 +1,4 @@
+import base64
 import datetime
 import typing as tp
 import uuid
@@ -8,29 +9,93 @@ from pydantic.alias_generators import to_camel
 from taskiq_dashboard.domain.dto import task_status
 
 
-class Task(pydantic.BaseModel):
+TRUNCATED_VALUE_KEY = '__taskiq_dashboard_truncated__'
+
+
+class TruncatedValue(pydantic.BaseModel):
+    """
+    Placeholder sent by `DashboardMiddleware` instead of a payload value exceeding the configured size limit.
+
+    Sent as `{TRUNCATED_VALUE_KEY: {...}}` in place of keyword arguments and return value,
+    and as a single item list in place of positional arguments.
+    """
+
+    preview: str
+    size: int
+    sha256: str
+
+    def to_payload(self) -> dict[str, tp.Any]:
+        return {TRUNCATED_VALUE_KEY: self.model_dump()}
+
+    @classmethod
+    def from_payload(cls, value: tp.Any) -> 'TruncatedValue | None':
+        """Restore placeholder from a stored payload value, returns None for regular values."""
+        if isinstance(value, list) and len(value) == 1:
+            value = value[0]
+        if not isinstance(value, dict) or len(value) != 1 or TRUNCATED_VALUE_KEY not in value:
+            return None
+        try:
+            return cls.model_validate(value[TRUNCATED_VALUE_KEY])
+        except pydantic.ValidationError:
+            return None
+
+
+class TaskSummary(pydantic.BaseModel):
+    """Task without its payload (arguments, labels, result and error), enough to render the task list."""
+
     id: uuid.UUID
     name: str
     status: task_status.TaskStatus
 
     worker: str
 
-    args: list[tp.Any] = pydantic.Field(default_factory=list)
-    kwargs: dict[str, tp.Any] = pydantic.Field(default_factory=dict)
-    labels: dict[str, tp.Any] = pydantic.Field(default_factory=dict)
-
-    result: dict | list | pydantic.Json | None = None
-    error: str | None = None
-
     queued_at: datetime.datetime | None = None
     started_at: datetime.datetime | None = None
     finished_at: datetime.datetime | None = None
+    execution_time: float | None = None
 
     model_config = pydantic.ConfigDict(
         from_attributes=True,
     )
 
 
+class Task(TaskSummary):
+    args: list[tp.Any] = pydantic.Field(default_factory=list)
+    kwargs: dict[str, tp.Any] = pydantic.Field(default_factory=dict)
+    labels: dict[str, tp.Any] = pydantic.Field(default_factory=dict)
+
+    # return value of the task, any JSON value including scalars
+    result: tp.Any = None
+    error: str | None = None
+
+    @property
+    def truncated_fields(self) -> dict[str, TruncatedValue]:
+        """Payload fields replaced by `DashboardMiddleware` because they exceeded the size limit."""
+        fields = {'args': self.args, 'kwargs': self.kwargs, 'result': self.result}
+        truncated_fields = {name: TruncatedValue.from_payload(value) for name, value in fields.items()}
+        return {name: value for name, value in truncated_fields.items() if value is not None}
+
+
+class TaskCursor(pydantic.BaseModel):
+    """Position of the last seen task in a sorted task list, used for keyset pagination."""
+
+    sort_value: datetime.datetime | float | None = None
+    task_id: uuid.UUID
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+    @classmethod
+    def decode(cls, value: str) -> 'TaskCursor':
+        """
+        Restore cursor from its string representation.
+
+        Raises:
+            ValueError: if the value is not a valid cursor.
+        """
+        return cls.model_validate_json(base64.urlsafe_b64decode(value.encode()))
+
+
 class QueuedTask(pydantic.BaseModel):
     args: list[tp.Any] = pydantic.Field(default_factory=list)
     kwargs: dict[str, tp.Any] = pydantic.Field(default_factory=dict)
@@ -66,9 +131,48 @@ class ExecutedTask(pydantic.BaseModel):
     execution_time: float
     error: str | None = None
     return_value: dict[str, tp.Any] = pydantic.Field(default_factory=dict)
+    # names the task if this event arrives before the others, not sent by older middleware versions
+    task_name: str | None = None
+
+    model_config = pydantic.ConfigDict(
+        alias_generator=to_camel,
+        validate_by_alias=True,
+        validate_by_name=True,
+    )
+
+
+class StartedExecutedTask(pydantic.BaseModel):
+    """
+    Started and executed events of one task merged by `DashboardMiddleware` into a single event.
+
+    Sent for tasks finished within the coalescing window before their started event was sent,
+    applied by the dashboard with one write instead of two.
+    """
+
+    args: list[tp.Any] = pydantic.Field(default_factory=list)
+    kwargs: dict[str, tp.Any] = pydantic.Field(default_factory=dict)
+    labels: dict[str, tp.Any] = pydantic.Field(default_factory=dict)
+    task_name: str
+    worker: str
+    started_at: datetime.datetime
+    finished_at: datetime.datetime
+    execution_time: float
+    error: str | None = None
+    return_value: dict[str, tp.Any] = pydantic.Field(default_factory=dict)
 
     model_config = pydantic.ConfigDict(
         alias_generator=to_camel,
         validate_by_alias=True,
         validate_by_name=True,
     )
+
+    def started(self) -> StartedTask:
+        return StartedTask.model_validate(self.model_dump(include=set(StartedTask.model_fields)))
+
+    def executed(self) -> ExecutedTask:
+        return ExecutedTask.model_validate(self.model_dump(include=set(ExecutedTask.model_fields)))
+
+
+TaskEventData: tp.TypeAlias = QueuedTask | StartedTask | ExecutedTask | StartedExecutedTask
+# most events accepted in one batch request, larger batches are split by `DashboardMiddleware`
+MAX_EVENT_BATCH_SIZE = 1000
@@ -1,6 +1,8 @@
+from taskiq_dashboard.domain.repositories.stats import AbstractStatsRepository
 from taskiq_dashboard.domain.repositories.task import AbstractTaskRepository
 
 
 __all__ = [
+    'AbstractStatsRepository',
     'AbstractTaskRepository',
 ]
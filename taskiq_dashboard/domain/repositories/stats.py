@@ -0,0 +1,57 @@
+import datetime as dt
+from abc import ABC, abstractmethod
+
+from taskiq_dashboard.domain.dto.stats import TaskStats, TaskTimeseriesPoint
+
+
+class AbstractStatsRepository(ABC):
+    @abstractmethod
+    async def get_task_stats(
+        self,
+        since: dt.datetime,
+        until: dt.datetime,
+        name: str | None = None,
+    ) -> list[TaskStats]:
+        """
+        Retrieve per task name statistics aggregated over a period.
+
+        Statistics are read from rollups maintained on ingestion, so the cost depends on the period length
+        and number of task names, not on the number of stored tasks. Rollups outlive cleanup of tasks.
+
+        Args:
+            since: Start of the period (inclusive), truncated to the rollup bucket
+            until: End of the period (exclusive)
+            name: Return statistics only for this task name
+
+        Returns:
+            List of statistics ordered by task name.
+        """
+        ...
+
+    @abstractmethod
+    async def get_task_timeseries(
+        self,
+        since: dt.datetime,
+        until: dt.datetime,
+        interval: dt.timedelta,
+        name: str | None = None,
+        worker: str | None = None,
+    ) -> list[TaskTimeseriesPoint]:
+        """
+        Retrieve counters of task events per time bucket.
+
+        Buckets are aligned to multiples of the interval since the Unix epoch, buckets without events
+        are returned with zero counters. Without worker filter counters are read from rollups maintained
+        on ingestion, with it they are counted over stored tasks.
+
+        Args:
+            since: Start of the period (inclusive), truncated to the bucket
+            until: End of the period (exclusive)
+            interval: Bucket size, a whole number of minutes
+            name: Count only tasks with this name
+            worker: Count only tasks executed by this worker
+
+        Returns:
+            List of buckets ordered by time.
+        """
+        ...
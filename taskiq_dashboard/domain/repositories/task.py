@@ -2,34 +2,71 @@ import typing as tp
 import uuid
 from abc import ABC, abstractmethod
 
-from taskiq_dashboard.domain.dto.task import ExecutedTask, QueuedTask, StartedTask, Task
+from taskiq_dashboard.domain.dto.task import (
+    ExecutedTask,
+    QueuedTask,
+    StartedTask,
+    Task,
+    TaskCursor,
+    TaskEventData,
+    TaskSummary,
+)
 from taskiq_dashboard.domain.dto.task_status import TaskStatus
 
 
 class AbstractTaskRepository(ABC):
     @abstractmethod
-    async def find_tasks(  # noqa: PLR0913
+    async def find_tasks(  # noqa: PLR0913, PLR0917
         self,
         name: str | None = None,
         status: TaskStatus | None = None,
-        sort_by: tp.Literal['started_at', 'finished_at'] | None = None,
+        sort_by: tp.Literal['started_at', 'finished_at', 'execution_time'] | None = None,
         sort_order: tp.Literal['asc', 'desc'] = 'desc',
         limit: int = 30,
         offset: int = 0,
-    ) -> list[Task]:
+        cursor: TaskCursor | None = None,
+        min_duration: float | None = None,
+        max_duration: float | None = None,
+    ) -> list[TaskSummary]:
         """
-        Retrieve tasks with pagination and filtering.
+        Retrieve task summaries with pagination and filtering.
+
+        Tasks are ordered by the sort column and then by id, so `cursor` built from the last task
+        of a page points to the first task of the next page. Sorting by execution time and duration filters
+        skip tasks without execution time (not finished yet).
 
         Args:
             status: Filter by task status
             name: Filter by task name (fuzzy search)
-            sort_by: Column to sort by ('started_at' or 'finished_at')
+            sort_by: Column to sort by ('started_at', 'finished_at' or 'execution_time')
             sort_order: Sort order ('asc' or 'desc')
             limit: Number of tasks to retrieve
             offset: Number of tasks to skip
+            cursor: Return only tasks after this position (keyset pagination)
+            min_duration: Return only tasks executed at least this number of seconds
+            max_duration: Return only tasks executed at most this number of seconds
 
         Returns:
-            List of tasks matching the criteria.
+            List of tasks matching the criteria, without payload columns.
+        """
+        ...
+
+    @abstractmethod
+    def stream_tasks(  # noqa: PLR0913, PLR0917
+        self,
+        name: str | None = None,
+        status: TaskStatus | None = None,
+        sort_by: tp.Literal['started_at', 'finished_at', 'execution_time'] | None = None,
+        sort_order: tp.Literal['asc', 'desc'] = 'desc',
+        min_duration: float | None = None,
+        max_duration: float | None = None,
+    ) -> tp.AsyncIterator[Task]:
+        """
+        Iterate over all tasks matching the filters, including payload columns.
+
+        Filters and ordering are the same as in `find_tasks`. Rows are fetched from the database
+        in batches while iterating, so memory use does not depend on the number of matching tasks.
+        The database session stays open until the iteration ends.
         """
         ...
 
@@ -43,14 +80,34 @@ class AbstractTaskRepository(ABC):
         self,
         task_id: uuid.UUID,
         task_arguments: QueuedTask,
-    ) -> None: ...
+    ) -> TaskSummary | None:
+        """Apply queued event, returns changed task or None if the event was already applied."""
+        ...
 
     @abstractmethod
     async def update_task(
         self,
         task_id: uuid.UUID,
         task_arguments: StartedTask | ExecutedTask,
-    ) -> None: ...
+    ) -> TaskSummary | None:
+        """Apply started or executed event, returns changed task or None if the event was already applied."""
+        ...
+
+    @abstractmethod
+    async def apply_events(
+        self,
+        events: list[tuple[uuid.UUID, TaskEventData]],
+    ) -> list[TaskSummary]:
+        """
+        Apply multiple task events within a single transaction.
+
+        Args:
+            events: Pairs of task ID and event payload in the order they should be applied.
+
+        Returns:
+            Latest state of every task changed by the events. Redelivered events change nothing.
+        """
+        ...
 
     @abstractmethod
     async def batch_update(
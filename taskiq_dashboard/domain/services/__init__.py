@@ -1,8 +1,13 @@
 from taskiq_dashboard.domain.services.cleanup_service import AbstractCleanupService
+from taskiq_dashboard.domain.services.event_writer import AbstractEventWriter, EventQueueFullError
 from taskiq_dashboard.domain.services.schema_service import AbstractSchemaService
+from taskiq_dashboard.domain.services.task_broadcaster import AbstractTaskBroadcaster
 
 
 __all__ = [
     'AbstractCleanupService',
+    'AbstractEventWriter',
     'AbstractSchemaService',
+    'AbstractTaskBroadcaster',
+    'EventQueueFullError',
 ]
@@ -11,8 +11,10 @@ class AbstractCleanupService(ABC):
         """
         Perform cleanup according to settings.
 
+        Tasks are deleted in batches, so cleanup doesn't block event ingestion for long.
+
         Returns:
-            CleanupResult with counts of deleted tasks.
+            CleanupResult with counts of deleted tasks and batches.
         """
         ...
 
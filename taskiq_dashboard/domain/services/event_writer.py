@@ -0,0 +1,48 @@
+import uuid
+from abc import ABC, abstractmethod
+
+from taskiq_dashboard.domain.dto.ingestion import IngestionMetrics
+from taskiq_dashboard.domain.dto.task import TaskEventData
+
+
+class EventQueueFullError(Exception):
+    """Task events can't be accepted until the queued ones are written."""
+
+    def __init__(self, retry_after_seconds: int) -> None:
+        super().__init__('Task events queue is full')
+        self.retry_after_seconds = retry_after_seconds
+
+
+class AbstractEventWriter(ABC):
+    """Writes received task events to the storage."""
+
+    @abstractmethod
+    async def write(
+        self,
+        events: list[tuple[uuid.UUID, TaskEventData]],
+    ) -> None:
+        """
+        Write task events or accept them for writing in background.
+
+        Args:
+            events: Pairs of task id and event data in the order they were sent.
+
+        Raises:
+            EventQueueFullError: Events are not accepted, the sender should retry them later.
+        """
+        ...
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start background writing of accepted events."""
+        ...
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Write all accepted events and stop background writing."""
+        ...
+
+    @abstractmethod
+    def metrics(self) -> IngestionMetrics:
+        """Current counters of received events."""
+        ...
@@ -8,3 +8,12 @@ class AbstractSchemaService(abc.ABC):
         Create the database schema for task states.
         """
         ...
+
+    @abc.abstractmethod
+    async def create_partitions(self) -> None:
+        """
+        Create partitions of the tasks table for the upcoming period.
+
+        Does nothing when the tasks table is not partitioned.
+        """
+        ...
@@ -0,0 +1,30 @@
+import typing as tp
+from abc import ABC, abstractmethod
+
+from taskiq_dashboard.domain.dto.task import TaskSummary
+
+
+class AbstractTaskBroadcaster(ABC):
+    """Publish-subscribe channel delivering changed tasks to live viewers."""
+
+    @abstractmethod
+    def publish(self, tasks: list[TaskSummary]) -> None:
+        """
+        Deliver changed tasks to all current subscribers without waiting for them.
+
+        Args:
+            tasks: Latest state of tasks changed by ingested events.
+        """
+        ...
+
+    @abstractmethod
+    def subscribe(self) -> tp.AsyncContextManager[tp.AsyncIterator[TaskSummary]]:
+        """
+        Subscribe to changed tasks.
+
+        Usage:
+            async with broadcaster.subscribe() as tasks:
+                async for task in tasks:
+                    ...
+        """
+        ...
@@ -0,0 +1,91 @@
+import types
+import typing as tp
+import zlib
+
+
+ContentEncoding = tp.Literal['gzip', 'zstd']
+CONTENT_ENCODINGS: tuple[ContentEncoding, ...] = ('gzip', 'zstd')
+# output of one read from the zstd stream while decompressing
+ZSTD_READ_SIZE = 64 * 1024
+
+
+class DecompressionError(ValueError):
+    """Compressed data can't be decompressed."""
+
+
+class UnsupportedEncodingError(DecompressionError):
+    """Data is compressed with an encoding this installation can't decompress."""
+
+
+class DecompressedSizeError(ValueError):
+    """Decompressed data exceeds the allowed size."""
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__(f'Decompressed body exceeds {max_size} bytes')
+        self.max_size = max_size
+
+
+def import_zstandard() -> types.ModuleType:
+    """
+    Import optional `zstandard` package.
+
+    Raises:
+        ImportError: if the package is not installed.
+    """
+    try:
+        import zstandard  # noqa: PLC0415
+    except ImportError as e:
+        raise ImportError(
+            'zstandard is required for zstd compression. Please install it with "pip install zstandard".',
+        ) from e
+    return zstandard
+
+
+def compress(data: bytes, encoding: ContentEncoding) -> bytes:
+    if encoding == 'gzip':
+        compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+    return import_zstandard().ZstdCompressor().compress(data)
+
+
+def decompress(data: bytes, encoding: str, max_size: int) -> bytes:
+    """
+    Decompress data without producing more than `max_size` bytes, so small compressed bodies can't exhaust memory.
+
+    Raises:
+        UnsupportedEncodingError: if the encoding is not supported.
+        DecompressionError: if data is corrupted.
+        DecompressedSizeError: if decompressed data is larger than `max_size` bytes.
+    """
+    if encoding == 'gzip':
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        try:
+            result = decompressor.decompress(data, max_size + 1)
+        except zlib.error as e:
+            msg = f'Invalid gzip data: {e}'
+            raise DecompressionError(msg) from e
+        if len(result) > max_size:
+            raise DecompressedSizeError(max_size)
+        if not decompressor.eof:
+            raise DecompressionError('Invalid gzip data: unexpected end of data')
+        return result
+    if encoding == 'zstd':
+        try:
+            zstandard = import_zstandard()
+        except ImportError as e:
+            raise UnsupportedEncodingError('zstd encoding is not supported, zstandard package is not installed') from e
+        chunks: list[bytes] = []
+        size = 0
+        try:
+            with zstandard.ZstdDecompressor().stream_reader(data) as reader:
+                while chunk := reader.read(ZSTD_READ_SIZE):
+                    size += len(chunk)
+                    if size > max_size:
+                        raise DecompressedSizeError(max_size)
+                    chunks.append(chunk)
+        except zstandard.ZstdError as e:
+            msg = f'Invalid zstd data: {e}'
+            raise DecompressionError(msg) from e
+        return b''.join(chunks)
+    msg = f'Unsupported content encoding: {encoding}'
+    raise UnsupportedEncodingError(msg)
@@ -27,6 +27,46 @@ class BaseTableSchema:
 
 class PostgresTask(BaseTableSchema):
     __tablename__ = 'taskiq_dashboard__tasks'
+    __table_args__ = (
+        # status filter combined with sorting on the list page, also used by status batch updates
+        sa.Index(
+            'ix_taskiq_dashboard__tasks_status_started_at',
+            'status',
+            'started_at',
+            'id',
+            postgresql_concurrently=True,
+        ),
+        sa.Index(
+            'ix_taskiq_dashboard__tasks_status_finished_at',
+            'status',
+            'finished_at',
+            'id',
+            postgresql_concurrently=True,
+        ),
+        # sorting on the list page without status filter, id is the keyset pagination tiebreaker
+        sa.Index('ix_taskiq_dashboard__tasks_started_at', 'started_at', 'id', postgresql_concurrently=True),
+        sa.Index('ix_taskiq_dashboard__tasks_finished_at', 'finished_at', 'id', postgresql_concurrently=True),
+        sa.Index(
+            'ix_taskiq_dashboard__tasks_status_execution_time',
+            'status',
+            'execution_time',
+            'id',
+            postgresql_concurrently=True,
+        ),
+        sa.Index('ix_taskiq_dashboard__tasks_execution_time', 'execution_time', 'id', postgresql_concurrently=True),
+        # time series filtered by worker, counted over stored tasks
+        sa.Index('ix_taskiq_dashboard__tasks_queued_at', 'queued_at', postgresql_concurrently=True),
+        sa.Index('ix_taskiq_dashboard__tasks_name', 'name', postgresql_concurrently=True),
+        # substring search on the list page
+        sa.Index(
+            'ix_taskiq_dashboard__tasks_name_trgm',
+            'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+            info={'required_extension': 'pg_trgm'},
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(postgresql.UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(postgresql.TEXT, nullable=False)
@@ -53,10 +93,22 @@ class PostgresTask(BaseTableSchema):
         sa.DateTime(timezone=True),
         nullable=True,
     )
+    # seconds reported by the worker, stored to sort and filter tasks by duration
+    execution_time: Mapped[float | None] = mapped_column(sa.Float, nullable=True, default=None)
 
 
 class SqliteTask(BaseTableSchema):
     __tablename__ = 'tasks'
+    __table_args__ = (
+        sa.Index('ix_tasks_status_started_at', 'status', 'started_at', 'id'),
+        sa.Index('ix_tasks_status_finished_at', 'status', 'finished_at', 'id'),
+        sa.Index('ix_tasks_started_at', 'started_at', 'id'),
+        sa.Index('ix_tasks_finished_at', 'finished_at', 'id'),
+        sa.Index('ix_tasks_status_execution_time', 'status', 'execution_time', 'id'),
+        sa.Index('ix_tasks_execution_time', 'execution_time', 'id'),
+        sa.Index('ix_tasks_queued_at', 'queued_at'),
+        sa.Index('ix_tasks_name', 'name'),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         sa.Uuid(as_uuid=True),
@@ -87,3 +139,133 @@ class SqliteTask(BaseTableSchema):
         sa.DateTime(timezone=True),
         nullable=True,
     )
+    # seconds reported by the worker, stored to sort and filter tasks by duration
+    execution_time: Mapped[float | None] = mapped_column(sqlite.REAL, nullable=True, default=None)
+
+
+class PostgresTaskStats(BaseTableSchema):
+    """
+    Per task name counters aggregated by time bucket, kept when raw tasks are cleaned up.
+
+    Execution time and queue wait time (from queued to started) are kept as sketches for percentiles.
+    """
+
+    __tablename__ = 'taskiq_dashboard__task_stats'
+    __table_args__ = (sa.Index('ix_taskiq_dashboard__task_stats_bucket', 'bucket', postgresql_concurrently=True),)
+
+    name: Mapped[str] = mapped_column(postgresql.TEXT, primary_key=True)
+    bucket: Mapped[dt.datetime] = mapped_column(sa.DateTime(timezone=True), primary_key=True)
+
+    queued_count: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=0)
+    started_count: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=0)
+    completed_count: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=0)
+    failed_count: Mapped[int] = mapped_column(sa.Integer, nullable=False, default=0)
+
+    duration_sum: Mapped[float] = mapped_column(sa.Float, nullable=False, default=0.0)
+    duration_min: Mapped[float | None] = mapped_column(sa.Float, nullable=True, default=None)
+    duration_max: Mapped[float | None] = mapped_column(sa.Float, nullable=True, default=None)
+    # bins of `LatencySketch`, merged on ingestion and on read
+    duration_sketch: Mapped[dict[str, int] | None] = mapped_column(
+        postgresql.JSONB(none_as_null=True), nullable=True, default=None
+    )
+    wait_sketch: Mapped[dict[str, int] | None] = mapped_column(
+        postgresql.JSONB(none_as_null=True), nullable=True, default=None
+    )
+
+
+class SqliteTaskStats(BaseTableSchema):
+    """
+    Per task name counters aggregated by time bucket, kept when raw tasks are cleaned up.
+
+    Execution time and queue wait time (from queued to started) are kept as sketches for percentiles.
+    """
+
+    __tablename__ = 'task_stats'
+    __table_args__ = (sa.Index('ix_task_stats_bucket', 'bucket'),)
+
+    name: Mapped[str] = mapped_column(sqlite.TEXT, primary_key=True)
+    bucket: Mapped[dt.datetime] = mapped_column(sa.DateTime(timezone=True), primary_key=True)
+
+    queued_count: Mapped[int] = mapped_column(sqlite.INTEGER, nullable=False, default=0)
+    started_count: Mapped[int] = mapped_column(sqlite.INTEGER, nullable=False, default=0)
+    completed_count: Mapped[int] = mapped_column(sqlite.INTEGER, nullable=False, default=0)
+    failed_count: Mapped[int] = mapped_column(sqlite.INTEGER, nullable=False, default=0)
+
+    duration_sum: Mapped[float] = mapped_column(sqlite.REAL, nullable=False, default=0.0)
+    duration_min: Mapped[float | None] = mapped_column(sqlite.REAL, nullable=True, default=None)
+    duration_max: Mapped[float | None] = mapped_column(sqlite.REAL, nullable=True, default=None)
+    # bins of `LatencySketch`, merged on ingestion and on read
+    duration_sketch: Mapped[dict[str, int] | None] = mapped_column(
+        sqlite.JSON(none_as_null=True), nullable=True, default=None
+    )
+    wait_sketch: Mapped[dict[str, int] | None] = mapped_column(
+        sqlite.JSON(none_as_null=True), nullable=True, default=None
+    )
+
+
+class PostgresTaskSketches(BaseTableSchema):
+    """Hourly rollup of latency sketches, percentiles over long periods merge one row per hour."""
+
+    __tablename__ = 'taskiq_dashboard__task_sketches'
+    __table_args__ = (sa.Index('ix_taskiq_dashboard__task_sketches_bucket', 'bucket', postgresql_concurrently=True),)
+
+    name: Mapped[str] = mapped_column(postgresql.TEXT, primary_key=True)
+    bucket: Mapped[dt.datetime] = mapped_column(sa.DateTime(timezone=True), primary_key=True)
+
+    duration_sketch: Mapped[dict[str, int] | None] = mapped_column(
+        postgresql.JSONB(none_as_null=True), nullable=True, default=None
+    )
+    wait_sketch: Mapped[dict[str, int] | None] = mapped_column(
+        postgresql.JSONB(none_as_null=True), nullable=True, default=None
+    )
+
+
+class SqliteTaskSketches(BaseTableSchema):
+    """Hourly rollup of latency sketches, percentiles over long periods merge one row per hour."""
+
+    __tablename__ = 'task_sketches'
+    __table_args__ = (sa.Index('ix_task_sketches_bucket', 'bucket'),)
+
+    name: Mapped[str] = mapped_column(sqlite.TEXT, primary_key=True)
+    bucket: Mapped[dt.datetime] = mapped_column(sa.DateTime(timezone=True), primary_key=True)
+
+    duration_sketch: Mapped[dict[str, int] | None] = mapped_column(
+        sqlite.JSON(none_as_null=True), nullable=True, default=None
+    )
+    wait_sketch: Mapped[dict[str, int] | None] = mapped_column(
+        sqlite.JSON(none_as_null=True), nullable=True, default=None
+    )
+
+
+# timestamp used by cleanup to find the oldest tasks
+sa.Index(
+    'ix_taskiq_dashboard__tasks_cleanup_at',
+    sa.func.coalesce(PostgresTask.finished_at, PostgresTask.started_at, PostgresTask.queued_at),
+    postgresql_concurrently=True,
+)
+sa.Index(
+    'ix_tasks_cleanup_at',
+    sa.func.coalesce(SqliteTask.finished_at, SqliteTask.started_at, SqliteTask.queued_at),
+)
+
+
+# Trigram full-text index over task names for substring search on SQLite.
+# External content table keyed by rowid of `tasks`, kept in sync by triggers.
+# Explicit VACUUM may renumber rowids, run `INSERT INTO tasks_name_fts(tasks_name_fts) VALUES ('rebuild')` after it.
+SqliteTaskNameSearch = sa.table('tasks_name_fts', sa.column('rowid'), sa.column('name'))
+SQLITE_TASK_NAME_SEARCH_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_name_fts USING fts5(name, content='tasks', tokenize='trigram')",
+    (
+        'CREATE TRIGGER IF NOT EXISTS tasks_name_fts_insert AFTER INSERT ON tasks BEGIN '
+        'INSERT INTO tasks_name_fts(rowid, name) VALUES (new.rowid, new.name); END'
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS tasks_name_fts_delete AFTER DELETE ON tasks BEGIN '
+        "INSERT INTO tasks_name_fts(tasks_name_fts, rowid, name) VALUES ('delete', old.rowid, old.name); END"
+    ),
+    (
+        'CREATE TRIGGER IF NOT EXISTS tasks_name_fts_update AFTER UPDATE OF name ON tasks BEGIN '
+        "INSERT INTO tasks_name_fts(tasks_name_fts, rowid, name) VALUES ('delete', old.rowid, old.name); "
+        'INSERT INTO tasks_name_fts(rowid, name) VALUES (new.rowid, new.name); END'
+    ),
+)
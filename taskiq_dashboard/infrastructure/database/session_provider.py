@@ -63,6 +63,16 @@ class AsyncPostgresSessionProvider:
         finally:
             await session.close()
 
+    @asynccontextmanager
+    async def autocommit_connection(self) -> tp.AsyncGenerator[sa_async.AsyncConnection, None]:
+        """
+        Create a connection outside of any transaction.
+
+        Needed for statements that can't run inside a transaction block, e.g. `CREATE INDEX CONCURRENTLY`.
+        """
+        async with self._engine.connect() as connection:
+            yield await connection.execution_options(isolation_level='AUTOCOMMIT')
+
     async def close(self) -> None:
         """Close the engine and release all connections."""
         await self._engine.dispose()
@@ -1,6 +1,10 @@
+from taskiq_dashboard.infrastructure.repositories.stats import StatsRepository
 from taskiq_dashboard.infrastructure.repositories.task import TaskRepository
+from taskiq_dashboard.infrastructure.repositories.timeseries_cache import TimeseriesCache
 
 
 __all__ = [
+    'StatsRepository',
     'TaskRepository',
+    'TimeseriesCache',
 ]
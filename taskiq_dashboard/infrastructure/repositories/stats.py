@@ -0,0 +1,273 @@
+import datetime as dt
+import typing as tp
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from taskiq_dashboard.domain.dto.sketch import LatencySketch
+from taskiq_dashboard.domain.dto.stats import TaskStats, TaskTimeseriesPoint
+from taskiq_dashboard.domain.dto.task_status import TaskStatus
+from taskiq_dashboard.domain.repositories import AbstractStatsRepository
+from taskiq_dashboard.infrastructure.database.schemas import (
+    PostgresTask,
+    PostgresTaskSketches,
+    PostgresTaskStats,
+    SqliteTask,
+    SqliteTaskSketches,
+    SqliteTaskStats,
+)
+from taskiq_dashboard.infrastructure.database.session_provider import AsyncPostgresSessionProvider
+from taskiq_dashboard.infrastructure.repositories.timeseries_cache import EPOCH, TimeseriesCache
+
+
+# buckets ended less than this time ago are still being filled and are not cached
+TIMESERIES_SETTLE_TIME = dt.timedelta(minutes=1)
+
+
+class StatsRepository(AbstractStatsRepository):
+    def __init__(
+        self,
+        session_provider: AsyncPostgresSessionProvider,
+        stats_model: type[PostgresTaskStats] | type[SqliteTaskStats],
+        timeseries_cache: TimeseriesCache | None = None,
+    ) -> None:
+        self._session_provider = session_provider
+        self.stats = stats_model
+        self.sketches = PostgresTaskSketches if stats_model is PostgresTaskStats else SqliteTaskSketches
+        self.task = PostgresTask if stats_model is PostgresTaskStats else SqliteTask
+        # complete buckets of recently requested time series, invalidated by the task repository on ingestion
+        self._timeseries_cache = timeseries_cache or TimeseriesCache()
+
+    async def get_task_stats(
+        self,
+        since: dt.datetime,
+        until: dt.datetime,
+        name: str | None = None,
+    ) -> list[TaskStats]:
+        query = (
+            sa.select(
+                self.stats.name,
+                sa.func.sum(self.stats.queued_count).label('queued_count'),
+                sa.func.sum(self.stats.started_count).label('started_count'),
+                sa.func.sum(self.stats.completed_count).label('completed_count'),
+                sa.func.sum(self.stats.failed_count).label('failed_count'),
+                sa.func.sum(self.stats.duration_sum).label('duration_sum'),
+                sa.func.min(self.stats.duration_min).label('duration_min'),
+                sa.func.max(self.stats.duration_max).label('duration_max'),
+            )
+            .where(
+                self.stats.bucket >= since.replace(second=0, microsecond=0),
+                self.stats.bucket < until,
+            )
+            .group_by(self.stats.name)
+            .order_by(self.stats.name)
+        )
+        if name is not None:
+            query = query.where(self.stats.name == name)
+        async with self._session_provider.session() as session:
+            result = await session.execute(query)
+            stats_rows = result.all()
+            duration_sketches = await self._merged_sketches(session, 'duration_sketch', since, until, name)
+            wait_sketches = await self._merged_sketches(session, 'wait_sketch', since, until, name)
+        task_stats = []
+        for stats_row in stats_rows:
+            duration_sketch = duration_sketches.get(stats_row.name, LatencySketch())
+            wait_sketch = wait_sketches.get(stats_row.name, LatencySketch())
+            task_stats.append(
+                TaskStats.model_validate(stats_row).model_copy(
+                    update={
+                        'duration_p50': duration_sketch.quantile(0.5),
+                        'duration_p95': duration_sketch.quantile(0.95),
+                        'duration_p99': duration_sketch.quantile(0.99),
+                        'wait_p50': wait_sketch.quantile(0.5),
+                        'wait_p95': wait_sketch.quantile(0.95),
+                        'wait_p99': wait_sketch.quantile(0.99),
+                    },
+                ),
+            )
+        return task_stats
+
+    async def _merged_sketches(
+        self,
+        session: AsyncSession,
+        sketch_column_name: tp.Literal['duration_sketch', 'wait_sketch'],
+        since: dt.datetime,
+        until: dt.datetime,
+        name: str | None,
+    ) -> dict[str, LatencySketch]:
+        """
+        Merge sketches of every bucket in the period per task name.
+
+        Whole hours of the period are read from the hourly rollup and only the edges from minute buckets,
+        so the number of merged rows grows with the number of hours. Bins are summed by the database,
+        only one row per task name and bin is read.
+        """
+        since = since.replace(second=0, microsecond=0)
+        first_hour = since.replace(minute=0)
+        if first_hour < since:
+            first_hour += dt.timedelta(hours=1)
+        last_hour = until.replace(minute=0, second=0, microsecond=0)
+        if first_hour < last_hour:
+            periods = [
+                (self.stats, since, first_hour),
+                (self.sketches, first_hour, last_hour),
+                (self.stats, last_hour, until),
+            ]
+        else:
+            periods = [(self.stats, since, until)]
+        each_bin = sa.func.jsonb_each_text if self.stats is PostgresTaskStats else sa.func.json_each
+        bin_queries = []
+        for table, period_start, period_end in periods:
+            bins = each_bin(getattr(table, sketch_column_name)).table_valued('key', 'value')
+            bin_query = (
+                sa.select(table.name, bins.c.key, bins.c.value)
+                .select_from(table)
+                .join(bins, sa.true())
+                .where(table.bucket >= period_start, table.bucket < period_end)
+            )
+            if name is not None:
+                bin_query = bin_query.where(table.name == name)
+            bin_queries.append(bin_query)
+        all_bins = sa.union_all(*bin_queries).subquery()
+        query = sa.select(
+            all_bins.c.name,
+            all_bins.c.key,
+            sa.func.sum(sa.cast(all_bins.c.value, sa.Integer)),
+        ).group_by(all_bins.c.name, all_bins.c.key)
+        result = await session.execute(query)
+        sketches: dict[str, LatencySketch] = {}
+        for task_name, bin_index, count in result.all():
+            sketches.setdefault(task_name, LatencySketch()).bins[int(bin_index)] = count
+        return sketches
+
+    async def get_task_timeseries(
+        self,
+        since: dt.datetime,
+        until: dt.datetime,
+        interval: dt.timedelta,
+        name: str | None = None,
+        worker: str | None = None,
+    ) -> list[TaskTimeseriesPoint]:
+        interval_seconds = int(interval.total_seconds())
+        first_bucket = EPOCH + (since - EPOCH) // interval * interval
+        last_bucket = EPOCH + (until - EPOCH) // interval * interval
+        bucket_starts = []
+        bucket_start = first_bucket
+        while bucket_start <= last_bucket:
+            bucket_starts.append(bucket_start)
+            bucket_start += interval
+
+        cache_key = (name, worker, interval_seconds)
+        cached_points, cache_generation = self._timeseries_cache.get(cache_key)
+        missing_bucket_starts = [bucket_start for bucket_start in bucket_starts if bucket_start not in cached_points]
+        points: dict[dt.datetime, TaskTimeseriesPoint] = {}
+        if missing_bucket_starts:
+            async with self._session_provider.session() as session:
+                if worker is None:
+                    query = self._stats_timeseries_query(missing_bucket_starts[0], until, interval_seconds, name)
+                else:
+                    query = self._tasks_timeseries_query(
+                        missing_bucket_starts[0], until, interval_seconds, name, worker
+                    )
+                result = await session.execute(query)
+                for row in result.all():
+                    bucket_start = EPOCH + dt.timedelta(seconds=int(row.bucket))
+                    points[bucket_start] = TaskTimeseriesPoint.model_validate(
+                        {**row._asdict(), 'bucket': bucket_start},
+                    )
+
+        settled_until = dt.datetime.now(dt.timezone.utc) - TIMESERIES_SETTLE_TIME
+        timeseries = []
+        for bucket_start in bucket_starts:
+            point = cached_points.get(bucket_start)
+            if point is None:
+                point = points.get(bucket_start) or TaskTimeseriesPoint(bucket=bucket_start)
+            timeseries.append(point)
+        self._timeseries_cache.put(
+            cache_key,
+            {point.bucket: point for point in timeseries if point.bucket + interval <= settled_until},
+            cache_generation,
+        )
+        return timeseries
+
+    def _bucket_start(self, column: sa.ColumnElement[dt.datetime], interval_seconds: int) -> sa.ColumnElement[int]:
+        """Build expression truncating a timestamp to its bucket, in seconds since the Unix epoch."""
+        if self.stats is PostgresTaskStats:
+            epoch_seconds = sa.cast(sa.func.floor(sa.extract('epoch', column)), sa.BigInteger)
+        else:
+            epoch_seconds = sa.cast(sa.func.strftime('%s', column), sa.Integer)
+        # interval is inlined, so Postgres matches the grouped expression with the selected one
+        interval = sa.literal_column(str(int(interval_seconds)))
+        return (epoch_seconds - epoch_seconds % interval).label('bucket')
+
+    def _stats_timeseries_query(
+        self,
+        since: dt.datetime,
+        until: dt.datetime,
+        interval_seconds: int,
+        name: str | None,
+    ) -> sa.Select[tp.Any]:
+        """Sum per minute rollups into buckets of the interval."""
+        bucket_start = self._bucket_start(self.stats.bucket, interval_seconds)
+        query = (
+            sa.select(
+                bucket_start,
+                sa.func.sum(self.stats.queued_count).label('queued_count'),
+                sa.func.sum(self.stats.started_count).label('started_count'),
+                sa.func.sum(self.stats.completed_count).label('completed_count'),
+                sa.func.sum(self.stats.failed_count).label('failed_count'),
+            )
+            .where(self.stats.bucket >= since, self.stats.bucket < until)
+            .group_by(bucket_start)
+        )
+        if name is not None:
+            query = query.where(self.stats.name == name)
+        return query
+
+    def _tasks_timeseries_query(
+        self,
+        since: dt.datetime,
+        until: dt.datetime,
+        interval_seconds: int,
+        name: str | None,
+        worker: str,
+    ) -> sa.Select[tp.Any]:
+        """
+        Count stored tasks into buckets of the interval.
+
+        Every event type is counted by its own timestamp, each of them is a range scan
+        over the index of that timestamp.
+        """
+        one, zero = sa.literal_column('1'), sa.literal_column('0')
+        event_queries = []
+        for timestamp_column, event_counts in (
+            (self.task.queued_at, {'queued_count': one}),
+            (self.task.started_at, {'started_count': one}),
+            (
+                self.task.finished_at,
+                {
+                    'completed_count': sa.case((self.task.status == TaskStatus.COMPLETED.value, one), else_=zero),
+                    'failed_count': sa.case((self.task.status == TaskStatus.FAILURE.value, one), else_=zero),
+                },
+            ),
+        ):
+            columns = [
+                event_counts.get(counter, zero).label(counter)
+                for counter in ('queued_count', 'started_count', 'completed_count', 'failed_count')
+            ]
+            event_query = sa.select(self._bucket_start(timestamp_column, interval_seconds), *columns).where(
+                timestamp_column >= since,
+                timestamp_column < until,
+                self.task.worker == worker,
+            )
+            if name is not None:
+                event_query = event_query.where(self.task.name == name)
+            event_queries.append(event_query)
+        events = sa.union_all(*event_queries).subquery()
+        return sa.select(
+            events.c.bucket,
+            sa.func.sum(events.c.queued_count).label('queued_count'),
+            sa.func.sum(events.c.started_count).label('started_count'),
+            sa.func.sum(events.c.completed_count).label('completed_count'),
+            sa.func.sum(events.c.failed_count).label('failed_count'),
+        ).group_by(events.c.bucket)
@@ -1,60 +1,324 @@
+import dataclasses
+import datetime as dt
+import operator
+import string
 import typing as tp
 import uuid
-from contextlib import suppress
 
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
-from taskiq_dashboard.domain.dto.task import ExecutedTask, QueuedTask, StartedTask, Task
+from taskiq_dashboard.domain.dto.sketch import LatencySketch
+from taskiq_dashboard.domain.dto.task import (
+    ExecutedTask,
+    QueuedTask,
+    StartedExecutedTask,
+    StartedTask,
+    Task,
+    TaskCursor,
+    TaskEventData,
+    TaskSummary,
+)
 from taskiq_dashboard.domain.dto.task_status import TaskStatus
 from taskiq_dashboard.domain.repositories import AbstractTaskRepository
-from taskiq_dashboard.infrastructure.database.schemas import PostgresTask, SqliteTask
+from taskiq_dashboard.infrastructure.database.schemas import (
+    PostgresTask,
+    PostgresTaskSketches,
+    PostgresTaskStats,
+    SqliteTask,
+    SqliteTaskNameSearch,
+    SqliteTaskSketches,
+    SqliteTaskStats,
+)
 from taskiq_dashboard.infrastructure.database.session_provider import AsyncPostgresSessionProvider
+from taskiq_dashboard.infrastructure.repositories.timeseries_cache import TimeseriesCache
+
+
+UUID_HEX_LENGTH = 32
+# shortest search string the trigram indexes can serve
+TRIGRAM_LENGTH = 3
+# advisory lock keys are signed bigints
+LOCK_KEY_MASK = 2**63 - 1
+# rows fetched from the cursor at once when streaming tasks
+STREAM_BATCH_SIZE = 1000
+
+
+def _uuid_prefix_range(value: str) -> tuple[uuid.UUID, uuid.UUID] | None:
+    """Convert hex prefix of a task id to the inclusive range of ids starting with it."""
+    prefix = value.replace('-', '').lower()
+    if not prefix or len(prefix) > UUID_HEX_LENGTH or any(char not in string.hexdigits for char in prefix):
+        return None
+    return uuid.UUID(prefix.ljust(UUID_HEX_LENGTH, '0')), uuid.UUID(prefix.ljust(UUID_HEX_LENGTH, 'f'))
+
+
+def _lifecycle_groups(
+    events: list[tuple[uuid.UUID, TaskEventData]],
+) -> list[list[tuple[uuid.UUID, TaskEventData]]]:
+    """
+    Split events into groups applied by one multi-row statement each.
+
+    Events are cut in order into segments where a task has at most one event of each type.
+    Inside a segment events are grouped by type in the order of task lifecycle: queued, started, executed.
+    Coalesced started and executed events are applied between started and executed ones.
+    """
+    segments: list[dict[type, dict[uuid.UUID, TaskEventData]]] = [{}]
+    for task_id, task_arguments in events:
+        if task_id in segments[-1].get(type(task_arguments), {}):
+            segments.append({})
+        segments[-1].setdefault(type(task_arguments), {})[task_id] = task_arguments
+    return [
+        list(segment[event_type].items())
+        for segment in segments
+        for event_type in (QueuedTask, StartedTask, StartedExecutedTask, ExecutedTask)
+        if event_type in segment
+    ]
+
+
+def _stats_bucket(timestamp: dt.datetime) -> dt.datetime:
+    """Truncate event time to the start of its stats bucket (one minute)."""
+    return timestamp.replace(second=0, microsecond=0)
+
+
+@dataclasses.dataclass
+class _StatsIncrement:
+    """Change of stats counters and latency sketches for one task name and bucket."""
+
+    queued_count: int = 0
+    started_count: int = 0
+    completed_count: int = 0
+    failed_count: int = 0
+    duration_sum: float = 0.0
+    duration_min: float | None = None
+    duration_max: float | None = None
+    duration_sketch: LatencySketch = dataclasses.field(default_factory=LatencySketch)
+    wait_sketch: LatencySketch = dataclasses.field(default_factory=LatencySketch)
+
+    def add(self, other: '_StatsIncrement') -> None:
+        self.queued_count += other.queued_count
+        self.started_count += other.started_count
+        self.completed_count += other.completed_count
+        self.failed_count += other.failed_count
+        self.duration_sum += other.duration_sum
+        durations = (self.duration_min, self.duration_max, other.duration_min, other.duration_max)
+        known_durations = [duration for duration in durations if duration is not None]
+        self.duration_min = min(known_durations, default=None)
+        self.duration_max = max(known_durations, default=None)
+        self.duration_sketch.merge(other.duration_sketch)
+        self.wait_sketch.merge(other.wait_sketch)
+
+    def values(self) -> dict[str, tp.Any]:
+        """Map increment to the stats row values, empty sketches are stored as NULL."""
+        values = {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
+        for sketch_column in ('duration_sketch', 'wait_sketch'):
+            sketch: LatencySketch = values[sketch_column]
+            values[sketch_column] = {str(index): count for index, count in sketch.bins.items()} or None
+        return values
+
+
+def _stats_increments(
+    task: TaskSummary,
+    task_arguments: TaskEventData,
+) -> list[tuple[tuple[str, dt.datetime], _StatsIncrement]]:
+    """Map applied event to the stats buckets of its timestamps and the counters it increments."""
+    if isinstance(task_arguments, StartedExecutedTask):
+        return _stats_increments(task, task_arguments.started()) + _stats_increments(task, task_arguments.executed())
+    if isinstance(task_arguments, ExecutedTask):
+        increment = _StatsIncrement(
+            completed_count=int(task_arguments.error is None),
+            failed_count=int(task_arguments.error is not None),
+            duration_sum=task_arguments.execution_time,
+            duration_min=task_arguments.execution_time,
+            duration_max=task_arguments.execution_time,
+        )
+        increment.duration_sketch.add(task_arguments.execution_time)
+        return [((task.name, _stats_bucket(task_arguments.finished_at)), increment)]
+    if isinstance(task_arguments, QueuedTask):
+        increments = [((task.name, _stats_bucket(task_arguments.queued_at)), _StatsIncrement(queued_count=1))]
+    else:
+        increments = [((task.name, _stats_bucket(task_arguments.started_at)), _StatsIncrement(started_count=1))]
+    # wait time is known once both queued and started events are applied, whichever of them comes last
+    if task.queued_at is not None and task.started_at is not None:
+        wait_increment = _StatsIncrement()
+        wait_increment.wait_sketch.add(max((task.started_at - task.queued_at).total_seconds(), 0.0))
+        increments.append(((task.name, _stats_bucket(task.started_at)), wait_increment))
+    return increments
 
 
 class TaskRepository(AbstractTaskRepository):
     def __init__(
-        self, session_provider: AsyncPostgresSessionProvider, task_model: type[PostgresTask] | type[SqliteTask]
+        self,
+        session_provider: AsyncPostgresSessionProvider,
+        task_model: type[PostgresTask] | type[SqliteTask],
+        timeseries_cache: TimeseriesCache | None = None,
     ) -> None:
         self._session_provider = session_provider
         self.task = task_model
+        self._timeseries_cache = timeseries_cache
+        self.stats = PostgresTaskStats if task_model is PostgresTask else SqliteTaskStats
+        self.sketches = PostgresTaskSketches if task_model is PostgresTask else SqliteTaskSketches
+        self._has_sqlite_name_search: bool | None = None
+        self._is_partitioned: bool | None = None
 
-    async def find_tasks(  # noqa: PLR0913
+    async def find_tasks(  # noqa: PLR0913, PLR0917
         self,
         name: str | None = None,
         status: TaskStatus | None = None,
-        sort_by: tp.Literal['started_at', 'finished_at'] | None = None,
+        sort_by: tp.Literal['started_at', 'finished_at', 'execution_time'] | None = None,
         sort_order: tp.Literal['asc', 'desc'] = 'desc',
         limit: int = 30,
         offset: int = 0,
-    ) -> list[Task]:
-        query = sa.select(self.task)
+        cursor: TaskCursor | None = None,
+        min_duration: float | None = None,
+        max_duration: float | None = None,
+    ) -> list[TaskSummary]:
+        # payload columns may be large (and TOASTed on Postgres), so only summary columns are read
+        query, sort_column = await self._filtered_query(
+            sa.select(*self._summary_columns()),
+            name=name,
+            status=status,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            min_duration=min_duration,
+            max_duration=max_duration,
+        )
+        if cursor is not None:
+            query = query.where(self._after_cursor(sort_column, sort_order, cursor))
+        query = query.limit(limit).offset(offset)
+        async with self._session_provider.session() as session:
+            result = await session.execute(query)
+            task_rows = result.all()
+        return [TaskSummary.model_validate(task_row) for task_row in task_rows]
+
+    async def stream_tasks(  # noqa: PLR0913, PLR0917
+        self,
+        name: str | None = None,
+        status: TaskStatus | None = None,
+        sort_by: tp.Literal['started_at', 'finished_at', 'execution_time'] | None = None,
+        sort_order: tp.Literal['asc', 'desc'] = 'desc',
+        min_duration: float | None = None,
+        max_duration: float | None = None,
+    ) -> tp.AsyncIterator[Task]:
+        query, _ = await self._filtered_query(
+            sa.select(*[getattr(self.task, field) for field in Task.model_fields]),
+            name=name,
+            status=status,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            min_duration=min_duration,
+            max_duration=max_duration,
+        )
+        # server-side cursor on Postgres, rows are fetched in batches instead of buffering the whole result
+        query = query.execution_options(yield_per=STREAM_BATCH_SIZE)
+        async with self._session_provider.session() as session:
+            result = await session.stream(query)
+            async for task_rows in result.partitions():
+                for task_row in task_rows:
+                    yield Task.model_validate(task_row)
+
+    async def _filtered_query(  # noqa: PLR0913
+        self,
+        query: sa.Select[tp.Any],
+        *,
+        name: str | None,
+        status: TaskStatus | None,
+        sort_by: tp.Literal['started_at', 'finished_at', 'execution_time'] | None,
+        sort_order: tp.Literal['asc', 'desc'],
+        min_duration: float | None,
+        max_duration: float | None,
+    ) -> tuple[sa.Select[tp.Any], InstrumentedAttribute[tp.Any] | None]:
+        """Apply task list filters and ordering to the query, returns the query and its sort column."""
         if name and len(name) > 1:
-            search_pattern = f'%{name.strip()}%'
-            id_text = sa.cast(self.task.id, sa.String)
-            query = query.where(
-                sa.or_(
-                    self.task.name.ilike(search_pattern),
-                    id_text.ilike(search_pattern)
-                )
-            )
+            query = query.where(await self._search_condition(name.strip()))
         if status is not None:
             query = query.where(self.task.status == status.value)
-        if sort_by:
-            if sort_by == 'finished_at':
-                sort_column = self.task.finished_at
-            elif sort_by == 'started_at':
-                sort_column = self.task.started_at
+        if min_duration is not None:
+            query = query.where(self.task.execution_time >= min_duration)
+        if max_duration is not None:
+            query = query.where(self.task.execution_time <= max_duration)
+        sort_column: InstrumentedAttribute[tp.Any] | None
+        if sort_by == 'finished_at':
+            sort_column = self.task.finished_at
+        elif sort_by == 'started_at':
+            sort_column = self.task.started_at
+        elif sort_by == 'execution_time':
+            sort_column = self.task.execution_time
+            # unfinished tasks have no duration to rank, without them the slowest tasks come first in both dialects
+            query = query.where(self.task.execution_time.is_not(None))
+        elif sort_by is None:
+            sort_column = None
+        else:
+            raise ValueError('Unsupported sort_by value: %s', sort_by)
+        order_by = [self.task.id] if sort_column is None else [sort_column, self.task.id]
+        query = query.order_by(*[column.asc() if sort_order == 'asc' else column.desc() for column in order_by])
+        return query, sort_column
+
+    async def _search_condition(self, search: str) -> sa.ColumnElement[bool]:
+        """
+        Build condition matching tasks by name substring or id prefix.
+
+        Name substring is looked up with the pg_trgm index on Postgres and the FTS5 trigram table
+        on SQLite. Hex prefix of an id becomes a primary key range scan.
+        """
+        escaped_search = search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        condition = self.task.name.ilike(f'%{escaped_search}%', escape='\\')
+        if self.task is SqliteTask and len(search) >= TRIGRAM_LENGTH and await self._is_sqlite_name_search_enabled():
+            phrase = '"' + search.replace('"', '""') + '"'
+            task_rowid = sa.literal_column(f'{self.task.__tablename__}.rowid')
+            condition = task_rowid.in_(
+                sa.select(SqliteTaskNameSearch.c.rowid).where(SqliteTaskNameSearch.c.name.match(phrase)),
+            )
+        id_range = _uuid_prefix_range(search)
+        if id_range is not None:
+            condition = sa.or_(condition, self.task.id.between(*id_range))
+        return condition
+
+    async def _is_sqlite_name_search_enabled(self) -> bool:
+        if self._has_sqlite_name_search is None:
+            async with self._session_provider.session() as session:
+                result = await session.execute(sa.text("SELECT 1 FROM sqlite_master WHERE name = 'tasks_name_fts'"))
+                self._has_sqlite_name_search = result.scalar() is not None
+        return self._has_sqlite_name_search
+
+    async def _is_partitioned_table(self, session: AsyncSession) -> bool:
+        if self._is_partitioned is None:
+            if self.task is PostgresTask:
+                result = await session.execute(
+                    sa.text('SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table_name)'),
+                    {'table_name': self.task.__tablename__},
+                )
+                self._is_partitioned = result.scalar() is not None
             else:
-                raise ValueError('Unsupported sort_by value: %s', sort_by)
-            query = query.order_by(sort_column.asc()) if sort_order == 'asc' else query.order_by(sort_column.desc())
-        query = query.limit(limit).offset(offset)
-        async with self._session_provider.session() as session:
-            result = await session.execute(query)
-            task_schemas = result.scalars().all()
-        return [Task.model_validate(task) for task in task_schemas]
+                self._is_partitioned = False
+        return self._is_partitioned
+
+    def _after_cursor(
+        self,
+        sort_column: InstrumentedAttribute[tp.Any] | None,
+        sort_order: tp.Literal['asc', 'desc'],
+        cursor: TaskCursor,
+    ) -> sa.ColumnElement[bool]:
+        """
+        Build keyset predicate selecting tasks placed after the cursor.
+
+        NULLs are ordered the way the database orders them by default (largest on Postgres,
+        smallest on SQLite), so the sort indexes can be used for both directions.
+        """
+        is_ascending = sort_order == 'asc'
+        is_after: tp.Callable[[tp.Any, tp.Any], sa.ColumnElement[bool]] = (
+            operator.gt if is_ascending else operator.lt  # ty: ignore[invalid-assignment]
+        )
+        if sort_column is None:
+            return is_after(self.task.id, cursor.task_id)
+        nulls_are_largest = self.task is PostgresTask
+        nulls_go_first = is_ascending != nulls_are_largest
+        if cursor.sort_value is None:
+            after_in_nulls = sa.and_(sort_column.is_(None), is_after(self.task.id, cursor.task_id))
+            return sa.or_(after_in_nulls, sort_column.is_not(None)) if nulls_go_first else after_in_nulls
+        after_value = is_after(sa.tuple_(sort_column, self.task.id), sa.tuple_(cursor.sort_value, cursor.task_id))
+        return after_value if nulls_go_first else sa.or_(after_value, sort_column.is_(None))
 
     async def get_task_by_id(self, task_id: uuid.UUID) -> Task | None:
         query = sa.select(self.task).where(self.task.id == task_id)
@@ -71,76 +335,317 @@ class TaskRepository(AbstractTaskRepository):
         self,
         task_id: uuid.UUID,
         task_arguments: QueuedTask,
-    ) -> None:
+    ) -> TaskSummary | None:
+        changed_tasks = await self.apply_events([(task_id, task_arguments)])
+        return changed_tasks[0] if changed_tasks else None
+
+    async def update_task(
+        self,
+        task_id: uuid.UUID,
+        task_arguments: StartedTask | ExecutedTask,
+    ) -> TaskSummary | None:
+        changed_tasks = await self.apply_events([(task_id, task_arguments)])
+        return changed_tasks[0] if changed_tasks else None
+
+    async def apply_events(
+        self,
+        events: list[tuple[uuid.UUID, TaskEventData]],
+    ) -> list[TaskSummary]:
+        if not events:
+            return []
+        changed_tasks: dict[uuid.UUID, TaskSummary] = {}
+        stats_increments: dict[tuple[str, dt.datetime], _StatsIncrement] = {}
+        async with self._session_provider.session() as session, session.begin():
+            if await self._is_partitioned_table(session):
+                await self._lock_tasks(session, [task_id for task_id, _ in events])
+            for event_group in _lifecycle_groups(events):
+                for task, task_arguments in await self._upsert_tasks(session, event_group):
+                    changed_tasks.pop(task.id, None)
+                    changed_tasks[task.id] = task
+                    for stats_key, increment in _stats_increments(task, task_arguments):
+                        stats_increments.setdefault(stats_key, _StatsIncrement()).add(increment)
+            if stats_increments:
+                await self._increment_stats(session, stats_increments)
+        if self._timeseries_cache is not None:
+            # worker series count stored tasks, so buckets of every timestamp of changed tasks are dropped
+            self._timeseries_cache.invalidate(
+                [
+                    *stats_increments,
+                    *(
+                        (task.name, timestamp)
+                        for task in changed_tasks.values()
+                        for timestamp in (task.queued_at, task.started_at, task.finished_at)
+                        if timestamp is not None
+                    ),
+                ]
+            )
+        return list(changed_tasks.values())
+
+    def _task_values(
+        self,
+        task_id: uuid.UUID,
+        task_arguments: TaskEventData,
+    ) -> tuple[dict[str, tp.Any], list[str], InstrumentedAttribute[dt.datetime]]:
+        """
+        Map event to the row inserted for a new task.
+
+        Returns:
+            Row values, columns updated in an existing task and column with the event time.
+        """
+        if isinstance(task_arguments, QueuedTask):
+            values: dict[str, tp.Any] = {
+                'id': task_id,
+                'name': task_arguments.task_name,
+                'status': TaskStatus.QUEUED.value,
+                'worker': task_arguments.worker or '',
+                'args': task_arguments.args,
+                'kwargs': task_arguments.kwargs,
+                'labels': task_arguments.labels,
+                'queued_at': task_arguments.queued_at,
+            }
+            return values, ['queued_at', 'worker', 'name', 'args', 'kwargs', 'labels'], self.task.queued_at
+        if isinstance(task_arguments, StartedTask):
+            values = {
+                'status': TaskStatus.IN_PROGRESS.value,
+                'started_at': task_arguments.started_at,
+                'args': task_arguments.args,
+                'kwargs': task_arguments.kwargs,
+                'labels': task_arguments.labels,
+                'name': task_arguments.task_name,
+                'worker': task_arguments.worker or '',
+            }
+            return {'id': task_id, **values}, list(values), self.task.started_at
+        if isinstance(task_arguments, StartedExecutedTask):
+            values, update_columns, _ = self._task_values(task_id, task_arguments.started())
+            executed_values, executed_columns, event_time_column = self._task_values(task_id, task_arguments.executed())
+            values.update({column: executed_values[column] for column in executed_columns})
+            return values, list(dict.fromkeys(update_columns + executed_columns)), event_time_column
+        task_status = TaskStatus.FAILURE if task_arguments.error is not None else TaskStatus.COMPLETED
+        values = {
+            'status': task_status.value,
+            'finished_at': task_arguments.finished_at,
+            'execution_time': task_arguments.execution_time,
+            'result': task_arguments.return_value.get('return_value'),
+            'error': task_arguments.error,
+        }
+        # executed event may arrive before any other event, so the placeholder row is created,
+        # named by the event so its stats are counted under the task name
+        placeholder = {
+            'id': task_id,
+            'name': task_arguments.task_name or 'unknown',
+            'worker': 'unknown',
+            'args': [],
+            'kwargs': {},
+            'labels': {},
+        }
+        return {**placeholder, **values}, list(values), self.task.finished_at
+
+    async def _upsert_tasks(
+        self,
+        session: AsyncSession,
+        events: list[tuple[uuid.UUID, TaskEventData]],
+    ) -> list[tuple[TaskSummary, TaskEventData]]:
+        """
+        Insert tasks or update the existing ones with events of the same type, one event per task.
+
+        Redelivered event (same time as already stored for its type) changes nothing and must not
+        be counted in stats twice, so it is left out of the result.
+
+        Returns:
+            Latest state of changed tasks paired with the events that changed them.
+        """
+        rows = [self._task_values(task_id, task_arguments)[0] for task_id, task_arguments in events]
+        _, update_columns, event_time_column = self._task_values(*events[0])
+        events_by_task_id = dict(events)
+        if await self._is_partitioned_table(session):
+            changed_tasks = []
+            for values in rows:
+                task = await self._update_or_insert_task(session, values, update_columns, event_time_column)
+                if task is not None:
+                    changed_tasks.append((task, events_by_task_id[task.id]))
+            return changed_tasks
+
+        # rows are locked in the same order by every transaction, so concurrent batches can't deadlock
+        rows.sort(key=operator.itemgetter('id'))
         insert = pg_insert if self.task is PostgresTask else sqlite_insert
-        stmt = insert(self.task).values(
-            id=task_id,
-            name=task_arguments.task_name,
-            status=TaskStatus.QUEUED.value,
-            worker=task_arguments.worker or '',
-            args=task_arguments.args,
-            kwargs=task_arguments.kwargs,
-            labels=task_arguments.labels,
-            queued_at=task_arguments.queued_at,
-        )
+        stmt = insert(self.task)
+        update_values: dict[str, tp.Any] = {column: stmt.excluded[column] for column in update_columns}
+        if isinstance(events[0][1], StartedTask):
+            update_values['status'] = self._started_status(stmt.excluded.started_at)
         upsert_query = stmt.on_conflict_do_update(
             index_elements=[self.task.id],
+            set_=update_values,
+            where=event_time_column.is_distinct_from(stmt.excluded[event_time_column.key]),
+        ).returning(*self._summary_columns())
+        # executed with a list of rows, SQLAlchemy sends them as multi-row VALUES pages
+        result = await session.execute(upsert_query, rows)
+        changed_tasks = []
+        for task_row in result.all():
+            task = TaskSummary.model_validate(task_row)
+            changed_tasks.append((task, events_by_task_id[task.id]))
+        return changed_tasks
+
+    async def _update_or_insert_task(
+        self,
+        session: AsyncSession,
+        values: dict[str, tp.Any],
+        update_columns: list[str],
+        event_time_column: InstrumentedAttribute[dt.datetime],
+    ) -> TaskSummary | None:
+        """
+        Upsert a single task in a partitioned table.
+
+        Partitioned table has no unique index on id to resolve conflicts against,
+        concurrent upserts of the same task are serialized by `_lock_tasks` instead.
+        """
+        update_values: dict[str, tp.Any] = {column: values[column] for column in update_columns}
+        if event_time_column.key == 'started_at':
+            update_values['status'] = self._started_status(values['started_at'])
+        update_query = (
+            sa.update(self.task)
+            .where(self.task.id == values['id'], event_time_column.is_distinct_from(values[event_time_column.key]))
+            .values(update_values)
+            .returning(*self._summary_columns())
+        )
+        task_row = (await session.execute(update_query)).first()
+        if task_row is None:
+            existing_task = await session.execute(sa.select(self.task.id).where(self.task.id == values['id']))
+            if existing_task.first() is not None:
+                return None
+            insert_query = sa.insert(self.task).values(values).returning(*self._summary_columns())
+            task_row = (await session.execute(insert_query)).first()
+        return None if task_row is None else TaskSummary.model_validate(task_row)
+
+    def _started_status(self, started_at: tp.Any) -> sa.ColumnElement[int]:
+        """
+        Status set by a started event applied to an existing task.
+
+        A started event delivered after the executed one (retried or replayed from the spool) keeps
+        the final status, only a new run started after the task finished makes it in progress again.
+        """
+        return sa.case(
+            (
+                sa.or_(self.task.finished_at.is_(None), self.task.finished_at < started_at),
+                TaskStatus.IN_PROGRESS.value,
+            ),
+            else_=self.task.status,
+        )
+
+    @staticmethod
+    async def _lock_tasks(session: AsyncSession, task_ids: list[uuid.UUID]) -> None:
+        """
+        Take transaction-level advisory locks on task ids.
+
+        Locks are taken in the same order by every transaction, so concurrent batches can't deadlock.
+        """
+        lock_keys = sorted({task_id.int & LOCK_KEY_MASK for task_id in task_ids})
+        await session.execute(
+            sa.text('SELECT pg_advisory_xact_lock(lock_key) FROM unnest(CAST(:lock_keys AS bigint[])) AS lock_key'),
+            {'lock_keys': lock_keys},
+        )
+
+    def _summary_columns(self) -> list[InstrumentedAttribute[tp.Any]]:
+        return [getattr(self.task, field) for field in TaskSummary.model_fields]
+
+    async def _increment_stats(
+        self,
+        session: AsyncSession,
+        stats_increments: dict[tuple[str, dt.datetime], _StatsIncrement],
+    ) -> None:
+        insert = pg_insert if self.task is PostgresTask else sqlite_insert
+        least, greatest = (sa.func.least, sa.func.greatest) if self.task is PostgresTask else (sa.func.min, sa.func.max)
+        stmt = insert(self.stats)
+        current, new = self.stats, stmt.excluded
+        upsert_query = stmt.on_conflict_do_update(
+            index_elements=[self.stats.name, self.stats.bucket],
             set_={
-                'queued_at': stmt.excluded.queued_at,
-                'worker': stmt.excluded.worker,
-                'name': stmt.excluded.name,
-                'args': stmt.excluded.args,
-                'kwargs': stmt.excluded.kwargs,
-                'labels': stmt.excluded.labels,
+                'queued_count': current.queued_count + new.queued_count,
+                'started_count': current.started_count + new.started_count,
+                'completed_count': current.completed_count + new.completed_count,
+                'failed_count': current.failed_count + new.failed_count,
+                'duration_sum': current.duration_sum + new.duration_sum,
+                'duration_min': least(
+                    sa.func.coalesce(current.duration_min, new.duration_min),
+                    sa.func.coalesce(new.duration_min, current.duration_min),
+                ),
+                'duration_max': greatest(
+                    sa.func.coalesce(current.duration_max, new.duration_max),
+                    sa.func.coalesce(new.duration_max, current.duration_max),
+                ),
+                'duration_sketch': self._merge_sketches(current.duration_sketch, new.duration_sketch),
+                'wait_sketch': self._merge_sketches(current.wait_sketch, new.wait_sketch),
             },
         )
-        async with self._session_provider.session() as session, session.begin():
-            await session.execute(upsert_query)
+        # every transaction locks stats rows in the same order, so concurrent batches can't deadlock
+        rows = [
+            {'name': name, 'bucket': bucket, **increment.values()}
+            for (name, bucket), increment in sorted(
+                stats_increments.items(),
+                key=lambda item: (item[0][0], item[0][1].isoformat()),
+            )
+        ]
+        await session.execute(upsert_query, rows)
+        await self._merge_hourly_sketches(session, stats_increments)
 
-    async def update_task(
+    async def _merge_hourly_sketches(
         self,
-        task_id: uuid.UUID,
-        task_arguments: StartedTask | ExecutedTask,
+        session: AsyncSession,
+        stats_increments: dict[tuple[str, dt.datetime], _StatsIncrement],
     ) -> None:
-        async with self._session_provider.session() as session, session.begin():
-            existing_task_query = sa.select(self.task.id).where(self.task.id == task_id)
-            result = await session.execute(existing_task_query)
-            if result.scalar_one_or_none() is None:
-                # other transaction might have created the task, so we can ignore integrity errors here
-                with suppress(IntegrityError):
-                    async with session.begin_nested():
-                        await session.execute(
-                            sa.insert(self.task).values(
-                                id=task_id,
-                                name='unknown',
-                                status=TaskStatus.QUEUED.value,
-                                worker='unknown',
-                                args=[],
-                                kwargs={},
-                                labels={},
-                            )
-                        )
-            update_query = sa.update(self.task).where(self.task.id == task_id)
-            if isinstance(task_arguments, StartedTask):
-                task_status = TaskStatus.IN_PROGRESS
-                update_query = update_query.values(
-                    status=task_status.value,
-                    started_at=task_arguments.started_at,
-                    args=task_arguments.args,
-                    kwargs=task_arguments.kwargs,
-                    labels=task_arguments.labels,
-                    name=task_arguments.task_name,
-                    worker=task_arguments.worker or '',
-                )
-            else:
-                task_status = TaskStatus.FAILURE if task_arguments.error is not None else TaskStatus.COMPLETED
-                update_query = update_query.values(
-                    status=task_status.value,
-                    finished_at=task_arguments.finished_at,
-                    result=task_arguments.return_value.get('return_value'),
-                    error=task_arguments.error,
-                )
-            await session.execute(update_query)
+        """Merge latency sketches of stats increments into the hourly rollup."""
+        hourly_increments: dict[tuple[str, dt.datetime], _StatsIncrement] = {}
+        for (name, bucket), increment in stats_increments.items():
+            if not increment.duration_sketch.bins and not increment.wait_sketch.bins:
+                continue
+            hourly_increment = hourly_increments.setdefault((name, bucket.replace(minute=0)), _StatsIncrement())
+            hourly_increment.duration_sketch.merge(increment.duration_sketch)
+            hourly_increment.wait_sketch.merge(increment.wait_sketch)
+        if not hourly_increments:
+            return
+        insert = pg_insert if self.task is PostgresTask else sqlite_insert
+        stmt = insert(self.sketches)
+        upsert_query = stmt.on_conflict_do_update(
+            index_elements=[self.sketches.name, self.sketches.bucket],
+            set_={
+                'duration_sketch': self._merge_sketches(self.sketches.duration_sketch, stmt.excluded.duration_sketch),
+                'wait_sketch': self._merge_sketches(self.sketches.wait_sketch, stmt.excluded.wait_sketch),
+            },
+        )
+        rows = []
+        for (name, bucket), increment in sorted(
+            hourly_increments.items(),
+            key=lambda item: (item[0][0], item[0][1].isoformat()),
+        ):
+            values = increment.values()
+            rows.append(
+                {
+                    'name': name,
+                    'bucket': bucket,
+                    'duration_sketch': values['duration_sketch'],
+                    'wait_sketch': values['wait_sketch'],
+                }
+            )
+        await session.execute(upsert_query, rows)
+
+    def _merge_sketches(
+        self,
+        current_sketch: sa.ColumnElement[tp.Any],
+        new_sketch: sa.ColumnElement[tp.Any],
+    ) -> sa.ScalarSelect[tp.Any]:
+        """Build expression adding up counts of the same bins of two sketches stored as JSON objects."""
+        if self.task is PostgresTask:
+            each_bin, build_object = sa.func.jsonb_each_text, sa.func.jsonb_object_agg
+        else:
+            each_bin, build_object = sa.func.json_each, sa.func.json_group_object
+        bins = sa.union_all(
+            *(sa.select(each_bin(sketch).table_valued('key', 'value')) for sketch in (current_sketch, new_sketch))
+        ).subquery()
+        bin_counts = (
+            sa.select(bins.c.key, sa.func.sum(sa.cast(bins.c.value, sa.Integer)).label('count'))
+            .group_by(bins.c.key)
+            .subquery()
+        )
+        return sa.select(build_object(bin_counts.c.key, bin_counts.c.count)).scalar_subquery()
 
     async def batch_update(
         self,
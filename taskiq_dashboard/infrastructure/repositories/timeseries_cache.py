@@ -0,0 +1,58 @@
+import collections
+import datetime as dt
+import typing as tp
+
+from taskiq_dashboard.domain.dto.stats import TaskTimeseriesPoint
+
+
+EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+# number of cached time series (filter and interval combinations)
+TIMESERIES_CACHE_SIZE = 128
+
+# name and worker filters and interval in seconds
+TimeseriesKey: tp.TypeAlias = tuple[str | None, str | None, int]
+
+
+class TimeseriesCache:
+    """
+    Buckets of recently requested time series, shared by the stats repository reading them
+    and the task repository writing events.
+
+    Events are often delivered late (retries, spool replay, write-behind queue), so every written batch
+    drops cached buckets containing its timestamps. Series read while a batch was written are not cached,
+    as they may miss its events. The cache is per process: batches written by other processes
+    are not seen.
+    """
+
+    def __init__(self, max_size: int = TIMESERIES_CACHE_SIZE) -> None:
+        self._max_size = max_size
+        self._series: collections.OrderedDict[TimeseriesKey, dict[dt.datetime, TaskTimeseriesPoint]] = (
+            collections.OrderedDict()
+        )
+        # incremented on every invalidation, so series read before it are not stored
+        self._generation = 0
+
+    def get(self, key: TimeseriesKey) -> tuple[dict[dt.datetime, TaskTimeseriesPoint], int]:
+        """Take cached buckets of the series along with the generation to store them back with."""
+        return self._series.pop(key, {}), self._generation
+
+    def put(self, key: TimeseriesKey, points: dict[dt.datetime, TaskTimeseriesPoint], generation: int) -> None:
+        if generation != self._generation:
+            return
+        self._series[key] = points
+        if len(self._series) > self._max_size:
+            self._series.popitem(last=False)
+
+    def invalidate(self, events: tp.Iterable[tuple[str, dt.datetime]]) -> None:
+        """Drop cached buckets containing events, given as task name and event time."""
+        self._generation += 1
+        # SQLite returns naive timestamps, they are stored in UTC
+        event_times = {
+            (task_name, event_time if event_time.tzinfo is not None else event_time.replace(tzinfo=dt.timezone.utc))
+            for task_name, event_time in events
+        }
+        for (name, _, interval_seconds), points in self._series.items():
+            interval = dt.timedelta(seconds=interval_seconds)
+            for task_name, event_time in event_times:
+                if name is None or name == task_name:
+                    points.pop(EPOCH + (event_time - EPOCH) // interval * interval, None)
@@ -1,9 +1,14 @@
 from taskiq_dashboard.infrastructure.services.cleanup_service import CleanupService, PeriodicCleanupRunner
+from taskiq_dashboard.infrastructure.services.event_writer import DirectEventWriter, WriteBehindEventWriter
 from taskiq_dashboard.infrastructure.services.schema_service import SchemaService
+from taskiq_dashboard.infrastructure.services.task_broadcaster import InMemoryTaskBroadcaster
 
 
 __all__ = [
     'CleanupService',
+    'DirectEventWriter',
+    'InMemoryTaskBroadcaster',
     'PeriodicCleanupRunner',
     'SchemaService',
+    'WriteBehindEventWriter',
 ]
@@ -2,18 +2,32 @@ import asyncio
 import contextlib
 import datetime as dt
 import logging
+import typing as tp
 
 import sqlalchemy as sa
 
 from taskiq_dashboard.domain.dto.cleanup import CleanupResult
-from taskiq_dashboard.domain.services import AbstractCleanupService
-from taskiq_dashboard.infrastructure.database.schemas import PostgresTask, SqliteTask
+from taskiq_dashboard.domain.services import AbstractCleanupService, AbstractSchemaService
+from taskiq_dashboard.infrastructure.database.schemas import (
+    PostgresTask,
+    PostgresTaskSketches,
+    PostgresTaskStats,
+    SqliteTask,
+    SqliteTaskSketches,
+    SqliteTaskStats,
+)
 from taskiq_dashboard.infrastructure.database.session_provider import AsyncPostgresSessionProvider
 from taskiq_dashboard.infrastructure.settings import CleanupSettings
 
 
 logger = logging.getLogger(__name__)
 
+# partition drop waits for running queries on the tasks table no longer than this
+PARTITION_DROP_LOCK_TIMEOUT = '5s'
+# time covered by one row of the per minute stats and the hourly sketches rollups
+STATS_BUCKET_WIDTH = dt.timedelta(minutes=1)
+SKETCHES_BUCKET_WIDTH = dt.timedelta(hours=1)
+
 
 class CleanupService(AbstractCleanupService):
     """Service for cleaning up old tasks from the database."""
@@ -26,6 +40,8 @@ class CleanupService(AbstractCleanupService):
     ) -> None:
         self._session_provider = session_provider
         self._task = task_model
+        self._stats = PostgresTaskStats if task_model is PostgresTask else SqliteTaskStats
+        self._sketches = PostgresTaskSketches if task_model is PostgresTask else SqliteTaskSketches
         self._settings = settings
 
     async def cleanup(self) -> CleanupResult:
@@ -33,12 +49,15 @@ class CleanupService(AbstractCleanupService):
             return CleanupResult()
 
         result = CleanupResult()
-        result.deleted_by_ttl = await self.cleanup_by_ttl(self._settings.ttl_days)
-        result.deleted_by_count = await self.cleanup_by_count(self._settings.max_tasks)
+        await self._cleanup_by_ttl(self._settings.ttl_days, result)
+        await self._cleanup_by_count(self._settings.max_tasks, result)
+        if self._settings.stats_ttl_days is not None:
+            await self._delete_expired_rollups(self._settings.stats_ttl_days)
 
         logger.info(
-            'Cleanup completed: deleted %d tasks (TTL: %d, count limit: %d)',
+            'Cleanup completed: deleted %d tasks in %d batches (TTL: %d, count limit: %d)',
             result.deleted_by_ttl + result.deleted_by_count,
+            result.batches_count,
             result.deleted_by_ttl,
             result.deleted_by_count,
         )
@@ -46,36 +65,136 @@ class CleanupService(AbstractCleanupService):
         return result
 
     async def cleanup_by_ttl(self, ttl_days: int) -> int:
+        result = CleanupResult()
+        await self._cleanup_by_ttl(ttl_days, result)
+        return result.deleted_by_ttl
+
+    async def cleanup_by_count(self, max_tasks: int) -> int:
+        result = CleanupResult()
+        await self._cleanup_by_count(max_tasks, result)
+        return result.deleted_by_count
+
+    async def _cleanup_by_ttl(self, ttl_days: int, result: CleanupResult) -> None:
         cutoff_date = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=ttl_days)
-        task_timestamp = sa.func.coalesce(
-            self._task.finished_at,
-            self._task.started_at,
-            self._task.queued_at,
+        if self._session_provider.storage_type == 'postgres':
+            await self._drop_expired_partitions(cutoff_date, result)
+        async for deleted_count in self._delete_oldest(self._task_timestamp() < cutoff_date):
+            result.deleted_by_ttl += deleted_count
+            result.batches_count += 1
+            logger.debug('Cleanup by TTL progress: deleted %d tasks', result.deleted_by_ttl)
+
+    async def _delete_expired_rollups(self, stats_ttl_days: int) -> None:
+        """
+        Delete stats and sketches rows of buckets ended more than `stats_ttl_days` ago.
+
+        Rollups have their own retention, so stats reach further back than the raw tasks. Every cleanup run
+        deletes only the buckets expired since the previous one, so a single statement per table is enough.
+        """
+        cutoff_date = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=stats_ttl_days)
+        deleted_count = 0
+        async with self._session_provider.session() as session:
+            for rollup, bucket_width in ((self._stats, STATS_BUCKET_WIDTH), (self._sketches, SKETCHES_BUCKET_WIDTH)):
+                result = await session.execute(sa.delete(rollup).where(rollup.bucket <= cutoff_date - bucket_width))
+                deleted_count += result.rowcount or 0  # ty: ignore[unresolved-attribute]
+        if deleted_count:
+            logger.info('Cleanup by stats TTL deleted %d stats rows', deleted_count)
+
+    async def _drop_expired_partitions(self, cutoff_date: dt.datetime, result: CleanupResult) -> None:
+        """
+        Detach and drop partitions of a partitioned tasks table queued entirely before the cutoff.
+
+        Dropping a partition frees its space at once and leaves no dead rows for vacuum. Tasks are
+        matched by `queued_at` here, so a task queued before the cutoff but finished after it is dropped
+        with its partition. Tasks left in the default partition are deleted row by row afterwards.
+        """
+        expired_partitions_query = sa.text(
+            'SELECT child.relname FROM pg_inherits '
+            'JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid '
+            'WHERE pg_inherits.inhparent = to_regclass(:table_name) '
+            "AND CAST(substring(pg_get_expr(child.relpartbound, child.oid) FROM 'TO \\(''([^'']+)''\\)') "
+            'AS timestamptz) <= :cutoff_date '
+            'ORDER BY child.relname'
         )
-        query = sa.delete(self._task).where(task_timestamp < cutoff_date)
         async with self._session_provider.session() as session:
-            result = await session.execute(query)
-            return result.rowcount or 0  # ty: ignore[unresolved-attribute]
+            partitions_result = await session.execute(
+                expired_partitions_query,
+                {'table_name': self._task.__tablename__, 'cutoff_date': cutoff_date},
+            )
+            partition_names = partitions_result.scalars().all()
+            quote = session.bind.dialect.identifier_preparer.quote
 
-    async def cleanup_by_count(self, max_tasks: int) -> int:
+        for partition_name in partition_names:
+            try:
+                async with self._session_provider.session() as session:
+                    await session.execute(sa.text(f"SET LOCAL lock_timeout = '{PARTITION_DROP_LOCK_TIMEOUT}'"))
+                    count_result = await session.execute(sa.text(f'SELECT count(*) FROM {quote(partition_name)}'))  # noqa: S608
+                    deleted_count = count_result.scalar() or 0
+                    await session.execute(
+                        sa.text(
+                            f'ALTER TABLE {quote(self._task.__tablename__)} DETACH PARTITION {quote(partition_name)}'
+                        )
+                    )
+                    await session.execute(sa.text(f'DROP TABLE {quote(partition_name)}'))
+            except sa.exc.DBAPIError:
+                logger.warning('Failed to drop expired partition %s', partition_name, exc_info=True)
+                continue
+            result.deleted_by_ttl += deleted_count
+            result.batches_count += 1
+            logger.info('Dropped expired partition %s with %d tasks', partition_name, deleted_count)
+
+    async def _cleanup_by_count(self, max_tasks: int, result: CleanupResult) -> None:
         async with self._session_provider.session() as session:
             count_query = sa.select(sa.func.count()).select_from(self._task)
-            result = await session.execute(count_query)
-            total_count = result.scalar() or 0
+            total_count = (await session.execute(count_query)).scalar() or 0
 
-            if total_count <= max_tasks:
-                return 0
+        if total_count <= max_tasks:
+            return
 
-            tasks_to_delete = total_count - max_tasks
-            task_timestamp = sa.func.coalesce(
-                self._task.finished_at,
-                self._task.started_at,
-                self._task.queued_at,
+        async for deleted_count in self._delete_oldest(sa.true(), limit=total_count - max_tasks):
+            result.deleted_by_count += deleted_count
+            result.batches_count += 1
+            logger.debug('Cleanup by count progress: deleted %d tasks', result.deleted_by_count)
+
+    async def _delete_oldest(
+        self,
+        condition: sa.ColumnElement[bool],
+        limit: int | None = None,
+    ) -> tp.AsyncGenerator[int, None]:
+        """
+        Delete the oldest tasks matching condition in batches of `batch_size`.
+
+        Every batch is a separate short transaction followed by a pause, so locks are released
+        and event ingestion proceeds while a large cleanup is running. On Postgres rows locked
+        by ingestion are skipped and left for the next cleanup.
+
+        Yields:
+            Number of tasks deleted by each batch.
+        """
+        remaining = limit
+        while remaining is None or remaining > 0:
+            batch_size = self._settings.batch_size if remaining is None else min(self._settings.batch_size, remaining)
+            oldest_tasks = (
+                sa.select(self._task.id).where(condition).order_by(self._task_timestamp().asc()).limit(batch_size)
             )
-            subquery = sa.select(self._task.id).order_by(task_timestamp.asc()).limit(tasks_to_delete)
-            delete_query = sa.delete(self._task).where(self._task.id.in_(subquery))
-            result = await session.execute(delete_query)
-            return result.rowcount or 0  # ty: ignore[unresolved-attribute]
+            if self._session_provider.storage_type == 'postgres':
+                oldest_tasks = oldest_tasks.with_for_update(skip_locked=True)
+            async with self._session_provider.session() as session:
+                result = await session.execute(sa.delete(self._task).where(self._task.id.in_(oldest_tasks)))
+                deleted_count: int = result.rowcount or 0  # ty: ignore[unresolved-attribute]
+            if deleted_count:
+                yield deleted_count
+            if deleted_count < batch_size:
+                return
+            if remaining is not None:
+                remaining -= deleted_count
+            await asyncio.sleep(self._settings.batch_pause_seconds)
+
+    def _task_timestamp(self) -> sa.ColumnElement[dt.datetime]:
+        return sa.func.coalesce(
+            self._task.finished_at,
+            self._task.started_at,
+            self._task.queued_at,
+        )
 
 
 class PeriodicCleanupRunner:
@@ -85,8 +204,10 @@ class PeriodicCleanupRunner:
         self,
         cleanup_service: AbstractCleanupService,
         interval_hours: int,
+        schema_service: AbstractSchemaService | None = None,
     ) -> None:
         self._cleanup_service = cleanup_service
+        self._schema_service = schema_service
         self._interval_seconds = interval_hours * 3600
         self._task: asyncio.Task[None] | None = None
         self._stop_event = asyncio.Event()
@@ -113,6 +234,11 @@ class PeriodicCleanupRunner:
                     timeout=self._interval_seconds,
                 )
             except asyncio.TimeoutError:  # noqa: PERF203
+                if self._schema_service is not None:
+                    try:
+                        await self._schema_service.create_partitions()
+                    except Exception:
+                        logger.exception('Error during creation of partitions')
                 try:
                     await self._cleanup_service.cleanup()
                 except Exception:
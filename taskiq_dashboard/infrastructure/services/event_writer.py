@@ -0,0 +1,159 @@
+import asyncio
+import collections
+import contextlib
+import logging
+import time
+import uuid
+
+import sqlalchemy as sa
+
+from taskiq_dashboard.domain.dto.ingestion import IngestionMetrics
+from taskiq_dashboard.domain.dto.task import TaskEventData
+from taskiq_dashboard.domain.repositories import AbstractTaskRepository
+from taskiq_dashboard.domain.services import AbstractEventWriter, AbstractTaskBroadcaster, EventQueueFullError
+from taskiq_dashboard.infrastructure.settings import IngestionSettings
+
+
+logger = logging.getLogger(__name__)
+
+# errors that may pass when the same events are written again
+TRANSIENT_ERRORS = (sa.exc.OperationalError, sa.exc.InterfaceError, sa.exc.TimeoutError, OSError, asyncio.TimeoutError)
+# SQLSTATE class of serialization failures and deadlocks on Postgres
+TRANSACTION_ROLLBACK_SQLSTATE_CLASS = '40'
+
+
+def _is_transient_error(error: Exception) -> bool:
+    if isinstance(error, TRANSIENT_ERRORS):
+        return True
+    if not isinstance(error, sa.exc.DBAPIError):
+        return False
+    sqlstate = getattr(error.orig, 'sqlstate', None) or ''
+    return error.connection_invalidated or sqlstate.startswith(TRANSACTION_ROLLBACK_SQLSTATE_CLASS)
+
+
+class DirectEventWriter(AbstractEventWriter):
+    """Writes events while the request is handled, the sender waits for the database transaction."""
+
+    def __init__(
+        self,
+        task_repository: AbstractTaskRepository,
+        task_broadcaster: AbstractTaskBroadcaster,
+    ) -> None:
+        self._task_repository = task_repository
+        self._task_broadcaster = task_broadcaster
+        self._metrics = IngestionMetrics(is_write_behind_enabled=False)
+
+    async def write(
+        self,
+        events: list[tuple[uuid.UUID, TaskEventData]],
+    ) -> None:
+        changed_tasks = await self._task_repository.apply_events(events)
+        self._task_broadcaster.publish(changed_tasks)
+        self._metrics.accepted_count += len(events)
+        self._metrics.written_count += len(events)
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def metrics(self) -> IngestionMetrics:
+        return self._metrics.model_copy()
+
+
+class WriteBehindEventWriter(AbstractEventWriter):
+    """
+    Accepts events into a bounded in-memory queue written to the database by a background task.
+
+    The sender gets a response without waiting for the database, and bursts of events are written
+    in batches with a few multi-row statements. When the queue is full new events are rejected,
+    so the sender slows down instead of the dashboard running out of memory or database connections.
+    Events still in the queue are written on graceful shutdown and lost if the process is killed.
+
+    A batch failed with a transient error (lost connection, lock or serialization conflict) is retried
+    as a whole. Other errors are caused by the events themselves, so the batch is split in halves until
+    the failing events are isolated, and only they are dropped.
+    """
+
+    def __init__(
+        self,
+        task_repository: AbstractTaskRepository,
+        task_broadcaster: AbstractTaskBroadcaster,
+        settings: IngestionSettings,
+    ) -> None:
+        self._task_repository = task_repository
+        self._task_broadcaster = task_broadcaster
+        self._settings = settings
+        self._queue: collections.deque[tuple[uuid.UUID, TaskEventData]] = collections.deque()
+        self._has_events = asyncio.Event()
+        self._stop_event = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._metrics = IngestionMetrics(is_write_behind_enabled=True, queue_capacity=settings.queue_size)
+
+    async def write(
+        self,
+        events: list[tuple[uuid.UUID, TaskEventData]],
+    ) -> None:
+        if len(self._queue) + len(events) > self._settings.queue_size:
+            self._metrics.rejected_count += len(events)
+            raise EventQueueFullError(self._settings.retry_after_seconds)
+        self._queue.extend(events)
+        self._metrics.accepted_count += len(events)
+        self._has_events.set()
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+        logger.info('Write-behind of task events started with queue size %d', self._settings.queue_size)
+
+    async def stop(self) -> None:
+        self._stop_event.set()
+        self._has_events.set()
+        if self._task:
+            await self._task
+        logger.info('Write-behind of task events stopped')
+
+    def metrics(self) -> IngestionMetrics:
+        return self._metrics.model_copy(update={'queue_depth': len(self._queue)})
+
+    async def _run(self) -> None:
+        while self._queue or not self._stop_event.is_set():
+            if not self._queue:
+                self._has_events.clear()
+                await self._has_events.wait()
+                continue
+            if len(self._queue) < self._settings.batch_size and not self._stop_event.is_set():
+                # let the rest of a burst arrive, so it is written with fewer statements
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=self._settings.flush_interval_seconds)
+            batch = [self._queue.popleft() for _ in range(min(self._settings.batch_size, len(self._queue)))]
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[tuple[uuid.UUID, TaskEventData]]) -> None:
+        for attempt in range(1, self._settings.max_flush_attempts + 1):
+            started_at = time.perf_counter()
+            try:
+                changed_tasks = await self._task_repository.apply_events(batch)
+            except Exception as error:
+                self._metrics.failed_flush_count += 1
+                is_transient = _is_transient_error(error)
+                if not is_transient and len(batch) > 1:
+                    logger.warning('Failed to write %d task events, writing them in halves', len(batch), exc_info=True)
+                    middle = len(batch) // 2
+                    await self._flush(batch[:middle])
+                    await self._flush(batch[middle:])
+                    return
+                if not is_transient or attempt == self._settings.max_flush_attempts:
+                    logger.exception('Failed to write %d task events, events are dropped', len(batch))
+                    self._metrics.dropped_count += len(batch)
+                    return
+                logger.warning('Failed to write %d task events, retrying', len(batch), exc_info=True)
+                await asyncio.sleep(self._settings.retry_after_seconds)
+                continue
+            flush_seconds = time.perf_counter() - started_at
+            self._metrics.flush_count += 1
+            self._metrics.written_count += len(batch)
+            self._metrics.last_flush_seconds = flush_seconds
+            self._metrics.max_flush_seconds = max(self._metrics.max_flush_seconds or 0.0, flush_seconds)
+            self._task_broadcaster.publish(changed_tasks)
+            return
@@ -1,19 +1,278 @@
+import datetime as dt
+import logging
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.schema import CreateIndex, CreateTable, DropIndex
+
 from taskiq_dashboard.domain.services import AbstractSchemaService
-from taskiq_dashboard.infrastructure.database.schemas import PostgresTask, SqliteTask, sa_metadata
+from taskiq_dashboard.infrastructure.database.schemas import (
+    SQLITE_TASK_NAME_SEARCH_DDL,
+    PostgresTask,
+    PostgresTaskSketches,
+    PostgresTaskStats,
+    SqliteTask,
+    SqliteTaskSketches,
+    SqliteTaskStats,
+)
 from taskiq_dashboard.infrastructure.database.session_provider import AsyncPostgresSessionProvider
 
 
+logger = logging.getLogger(__name__)
+
+PARTITION_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+
+
 class SchemaService(AbstractSchemaService):
     def __init__(
         self,
         session_provider: AsyncPostgresSessionProvider,
         table_name: str = 'taskiq_dashboard__tasks',
+        partition_interval: dt.timedelta | None = None,
+        premade_partitions_count: int = 7,
     ) -> None:
+        """
+        Args:
+            session_provider: Database session provider.
+            table_name: Name of the tasks table.
+            partition_interval: Range of `queued_at` covered by one partition of a new Postgres tasks table.
+                The table is not partitioned when omitted.
+            premade_partitions_count: Number of partitions created ahead of the current one.
+        """
         self._session_provider = session_provider
+        self._partition_interval = partition_interval
+        self._premade_partitions_count = premade_partitions_count
         self._table = SqliteTask if self._session_provider.storage_type == 'sqlite' else PostgresTask
         self._table.__tablename__ = table_name
+        self._stats_table = SqliteTaskStats if self._session_provider.storage_type == 'sqlite' else PostgresTaskStats
+        self._sketches_table = (
+            SqliteTaskSketches if self._session_provider.storage_type == 'sqlite' else PostgresTaskSketches
+        )
 
     async def create_schema(self) -> None:
-        async with self._session_provider.session() as session:
-            connection = await session.connection()
-            await connection.run_sync(sa_metadata.create_all, tables=[self._table.__table__])  # ty: ignore[unresolved-attribute]
+        tables: list[sa.Table] = [
+            self._table.__table__,  # ty: ignore[unresolved-attribute]
+            self._stats_table.__table__,  # ty: ignore[unresolved-attribute]
+            self._sketches_table.__table__,  # ty: ignore[unresolved-attribute]
+        ]
+        async with self._session_provider.autocommit_connection() as connection:
+            is_partitioned = False
+            if self._partition_interval is not None and connection.dialect.name == 'postgresql':
+                is_partitioned = await self._create_partitioned_table(connection)
+            for table in tables:
+                await connection.execute(CreateTable(table, if_not_exists=True))
+                await self._add_missing_columns(connection, table)
+            if connection.dialect.name == 'postgresql':
+                extensions = await self._create_extensions(connection, tables)
+            else:
+                extensions = set()
+                await self._create_sqlite_name_search(connection)
+            for table in tables:
+                await self._create_indexes(
+                    connection,
+                    table,
+                    extensions,
+                    is_partitioned=is_partitioned and table is self._table.__table__,  # ty: ignore[unresolved-attribute]
+                )
+            if is_partitioned:
+                await self._create_partitions(connection)
+
+    async def create_partitions(self) -> None:
+        if self._partition_interval is None or self._session_provider.storage_type != 'postgres':
+            return
+        async with self._session_provider.autocommit_connection() as connection:
+            if await self._table_kind(connection) == 'p':
+                await self._create_partitions(connection)
+
+    async def _table_kind(self, connection: AsyncConnection) -> str | None:
+        """Return Postgres `relkind` of the tasks table: `r` for a plain table, `p` for a partitioned one."""
+        result = await connection.execute(
+            sa.text('SELECT relkind FROM pg_class WHERE oid = to_regclass(:table_name)'),
+            {'table_name': self._table.__table__.name},  # ty: ignore[unresolved-attribute]
+        )
+        return result.scalar()
+
+    async def _create_partitioned_table(self, connection: AsyncConnection) -> bool:
+        """
+        Create the tasks table range-partitioned by `queued_at`.
+
+        A partitioned table can't have a primary key on `id` alone, so it gets a plain index on `id`
+        and uniqueness of tasks is kept by the repository. Tasks without `queued_at` (placeholders created
+        by events arriving before the queued one) and late events outside of premade partitions are stored
+        in the default partition.
+
+        Returns:
+            Whether the tasks table is partitioned. Existing plain table is kept as is.
+        """
+        table: sa.Table = self._table.__table__  # ty: ignore[unresolved-attribute]
+        table_kind = await self._table_kind(connection)
+        if table_kind == 'p':
+            return True
+        if table_kind is not None:
+            logger.warning('Table %s already exists and is not partitioned, partitioning is not applied', table.name)
+            return False
+        partitioned_table = sa.Table(
+            table.name,
+            sa.MetaData(),
+            *(sa.Column(column.name, column.type, nullable=column.nullable) for column in table.columns),
+            postgresql_partition_by='RANGE (queued_at)',
+        )
+        quote = connection.dialect.identifier_preparer.quote
+        await connection.execute(CreateTable(partitioned_table))
+        await connection.execute(
+            sa.text(f'CREATE TABLE {quote(table.name + "_default")} PARTITION OF {quote(table.name)} DEFAULT')
+        )
+        await connection.execute(
+            sa.text(f'CREATE INDEX {quote("ix_" + table.name + "_id")} ON {quote(table.name)} (id)')
+        )
+        return True
+
+    async def _create_partitions(self, connection: AsyncConnection) -> None:
+        """
+        Create partitions from the current one up to `premade_partitions_count` ahead.
+
+        Partition bounds are aligned to multiples of the partition interval since the Unix epoch.
+        """
+        if self._partition_interval is None:
+            return
+        table: sa.Table = self._table.__table__  # ty: ignore[unresolved-attribute]
+        quote = connection.dialect.identifier_preparer.quote
+        now = dt.datetime.now(dt.timezone.utc)
+        lower_bound = PARTITION_EPOCH + (now - PARTITION_EPOCH) // self._partition_interval * self._partition_interval
+        for _ in range(self._premade_partitions_count + 1):
+            upper_bound = lower_bound + self._partition_interval
+            partition_name = f'{table.name}_p{lower_bound:%Y%m%d}'
+            try:
+                await connection.execute(
+                    sa.text(
+                        f'CREATE TABLE IF NOT EXISTS {quote(partition_name)} PARTITION OF {quote(table.name)} '
+                        f"FOR VALUES FROM ('{lower_bound.isoformat()}') TO ('{upper_bound.isoformat()}')"
+                    )
+                )
+            except sa.exc.DBAPIError:
+                # e.g. the default partition already holds tasks of this range or the interval was changed
+                logger.warning('Failed to create partition %s', partition_name, exc_info=True)
+            lower_bound = upper_bound
+
+    @staticmethod
+    async def _add_missing_columns(connection: AsyncConnection, table: sa.Table) -> None:
+        """
+        Add columns missing in existing deployments.
+
+        Only nullable columns are added: that doesn't rewrite the table and rows stored before
+        the migration get NULL in the new columns.
+        """
+
+        def get_column_names(sync_connection: sa.Connection) -> set[str]:
+            return {column['name'] for column in sa.inspect(sync_connection).get_columns(table.name)}
+
+        existing_column_names = await connection.run_sync(get_column_names)
+        quote = connection.dialect.identifier_preparer.quote
+        # another dashboard instance may add the same column concurrently, Postgres can skip it
+        if_not_exists = ' IF NOT EXISTS' if connection.dialect.name == 'postgresql' else ''
+        for column in table.columns:
+            if column.name in existing_column_names:
+                continue
+            if not column.nullable:
+                logger.warning('Column %s is missing in %s and can not be added automatically', column.name, table.name)
+                continue
+            column_type = column.type.compile(dialect=connection.dialect)
+            logger.info('Adding column %s to %s', column.name, table.name)
+            await connection.execute(
+                sa.text(f'ALTER TABLE {quote(table.name)} ADD COLUMN{if_not_exists} {quote(column.name)} {column_type}')
+            )
+
+    @staticmethod
+    async def _create_extensions(connection: AsyncConnection, tables: list[sa.Table]) -> set[str]:
+        """
+        Create Postgres extensions required by indexes.
+
+        Creating an extension needs extra privileges. Without them indexes depending on the extension
+        are skipped and the dashboard works without them.
+
+        Returns:
+            Names of extensions installed in the database.
+        """
+        required_extensions = {
+            index.info['required_extension']
+            for table in tables
+            for index in table.indexes
+            if 'required_extension' in index.info
+        }
+        for extension in sorted(required_extensions):
+            try:
+                await connection.execute(sa.text(f'CREATE EXTENSION IF NOT EXISTS {extension}'))
+            except sa.exc.DBAPIError:  # noqa: PERF203
+                logger.warning('Failed to create extension %s, indexes using it are skipped', extension, exc_info=True)
+        result = await connection.execute(sa.text('SELECT extname FROM pg_extension'))
+        return set(result.scalars().all())
+
+    @staticmethod
+    async def _create_sqlite_name_search(connection: AsyncConnection) -> None:
+        """
+        Create FTS5 trigram table used for substring search over task names.
+
+        Requires SQLite 3.34+ built with FTS5, otherwise search falls back to scanning the tasks table.
+        """
+        result = await connection.execute(sa.text("SELECT 1 FROM sqlite_master WHERE name = 'tasks_name_fts'"))
+        is_created = result.scalar() is not None
+        try:
+            for statement in SQLITE_TASK_NAME_SEARCH_DDL:
+                await connection.execute(sa.text(statement))
+        except sa.exc.DBAPIError:
+            logger.warning('SQLite does not support FTS5 trigram tokenizer, task search is not indexed', exc_info=True)
+            return
+        if not is_created:
+            # index tasks inserted before the search table existed
+            await connection.execute(sa.text("INSERT INTO tasks_name_fts(tasks_name_fts) VALUES ('rebuild')"))
+
+    async def _create_indexes(
+        self,
+        connection: AsyncConnection,
+        table: sa.Table,
+        extensions: set[str],
+        *,
+        is_partitioned: bool = False,
+    ) -> None:
+        """
+        Add indexes missing in existing deployments.
+
+        On Postgres indexes are built with `CREATE INDEX CONCURRENTLY`, so the table stays writable
+        while the migration runs. Creation of a single index may fail (e.g. another dashboard instance
+        builds the same index at the same time); such index is retried on the next startup.
+        Postgres can't build an index on a partitioned table concurrently, so there it is built
+        with a regular `CREATE INDEX` and propagated to every partition.
+        """
+        if connection.dialect.name == 'postgresql':
+            await self._drop_invalid_indexes(connection, table)
+        for index in sorted(table.indexes, key=lambda index: str(index.name)):
+            required_extension = index.info.get('required_extension')
+            if required_extension is not None and required_extension not in extensions:
+                continue
+            create_index: sa.Executable = CreateIndex(index, if_not_exists=True)
+            if is_partitioned:
+                statement = str(create_index.compile(dialect=connection.dialect))
+                create_index = sa.text(statement.replace(' CONCURRENTLY', '', 1))
+            try:
+                await connection.execute(create_index)
+            except sa.exc.DBAPIError:
+                logger.warning('Failed to create index %s on %s', index.name, table.name, exc_info=True)
+
+    @staticmethod
+    async def _drop_invalid_indexes(connection: AsyncConnection, table: sa.Table) -> None:
+        """
+        Drop indexes left invalid by an interrupted `CREATE INDEX CONCURRENTLY`.
+
+        `IF NOT EXISTS` would skip them otherwise and the index would never be used by the planner.
+        """
+        query = sa.text(
+            'SELECT index_class.relname FROM pg_index '
+            'JOIN pg_class AS index_class ON index_class.oid = pg_index.indexrelid '
+            'WHERE pg_index.indrelid = CAST(:table_name AS regclass) AND NOT pg_index.indisvalid'
+        )
+        result = await connection.execute(query, {'table_name': table.name})
+        invalid_index_names = set(result.scalars().all())
+        for index in table.indexes:
+            if index.name in invalid_index_names:
+                logger.warning('Rebuilding invalid index %s on %s', index.name, table.name)
+                await connection.execute(DropIndex(index, if_exists=True))
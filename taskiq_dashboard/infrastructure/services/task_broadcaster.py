@@ -0,0 +1,55 @@
+import asyncio
+import contextlib
+import logging
+import typing as tp
+
+from taskiq_dashboard.domain.dto.task import TaskSummary
+from taskiq_dashboard.domain.services import AbstractTaskBroadcaster
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Subscription:
+    def __init__(self, queue_size: int) -> None:
+        self.queue: asyncio.Queue[TaskSummary] = asyncio.Queue(maxsize=queue_size)
+        self.dropped_count = 0
+
+    def __aiter__(self) -> '_Subscription':
+        return self
+
+    async def __anext__(self) -> TaskSummary:
+        return await self.queue.get()
+
+
+class InMemoryTaskBroadcaster(AbstractTaskBroadcaster):
+    """
+    Broadcaster living in the dashboard process.
+
+    Every subscriber has its own bounded queue, so a slow viewer loses updates instead of slowing down
+    ingestion or other viewers. Only viewers connected to the same process as the ingesting worker
+    receive updates.
+    """
+
+    def __init__(self, queue_size: int = 1000) -> None:
+        self._queue_size = queue_size
+        self._subscriptions: set[_Subscription] = set()
+
+    def publish(self, tasks: list[TaskSummary]) -> None:
+        for subscription in self._subscriptions:
+            for task in tasks:
+                try:
+                    subscription.queue.put_nowait(task)
+                except asyncio.QueueFull:  # noqa: PERF203
+                    subscription.dropped_count += 1
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self) -> tp.AsyncGenerator[tp.AsyncIterator[TaskSummary], None]:
+        subscription = _Subscription(self._queue_size)
+        self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+            if subscription.dropped_count:
+                logger.warning('Live task stream subscriber dropped %d updates', subscription.dropped_count)
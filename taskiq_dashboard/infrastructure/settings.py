@@ -20,6 +20,10 @@ class PostgresSettings(pydantic_settings.BaseSettings):
     min_pool_size: int = 1
     max_pool_size: int = 5
 
+    is_partitioning_enabled: bool = False
+    partition_interval_days: int = 1
+    premade_partitions_count: int = 7
+
     @property
     def dsn(self) -> SecretStr:
         """
@@ -103,6 +107,8 @@ class APISettings(pydantic_settings.BaseSettings):
     port: int = 8000
     token: SecretStr = SecretStr('supersecret')
     trusted_hosts: str = '*'
+    # Granian HTTP mode: 'auto' serves HTTP/1.1 and HTTP/2 (with prior knowledge on plain HTTP), '1' or '2' only one
+    http: tp.Literal['auto', '1', '2'] = 'auto'
 
     model_config = pydantic_settings.SettingsConfigDict(
         extra='allow',
@@ -114,9 +120,44 @@ class CleanupSettings(pydantic_settings.BaseSettings):
 
     is_enabled: bool = True
     ttl_days: int = 30
+    # stats outlive raw tasks, None keeps them forever
+    stats_ttl_days: int | None = 365
     max_tasks: int = 10_000
     periodic_interval_hours: int = 24
     is_cleanup_on_startup_enabled: bool = True
+    batch_size: int = 1000
+    batch_pause_seconds: float = 0.1
+
+    model_config = pydantic_settings.SettingsConfigDict(
+        extra='ignore',
+    )
+
+
+class IngestionSettings(pydantic_settings.BaseSettings):
+    """Settings for receiving task events."""
+
+    # serve event routes with a raw ASGI handler instead of FastAPI routes
+    is_fast_path_enabled: bool = True
+    is_write_behind_enabled: bool = False
+    queue_size: int = 50_000
+    batch_size: int = 1000
+    flush_interval_seconds: float = 0.05
+    max_flush_attempts: int = 3
+    retry_after_seconds: int = 1
+    # limit for request bodies sent with gzip or zstd content encoding
+    max_decompressed_body_bytes: int = 64 * 1024 * 1024
+
+    model_config = pydantic_settings.SettingsConfigDict(
+        extra='ignore',
+    )
+
+
+class TemplateSettings(pydantic_settings.BaseSettings):
+    """Settings for rendering HTML pages."""
+
+    # check template files for changes on every render, for development
+    is_auto_reload_enabled: bool = False
+    is_precompile_enabled: bool = True
 
     model_config = pydantic_settings.SettingsConfigDict(
         extra='ignore',
@@ -132,10 +173,14 @@ class Settings(pydantic_settings.BaseSettings):
     sqlite: SqliteSettings = SqliteSettings()
 
     cleanup: CleanupSettings = CleanupSettings()
+    ingestion: IngestionSettings = IngestionSettings()
+    templates: TemplateSettings = TemplateSettings()
 
     model_config = pydantic_settings.SettingsConfigDict(
         env_nested_delimiter='__',
         env_prefix='TASKIQ_DASHBOARD__',
+        # lets optional settings be disabled from the environment
+        env_parse_none_str='null',
         env_file=('conf/.env', os.getenv('ENV_FILE', '.env')),
         env_file_encoding='utf-8',
         extra='ignore',
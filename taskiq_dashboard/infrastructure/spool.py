@@ -0,0 +1,104 @@
+import contextlib
+import json
+import sqlite3
+import threading
+import typing as tp
+from pathlib import Path
+
+
+class EventSpool:
+    """
+    Task events kept in a local SQLite file until the dashboard accepts them.
+
+    The file survives worker restarts and can be shared by worker processes of one host, SQLite
+    serializes their writes. Once stored events exceed `max_bytes` (of UTF-8 encoded JSON), the oldest
+    of them are dropped. Their total size is kept up to date by triggers, so appends don't rescan the spool.
+    Methods block on disk I/O, so async code calls them in a thread.
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def open(self) -> None:
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        connection.execute('PRAGMA journal_mode=WAL')
+        self._connection = connection
+        with self._transaction():
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS events '
+                '(id INTEGER PRIMARY KEY AUTOINCREMENT, size INTEGER NOT NULL, event TEXT NOT NULL)'
+            )
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS spool_size (id INTEGER PRIMARY KEY CHECK (id = 1), total INTEGER NOT NULL)'
+            )
+            # spools created before the total was kept are summed up once
+            connection.execute(
+                'INSERT OR IGNORE INTO spool_size (id, total) SELECT 1, coalesce(sum(size), 0) FROM events'
+            )
+            connection.execute(
+                'CREATE TRIGGER IF NOT EXISTS events_inserted AFTER INSERT ON events '
+                'BEGIN UPDATE spool_size SET total = total + new.size; END'
+            )
+            connection.execute(
+                'CREATE TRIGGER IF NOT EXISTS events_deleted AFTER DELETE ON events '
+                'BEGIN UPDATE spool_size SET total = total - old.size; END'
+            )
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    @contextlib.contextmanager
+    def _transaction(self) -> tp.Iterator[sqlite3.Connection]:
+        if self._connection is None:
+            raise RuntimeError('Event spool is not opened')
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
+
+    def append(self, events: list[dict[str, tp.Any]]) -> int:
+        """
+        Store events after the already spooled ones.
+
+        Returns:
+            Number of the oldest events dropped to keep the spool within `max_bytes`.
+        """
+        serialized_events = [json.dumps(event, ensure_ascii=False, separators=(',', ':')) for event in events]
+        with self._transaction() as connection:
+            connection.executemany(
+                'INSERT INTO events (size, event) VALUES (?, ?)',
+                [(len(event.encode()), event) for event in serialized_events],
+            )
+            excess = connection.execute('SELECT total FROM spool_size').fetchone()[0] - self.max_bytes
+            if excess <= 0:
+                return 0
+            # the oldest events are dropped until their total size covers the excess, only they are scanned
+            last_dropped_id, dropped_size = 0, 0
+            for event_id, size in connection.execute('SELECT id, size FROM events ORDER BY id'):
+                last_dropped_id, dropped_size = event_id, dropped_size + size
+                if dropped_size >= excess:
+                    break
+            return connection.execute('DELETE FROM events WHERE id <= ?', (last_dropped_id,)).rowcount
+
+    def read(self, limit: int) -> list[tuple[int, dict[str, tp.Any]]]:
+        """Read the oldest events with their ids, events stay in the spool until removed."""
+        with self._transaction() as connection:
+            rows = connection.execute('SELECT id, event FROM events ORDER BY id LIMIT ?', (limit,)).fetchall()
+        return [(event_id, json.loads(event)) for event_id, event in rows]
+
+    def remove(self, event_ids: list[int]) -> None:
+        with self._transaction() as connection:
+            connection.executemany('DELETE FROM events WHERE id = ?', [(event_id,) for event_id in event_ids])
+
+    def count(self) -> int:
+        with self._transaction() as connection:
+            return connection.execute('SELECT count(*) FROM events').fetchone()[0]
@@ -1,8 +1,17 @@
 import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import json
+import random
+import time
+import zlib
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from logging import getLogger
-from typing import Any
-from urllib.parse import urljoin
+from pathlib import Path
+from typing import Any, Literal
+from urllib.parse import urljoin, urlsplit
 
 import httpx
 from taskiq.abc.middleware import TaskiqMiddleware
@@ -10,9 +19,192 @@ from taskiq.compat import model_dump
 from taskiq.message import TaskiqMessage
 from taskiq.result import TaskiqResult
 
+from taskiq_dashboard.domain.dto.task import MAX_EVENT_BATCH_SIZE, TruncatedValue
+from taskiq_dashboard.infrastructure.compression import ContentEncoding, compress, import_zstandard
+from taskiq_dashboard.infrastructure.spool import EventSpool
+
 
 logger = getLogger('taskiq_dashboard.admin_middleware')
 
+BATCH_ENDPOINT = 'api/tasks/batch'
+# longest preview of a value replaced because of the size limit
+TRUNCATED_PREVIEW_BYTES = 1024
+# values with larger containers are measured by serializing them, the C encoder is faster than walking them
+MAX_ESTIMATED_ITEMS = 32
+# responses asking to slow down, events of the rejected request are sent again after `Retry-After`
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+OverflowPolicy = Literal['drop_oldest', 'drop_started', 'sample']
+CircuitState = Literal['closed', 'open', 'half_open']
+
+
+@dataclasses.dataclass
+class EventCounters:
+    """
+    Numbers of events sent to the dashboard, dropped on overflow, lost in failed requests and spooled to disk.
+
+    Also counts retried requests and how many times the circuit breaker was opened.
+    """
+
+    sent: int = 0
+    dropped: int = 0
+    failed: int = 0
+    spooled: int = 0
+    retries: int = 0
+    circuit_opened: int = 0
+
+
+class CircuitBreaker:
+    """
+    Stop sending requests to the dashboard after `failure_threshold` consecutive failures.
+
+    The circuit stays open for `reset_timeout` seconds, then a single probe request is let through
+    (half-open state). Its success closes the circuit, its failure opens it again. A probe answered with
+    a request to retry later proves neither, so another probe is let through once the wait is over.
+    A probe that never reports back, e.g. cancelled on overflow, is replaced by another one after `reset_timeout`.
+    """
+
+    def __init__(self, failure_threshold: int | None, reset_timeout: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state: CircuitState = 'closed'
+        self._failures_count = 0
+        self._probe_at = 0.0
+
+    def allow_request(self) -> bool:
+        """Check if a request can be sent, the first check after the open period lets the probe through."""
+        if self.state == 'closed':
+            return True
+        now = time.monotonic()
+        if now < self._probe_at:
+            return False
+        self.state = 'half_open'
+        self._probe_at = now + self.reset_timeout
+        return True
+
+    def is_open(self) -> bool:
+        """Check if requests are rejected, unlike `allow_request` the check doesn't take the probe slot."""
+        return self.state != 'closed' and time.monotonic() < self._probe_at
+
+    def record_success(self) -> None:
+        self.state = 'closed'
+        self._failures_count = 0
+
+    def release_probe(self) -> None:
+        """Let the next request through as a probe, the current one neither succeeded nor failed."""
+        if self.state == 'half_open':
+            self._probe_at = time.monotonic()
+
+    def record_failure(self) -> bool:
+        """Count a failed request, returns True if the circuit is opened by it."""
+        self._failures_count += 1
+        if self.state == 'open':
+            return False
+        if self.state == 'closed' and (self.failure_threshold is None or self._failures_count < self.failure_threshold):
+            return False
+        self.state = 'open'
+        self._probe_at = time.monotonic() + self.reset_timeout
+        return True
+
+
+def _retry_after_seconds(response: httpx.Response) -> float:
+    """Delay requested by the `Retry-After` header, given in seconds or as HTTP date."""
+    value = response.headers.get('retry-after')
+    if value is None:
+        return DEFAULT_RETRY_AFTER_SECONDS
+    with contextlib.suppress(ValueError):
+        return max(float(value), 0.0)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER_SECONDS
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _check_http2_support() -> None:
+    """
+    Check that optional `h2` package required by `httpx` for HTTP/2 is installed.
+
+    Raises:
+        ImportError: if the package is not installed.
+    """
+    try:
+        import h2  # noqa: F401, PLC0415
+    except ImportError as e:
+        raise ImportError(
+            'h2 is required for HTTP/2. Please install it with "pip install httpx[http2]".',
+        ) from e
+
+
+def _max_scalar_json_size(value: Any) -> int | None:
+    """Upper bound of JSON representation size of a scalar in bytes, None for other values."""
+    if isinstance(value, str):
+        if not value.isprintable():
+            # control characters are escaped as \uXXXX
+            return len(value) * 6 + 2
+        # quotes and backslashes are escaped with a backslash, other characters take up to 4 bytes in UTF-8
+        return len(value) * (2 if value.isascii() else 4) + 2
+    if value is None or isinstance(value, bool):
+        return 5
+    if isinstance(value, int):
+        # every 3 bits take at least one decimal digit, plus the sign
+        return value.bit_length() // 3 + 2
+    if isinstance(value, float):
+        return 24
+    return None
+
+
+def _max_json_size(value: Any, max_bytes: int) -> int:
+    """
+    Estimate upper bound of JSON representation size of value in bytes without serializing it.
+
+    Counting stops once the bound passes `max_bytes`. Containers with more than `MAX_ESTIMATED_ITEMS` items
+    are serialized faster by the C encoder than walked, so they get `max_bytes + 1` as well as values
+    of types serialized with `default`.
+    """
+    scalar_size = _max_scalar_json_size(value)
+    if scalar_size is not None:
+        return scalar_size
+    if not isinstance(value, (dict, list, tuple)) or len(value) > MAX_ESTIMATED_ITEMS:
+        return max_bytes + 1
+    items = value.values() if isinstance(value, dict) else value
+    size = len(value) + 2
+    if isinstance(value, dict):
+        # keys are quoted and followed by a colon
+        size += len(value) * 3
+        for key in value:
+            key_size = _max_scalar_json_size(key)
+            if key_size is None:
+                return max_bytes + 1
+            size += key_size
+    for item in items:
+        if size > max_bytes:
+            break
+        item_size = _max_scalar_json_size(item)
+        size += item_size if item_size is not None else _max_json_size(item, max_bytes - size)
+    return size
+
+
+def _limit_size(value: Any, max_bytes: int | None) -> Any:
+    """Replace value by `TruncatedValue` placeholder if its JSON representation is longer than `max_bytes`."""
+    if max_bytes is None:
+        return value
+    # most values are far below the limit, they are sent without being serialized one more time to measure them
+    if _max_json_size(value, max_bytes) <= max_bytes:
+        return value
+    serialized = json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=str).encode()
+    if len(serialized) <= max_bytes:
+        return value
+    truncated_value = TruncatedValue(
+        preview=serialized[: min(max_bytes, TRUNCATED_PREVIEW_BYTES)].decode(errors='ignore'),
+        size=len(serialized),
+        sha256=hashlib.sha256(serialized).hexdigest(),
+    )
+    return truncated_value.to_payload()
+
 
 class DashboardMiddleware(TaskiqMiddleware):
     """A Taskiq middleware that reports task lifecycle events to an external admin dashboard API.
@@ -25,25 +217,140 @@ class DashboardMiddleware(TaskiqMiddleware):
         url (str): Base URL of the admin API.
         api_token (str): Token used for authenticating with the API.
         timeout (float): Timeout (in seconds) for API requests.
+        http2 (bool): Send requests over HTTP/2 (requires the `h2` package), events are multiplexed
+            over a single connection. Plain `http://` URLs use HTTP/2 without the HTTP/1.1 upgrade,
+            the dashboard served by Granian accepts it. Defaults to False (HTTP/1.1).
+        max_connections (int | None): Limit of connections to the dashboard, further requests wait for a free one.
+            Defaults to 100, None disables the limit.
+        max_keepalive_connections (int | None): Limit of idle connections kept open. Defaults to 20.
+        keepalive_expiry (float | None): Time (in seconds) an idle connection is kept open. Defaults to 5.
         broker_name (str): Name of the broker instance to include in the payload. Defaults to 'default_broker'.
-        _pending (set[asyncio.Task]): Set of currently running background request tasks.
+        batch_size (int | None): If set, events are buffered and sent to the bulk endpoint
+            once this many events are collected, at most `MAX_EVENT_BATCH_SIZE` per request.
+            Defaults to None (one request per event).
+        batch_interval (float): Maximum time (in seconds) an event can stay in the buffer
+            before it is flushed. Used only when batching is enabled.
+        compression (str | None): Compress request bodies with 'gzip' or 'zstd' (requires the `zstandard` package).
+            Defaults to None (no compression).
+        compression_threshold (int): Request bodies smaller than this number of bytes are sent uncompressed.
+        max_args_bytes (int | None): Positional arguments with longer JSON representation are replaced
+            by a truncated preview with their size and sha256 hash. Defaults to None (no limit).
+        max_kwargs_bytes (int | None): Same limit for keyword arguments.
+        max_return_value_bytes (int | None): Same limit for return value.
+        coalesce_window (float | None): If set, the started event is held back for this many seconds,
+            a task finished within the window is reported with a single combined event instead of two.
+            Defaults to None (started event is sent right away).
+        max_pending_events (int | None): Limit of events buffered and carried by running requests. Once reached,
+            events are dropped according to `overflow_policy`, so a slow dashboard can't exhaust worker memory.
+            Defaults to 10000, None disables the limit.
+        overflow_policy (str): 'drop_oldest' drops the oldest pending event to make room for a new one,
+            'drop_started' drops started events first, 'sample' keeps new events only for the
+            `overflow_sample_rate` fraction of task ids (all events of a sampled task are kept).
+        overflow_sample_rate (float): Fraction of task ids (0..1) kept by the 'sample' policy.
+        spool_path (str | Path | None): SQLite file keeping events that failed to send because the dashboard
+            is unreachable, they are sent again once it is back. Defaults to None (such events are lost).
+        spool_max_bytes (int): Size limit of spooled events, the oldest ones are dropped beyond it.
+        spool_replay_batch_size (int): Number of spooled events sent with one request, at most `MAX_EVENT_BATCH_SIZE`.
+        spool_replay_interval (float): Time (in seconds) between requests replaying spooled events,
+            limits the load on the dashboard while it recovers.
+        max_retries (int): Number of times a request failed with a connection error or a `5xx` response
+            is sent again before its events are spooled or lost. Defaults to 3.
+        retry_backoff (float): Base delay (in seconds) of the exponential backoff between retries,
+            the delay before retry N is picked at random from 0 to `retry_backoff * 2 ** (N - 1)`.
+        retry_backoff_max (float): Upper limit of the delay between retries.
+        circuit_breaker_threshold (int | None): Number of consecutive failed requests opening the circuit breaker.
+            While it is open, events are buffered instead of sent. Defaults to 5, None disables the breaker.
+        circuit_breaker_reset_timeout (float): Time (in seconds) the circuit stays open before a probe request.
+        circuit_breaker (CircuitBreaker): State of the circuit breaker.
+        counters (EventCounters): Numbers of sent, dropped, failed and spooled events, retries and circuit openings.
+        _pending (dict[asyncio.Task, int]): Currently running background request tasks, oldest first,
+            with the number of events each of them carries.
         _client (httpx.AsyncClient | None): HTTP client session used for sending requests.
+        _buffer (list[dict]): Events waiting to be sent in the next batch.
+        _flush_task (asyncio.Task | None): Background task flushing the buffer by timer.
+        _deferred_started (dict[str, tuple[dict, asyncio.Task]]): Held back started events by task id
+            with the timers sending them once the coalescing window is over.
+        _paused_until (float): Monotonic time before which no requests are sent, set by `Retry-After`.
+        _spool (EventSpool | None): Local storage of events that failed to send.
+        _replay_task (asyncio.Task | None): Background task sending spooled events.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         url: str,
         api_token: str,
         timeout: float = 5.0,
         broker_name: str = 'default_broker',
+        *,
+        http2: bool = False,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        batch_size: int | None = None,
+        batch_interval: float = 1.0,
+        compression: ContentEncoding | None = None,
+        compression_threshold: int = 1024,
+        max_args_bytes: int | None = None,
+        max_kwargs_bytes: int | None = None,
+        max_return_value_bytes: int | None = None,
+        coalesce_window: float | None = None,
+        max_pending_events: int | None = 10_000,
+        overflow_policy: OverflowPolicy = 'drop_oldest',
+        overflow_sample_rate: float = 0.1,
+        spool_path: str | Path | None = None,
+        spool_max_bytes: int = 100 * 1024 * 1024,
+        spool_replay_batch_size: int = 500,
+        spool_replay_interval: float = 1.0,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        retry_backoff_max: float = 10.0,
+        circuit_breaker_threshold: int | None = 5,
+        circuit_breaker_reset_timeout: float = 30.0,
     ) -> None:
         super().__init__()
         self.url = url
         self.timeout = timeout
         self.api_token = api_token
         self.broker_name = broker_name
-        self._pending: set[asyncio.Task[Any]] = set()
+        if http2:
+            _check_http2_support()
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        if compression == 'zstd':
+            import_zstandard()
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.max_args_bytes = max_args_bytes
+        self.max_kwargs_bytes = max_kwargs_bytes
+        self.max_return_value_bytes = max_return_value_bytes
+        self.coalesce_window = coalesce_window
+        self.max_pending_events = max_pending_events
+        self.overflow_policy = overflow_policy
+        self.overflow_sample_rate = overflow_sample_rate
+        self.spool_replay_batch_size = spool_replay_batch_size
+        self.spool_replay_interval = spool_replay_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.circuit_breaker = CircuitBreaker(circuit_breaker_threshold, circuit_breaker_reset_timeout)
+        self.counters = EventCounters()
+        self._pending: dict[asyncio.Task[Any], int] = {}
+        self._in_flight_events = 0
         self._client: httpx.AsyncClient | None = None
+        self._buffer: list[dict[str, Any]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self._deferred_started: dict[str, tuple[dict[str, Any], asyncio.Task[None]]] = {}
+        self._paused_until = 0.0
+        self._is_overflowing = False
+        self._closing = asyncio.Event()
+        self._spool = None if spool_path is None else EventSpool(spool_path, spool_max_bytes)
+        self._replay_task: asyncio.Task[None] | None = None
 
     @staticmethod
     def _now_iso() -> str:
@@ -52,50 +359,314 @@ class DashboardMiddleware(TaskiqMiddleware):
     def _get_client(self) -> httpx.AsyncClient:
         """Create and cache session."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                # HTTP/2 is negotiated with TLS, plain HTTP needs it from the first request (prior knowledge)
+                http1=not self.http2 or urlsplit(self.url).scheme == 'https',
+                http2=self.http2,
+            )
         return self._client
 
     async def startup(self) -> None:
         """Startup method to initialize httpx.AsyncClient."""
         self._client = self._get_client()
+        self._closing.clear()
+        if self.batch_size is not None:
+            self._start_flush_loop()
+        if self._spool is not None:
+            await asyncio.to_thread(self._spool.open)
+            self._replay_task = asyncio.create_task(self._replay_spool_periodically(self._spool))
 
     async def shutdown(self) -> None:
-        """Shutdown method to run all pending requests and close the session."""
+        """Shutdown method to send buffered events, run all pending requests and close the session."""
+        self._closing.set()
+        if self._replay_task is not None:
+            self._replay_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._replay_task
+            self._replay_task = None
+        for task_id in list(self._deferred_started):
+            payload, timer = self._deferred_started.pop(task_id)
+            timer.cancel()
+            await self._send_event(task_id, 'started', payload)
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+        # sent even if the dashboard asked to wait or the circuit is open, it's the last chance
+        await self._flush(is_forced=True)
         if self._pending:
             await asyncio.gather(*self._pending, return_exceptions=True)
+        if self._buffer:
+            events, self._buffer = self._buffer, []
+            if self._spool is None:
+                logger.warning('%s events rejected by the dashboard during shutdown are dropped', len(events))
+                self.counters.dropped += len(events)
+            else:
+                await self._spool_events(events)
+        if self._spool is not None:
+            await asyncio.to_thread(self._spool.close)
         if self._client is not None:
             await self._client.aclose()
 
-    async def _spawn_request(
-        self,
-        endpoint: str,
-        payload: dict[str, Any],
-    ) -> None:
+    async def _spawn_request(self, events: list[dict[str, Any]]) -> None:
         """Fire and forget helper.
 
         Start an async POST to the admin API, keep the resulting Task in _pending
-        so it can be awaited/cleaned during graceful shutdown.
+        so it can be awaited/cleaned during graceful shutdown. A single event is sent
+        to its own endpoint unless batching is enabled, several events to the bulk endpoint.
         """
+        if self.batch_size is None and len(events) == 1:
+            endpoint = f'api/tasks/{events[0]["taskId"]}/{events[0]["event"]}'
+            payload = events[0]['data']
+        else:
+            endpoint, payload = BATCH_ENDPOINT, {'events': events}
 
         async def _send() -> None:
-            client = self._get_client()
-            try:
-                resp = await client.post(
-                    urljoin(self.url, endpoint),
-                    headers={'access-token': self.api_token},
-                    json=payload,
-                )
-                resp.raise_for_status()
-                if not resp.is_success:
-                    logger.error('POST %s - %s', endpoint, resp.status_code)
-            except httpx.HTTPStatusError:
-                logger.exception('POST %s failed with HTTP error', endpoint)
-            except httpx.RequestError:
-                logger.exception('POST %s failed with request error', endpoint)
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    if not await self._wait_before_retry(attempt):
+                        break
+                    self.counters.retries += 1
+                try:
+                    resp = await self._post(endpoint, payload)
+                except httpx.RequestError:
+                    logger.exception('POST %s failed with request error', endpoint)
+                else:
+                    if not resp.is_server_error or resp.status_code in RETRY_AFTER_STATUS_CODES:
+                        self._handle_response(endpoint, resp, events)
+                        return
+                    logger.error('POST %s failed with HTTP error %s', endpoint, resp.status_code)
+                self._record_failure()
+                # the dashboard is down, retries would only add to the load
+                if self.circuit_breaker.state != 'closed':
+                    break
+            await self._spool_events(events)
 
         task = asyncio.create_task(_send())
-        self._pending.add(task)
-        task.add_done_callback(self._pending.discard)
+        self._pending[task] = len(events)
+        self._in_flight_events += len(events)
+        task.add_done_callback(self._forget_request)
+
+    async def _post(self, endpoint: str, payload: dict[str, Any]) -> httpx.Response:
+        # serialized the same way as `httpx` does for `json=` argument
+        content = json.dumps(payload, ensure_ascii=False, separators=(',', ':'), allow_nan=False).encode()
+        headers = {'access-token': self.api_token, 'content-type': 'application/json'}
+        if self.compression is not None and len(content) >= self.compression_threshold:
+            content = compress(content, self.compression)
+            headers['content-encoding'] = self.compression
+        return await self._get_client().post(urljoin(self.url, endpoint), headers=headers, content=content)
+
+    def _handle_response(self, endpoint: str, resp: httpx.Response, events: list[dict[str, Any]]) -> None:
+        """Count events of a request the dashboard answered, or put them back if it asked to retry later."""
+        if resp.status_code in RETRY_AFTER_STATUS_CODES:
+            # an overloaded dashboard is neither recovered nor down
+            self.circuit_breaker.release_probe()
+            self._pause(_retry_after_seconds(resp))
+            # events move from the running request back to the buffer, so the pending count doesn't change
+            self._buffer[:0] = events
+            self._start_flush_loop()
+            return
+        self.circuit_breaker.record_success()
+        if resp.is_success:
+            self.counters.sent += len(events)
+        else:
+            logger.error('POST %s failed with HTTP error %s', endpoint, resp.status_code)
+            self.counters.failed += len(events)
+
+    def _record_failure(self) -> None:
+        if self.circuit_breaker.record_failure():
+            self.counters.circuit_opened += 1
+            logger.warning(
+                'Dashboard requests keep failing, circuit breaker is open for %.1f seconds',
+                self.circuit_breaker.reset_timeout,
+            )
+
+    async def _wait_before_retry(self, attempt: int) -> bool:
+        """Sleep with jittered exponential backoff, returns False if the middleware is shut down meanwhile."""
+        # full jitter spreads retries of all workers over time instead of sending them at once
+        delay = random.uniform(0, min(self.retry_backoff_max, self.retry_backoff * 2 ** (attempt - 1)))  # noqa: S311
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._closing.wait(), delay)
+        return not self._closing.is_set()
+
+    def _forget_request(self, task: asyncio.Task[Any]) -> None:
+        self._in_flight_events -= self._pending.pop(task, 0)
+
+    def _pause(self, delay: float) -> None:
+        """Stop sending requests for `delay` seconds."""
+        logger.warning('Dashboard asked to retry in %.1f seconds, sending of events is paused', delay)
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+    def _is_paused(self) -> bool:
+        return time.monotonic() < self._paused_until
+
+    def _can_send(self) -> bool:
+        return not self._is_paused() and self.circuit_breaker.allow_request()
+
+    async def _spool_events(self, events: list[dict[str, Any]]) -> None:
+        """Keep events that failed to send in the spool, they are lost if spooling is disabled."""
+        if self._spool is None:
+            self.counters.failed += len(events)
+            return
+        dropped_count = await asyncio.to_thread(self._spool.append, events)
+        self.counters.spooled += len(events)
+        self.counters.dropped += dropped_count
+        if dropped_count:
+            logger.warning('Spool size limit reached, %s oldest events are dropped', dropped_count)
+
+    async def _replay_spool_periodically(self, spool: EventSpool) -> None:
+        while True:
+            await asyncio.sleep(self.spool_replay_interval)
+            if not self._is_paused() and not self.circuit_breaker.is_open():
+                await self._replay_spool(spool)
+
+    async def _replay_spool(self, spool: EventSpool) -> None:
+        """Send the oldest batch of spooled events, they stay in the spool until the dashboard accepts them."""
+        spooled_events = await asyncio.to_thread(spool.read, min(self.spool_replay_batch_size, MAX_EVENT_BATCH_SIZE))
+        # the probe of a half-open circuit is taken only by a request that is actually sent
+        if not spooled_events or not self._can_send():
+            return
+        events = [event for _, event in spooled_events]
+        try:
+            resp = await self._post(BATCH_ENDPOINT, {'events': events})
+        except httpx.RequestError:
+            # the dashboard is still unreachable
+            self._record_failure()
+            return
+        if resp.is_server_error and resp.status_code not in RETRY_AFTER_STATUS_CODES:
+            self._record_failure()
+            return
+        if resp.status_code in RETRY_AFTER_STATUS_CODES:
+            self.circuit_breaker.release_probe()
+            self._pause(_retry_after_seconds(resp))
+            return
+        self.circuit_breaker.record_success()
+        if resp.is_success:
+            self.counters.sent += len(events)
+        else:
+            # rejected events would be replayed forever
+            logger.error(
+                'POST %s failed with HTTP error %s, spooled events are dropped', BATCH_ENDPOINT, resp.status_code
+            )
+            self.counters.failed += len(events)
+        await asyncio.to_thread(spool.remove, [event_id for event_id, _ in spooled_events])
+
+    def _admit(self, task_id: str, event: str) -> bool:
+        """Make room for a new event if the pending events limit is reached, returns False if it must be dropped."""
+        pending_events_count = len(self._buffer) + self._in_flight_events
+        if self.max_pending_events is None or pending_events_count < self.max_pending_events:
+            self._is_overflowing = False
+            return True
+        if not self._is_overflowing:
+            logger.warning(
+                'Dashboard is not keeping up with %s pending events, dropping events (%s)',
+                pending_events_count,
+                self.overflow_policy,
+            )
+            self._is_overflowing = True
+        if self.overflow_policy == 'drop_started':
+            if event == 'started':
+                return False
+            started_index = next((index for index, item in enumerate(self._buffer) if item['event'] == 'started'), None)
+            if started_index is not None:
+                del self._buffer[started_index]
+                self.counters.dropped += 1
+                return True
+        # task ids are hashed the same way by all workers, so every event of a sampled task is kept
+        elif self.overflow_policy == 'sample' and zlib.crc32(task_id.encode()) >= self.overflow_sample_rate * 2**32:
+            return False
+        return self._drop_oldest()
+
+    def _drop_oldest(self) -> bool:
+        """Drop the oldest buffered event or cancel the oldest running request, returns False if nothing is pending."""
+        if self._buffer:
+            del self._buffer[0]
+            self.counters.dropped += 1
+            return True
+        if not self._pending:
+            return False
+        oldest_request = next(iter(self._pending))
+        self.counters.dropped += self._pending[oldest_request]
+        self._forget_request(oldest_request)
+        oldest_request.cancel()
+        return True
+
+    async def _send_event(
+        self,
+        task_id: str,
+        event: str,
+        payload: dict[str, Any],
+    ) -> None:
+        """
+        Send event right away or put it into the buffer.
+
+        Events are buffered if batching is enabled, the dashboard asked to wait or the circuit breaker is open.
+        """
+        if not self._admit(task_id, event):
+            self.counters.dropped += 1
+            return
+        item = {'taskId': task_id, 'event': event, 'data': payload}
+        if self.batch_size is None and self._can_send():
+            await self._spawn_request([item])
+            return
+
+        self._buffer.append(item)
+        self._start_flush_loop()
+        if self.batch_size is not None and len(self._buffer) >= self.batch_size:
+            await self._flush()
+
+    async def _flush(self, *, is_forced: bool = False) -> None:
+        """
+        Send buffered events, with one request per `batch_size` events if batching is enabled.
+
+        Events piled up while sending was stopped are sent in batches of at most `MAX_EVENT_BATCH_SIZE`,
+        the most the dashboard accepts in one request.
+
+        Sending stops while the dashboard asked to wait or the circuit breaker is open, unless forced on shutdown.
+        A half-open circuit breaker lets only the first request through.
+        """
+        chunk_size = min(self.batch_size or MAX_EVENT_BATCH_SIZE, MAX_EVENT_BATCH_SIZE)
+        while self._buffer and (is_forced or self._can_send()):
+            events = self._buffer[:chunk_size]
+            del self._buffer[:chunk_size]
+            await self._spawn_request(events)
+
+    def _defer_started(self, task_id: str, payload: dict[str, Any]) -> None:
+        """Hold started event back for the coalescing window, it is sent by timer unless the task finishes first."""
+
+        async def _send_later() -> None:
+            await asyncio.sleep(self.coalesce_window or 0.0)
+            deferred_started = self._deferred_started.get(task_id)
+            # the event may be replaced by a later started event of the same task with its own timer
+            if deferred_started is None or deferred_started[1] is not timer:
+                return
+            del self._deferred_started[task_id]
+            await self._send_event(task_id, 'started', payload)
+
+        previous = self._deferred_started.pop(task_id, None)
+        if previous is not None:
+            previous[1].cancel()
+        timer = asyncio.create_task(_send_later())
+        self._deferred_started[task_id] = (payload, timer)
+
+    def _start_flush_loop(self) -> None:
+        if self._closing.is_set():
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.batch_interval)
+            await self._flush()
+
+    def _limit_args(self, args: list[Any]) -> list[Any]:
+        limited_args = _limit_size(args, self.max_args_bytes)
+        # positional arguments stay a list for the dashboard
+        return limited_args if limited_args is args else [limited_args]
 
     async def post_send(self, message: TaskiqMessage) -> None:
         """
@@ -107,11 +678,12 @@ class DashboardMiddleware(TaskiqMiddleware):
         :param message: kicked message.
         """
         dict_message: dict[str, Any] = model_dump(message)
-        await self._spawn_request(
-            f'api/tasks/{message.task_id}/queued',
+        await self._send_event(
+            message.task_id,
+            'queued',
             {
-                'args': dict_message['args'],
-                'kwargs': dict_message['kwargs'],
+                'args': self._limit_args(dict_message['args']),
+                'kwargs': _limit_size(dict_message['kwargs'], self.max_kwargs_bytes),
                 'labels': dict_message['labels'],
                 'queuedAt': self._now_iso(),
                 'taskName': message.task_name,
@@ -130,17 +702,18 @@ class DashboardMiddleware(TaskiqMiddleware):
         :return: modified message.
         """
         dict_message: dict[str, Any] = model_dump(message)
-        await self._spawn_request(
-            f'api/tasks/{message.task_id}/started',
-            {
-                'args': dict_message['args'],
-                'kwargs': dict_message['kwargs'],
-                'labels': dict_message['labels'],
-                'startedAt': self._now_iso(),
-                'taskName': message.task_name,
-                'worker': self.broker_name,
-            },
-        )
+        payload = {
+            'args': self._limit_args(dict_message['args']),
+            'kwargs': _limit_size(dict_message['kwargs'], self.max_kwargs_bytes),
+            'labels': dict_message['labels'],
+            'startedAt': self._now_iso(),
+            'taskName': message.task_name,
+            'worker': self.broker_name,
+        }
+        if self.coalesce_window is None:
+            await self._send_event(message.task_id, 'started', payload)
+        else:
+            self._defer_started(message.task_id, payload)
         return message
 
     async def post_execute(
@@ -158,12 +731,17 @@ class DashboardMiddleware(TaskiqMiddleware):
         :param result: result of execution for current task.
         """
         dict_result: dict[str, Any] = model_dump(result)
-        await self._spawn_request(
-            f'api/tasks/{message.task_id}/executed',
-            {
-                'finishedAt': self._now_iso(),
-                'executionTime': result.execution_time,
-                'error': None if result.error is None else repr(result.error),
-                'returnValue': {'return_value': dict_result['return_value']},
-            },
-        )
+        payload = {
+            'finishedAt': self._now_iso(),
+            'executionTime': result.execution_time,
+            'error': None if result.error is None else repr(result.error),
+            'returnValue': {'return_value': _limit_size(dict_result['return_value'], self.max_return_value_bytes)},
+            'taskName': message.task_name,
+        }
+        deferred_started = self._deferred_started.pop(message.task_id, None)
+        if deferred_started is None:
+            await self._send_event(message.task_id, 'executed', payload)
+            return
+        started_payload, timer = deferred_started
+        timer.cancel()
+        await self._send_event(message.task_id, 'started_executed', {**started_payload, **payload})
@@ -1,3 +1,4 @@
+import datetime as dt
 import os
 import uuid
 from collections.abc import AsyncGenerator, Generator
@@ -10,11 +11,11 @@ from sqlalchemy_utils import create_database, database_exists, drop_database
 
 from tests.integration.factories import PostgresTaskFactory
 
-from taskiq_dashboard.domain.repositories import AbstractTaskRepository
+from taskiq_dashboard.domain.repositories import AbstractStatsRepository, AbstractTaskRepository
 from taskiq_dashboard.infrastructure import get_settings
-from taskiq_dashboard.infrastructure.database.schemas import PostgresTask
+from taskiq_dashboard.infrastructure.database.schemas import PostgresTask, PostgresTaskSketches, PostgresTaskStats
 from taskiq_dashboard.infrastructure.database.session_provider import AsyncPostgresSessionProvider
-from taskiq_dashboard.infrastructure.repositories import TaskRepository
+from taskiq_dashboard.infrastructure.repositories import StatsRepository, TaskRepository, TimeseriesCache
 from taskiq_dashboard.infrastructure.services.schema_service import SchemaService
 from taskiq_dashboard.infrastructure.settings import PostgresSettings
 
@@ -75,10 +76,47 @@ async def cleanup_database(session_provider: AsyncPostgresSessionProvider) -> As
     yield
     async with session_provider.session() as session:
         await session.execute(sa.delete(PostgresTask))
+        await session.execute(sa.delete(PostgresTaskStats))
+        await session.execute(sa.delete(PostgresTaskSketches))
+
+
+@pytest.fixture
+def timeseries_cache() -> TimeseriesCache:
+    return TimeseriesCache()
 
 
 @pytest.fixture
 async def task_service(
     session_provider: AsyncPostgresSessionProvider,
+    timeseries_cache: TimeseriesCache,
 ) -> AbstractTaskRepository:
-    return TaskRepository(session_provider=session_provider, task_model=PostgresTask)
+    return TaskRepository(session_provider=session_provider, task_model=PostgresTask, timeseries_cache=timeseries_cache)
+
+
+@pytest.fixture
+async def stats_repository(
+    session_provider: AsyncPostgresSessionProvider,
+    timeseries_cache: TimeseriesCache,
+) -> AbstractStatsRepository:
+    return StatsRepository(
+        session_provider=session_provider, stats_model=PostgresTaskStats, timeseries_cache=timeseries_cache
+    )
+
+
+@pytest.fixture
+async def partitioned_schema_service(
+    session_provider: AsyncPostgresSessionProvider,
+) -> AsyncGenerator[SchemaService]:
+    """Recreate the tasks table partitioned by day for the duration of a test."""
+    async with session_provider.session() as session:
+        await session.execute(sa.text(f'DROP TABLE {PostgresTask.__tablename__} CASCADE'))
+    schema_service = SchemaService(
+        session_provider,
+        partition_interval=dt.timedelta(days=1),
+        premade_partitions_count=2,
+    )
+    await schema_service.create_schema()
+    yield schema_service
+    async with session_provider.session() as session:
+        await session.execute(sa.text(f'DROP TABLE {PostgresTask.__tablename__} CASCADE'))
+    await SchemaService(session_provider).create_schema()
@@ -87,3 +87,59 @@ class TestAppHandlesMiddlewareRequests:
         assert task.status == TaskStatus.QUEUED
         assert task.args == message.args
         assert task.kwargs == message.kwargs
+
+    async def test_when_events_batch_send__then_all_events_applied_in_order(
+        self,
+        test_app: AsyncClient,
+        task_service,
+    ) -> None:
+        # Given
+        task_id = uuid.uuid4()
+        body = {
+            'events': [
+                {
+                    'taskId': str(task_id),
+                    'event': 'queued',
+                    'data': {
+                        'args': [1],
+                        'kwargs': {},
+                        'labels': {},
+                        'queuedAt': '2025-01-01T00:00:00',
+                        'taskName': 'my.process',
+                        'worker': 'test-broker',
+                    },
+                },
+                {
+                    'taskId': str(task_id),
+                    'event': 'started',
+                    'data': {
+                        'args': [1],
+                        'kwargs': {},
+                        'labels': {},
+                        'startedAt': '2025-01-01T00:00:01',
+                        'taskName': 'my.process',
+                        'worker': 'test-broker',
+                    },
+                },
+                {
+                    'taskId': str(task_id),
+                    'event': 'executed',
+                    'data': {
+                        'finishedAt': '2025-01-01T00:00:02',
+                        'executionTime': 1.0,
+                        'error': None,
+                        'returnValue': {'return_value': {'answer': 42}},
+                    },
+                },
+            ],
+        }
+
+        # When
+        response = await test_app.post('/api/tasks/batch', headers={'access-token': 'test-token'}, json=body)
+
+        # Then
+        assert response.status_code == 204
+        task = await task_service.get_task_by_id(task_id)
+        assert task is not None
+        assert task.status == TaskStatus.COMPLETED
+        assert task.result == {'answer': 42}
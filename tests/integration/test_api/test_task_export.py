@@ -0,0 +1,59 @@
+import csv
+import io
+import json
+from collections.abc import AsyncGenerator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from pydantic import SecretStr
+
+from tests.integration.factories import PostgresTaskFactory
+
+from taskiq_dashboard.api.application import get_application
+from taskiq_dashboard.domain.dto.task_status import TaskStatus
+from taskiq_dashboard.infrastructure import get_settings
+
+
+@pytest.fixture
+async def test_app() -> AsyncGenerator[AsyncClient]:
+    settings = get_settings()
+    settings.api.token = SecretStr('test-token')
+    async with AsyncClient(transport=ASGITransport(app=get_application()), base_url='http://test') as client:
+        yield client
+
+
+@pytest.mark.integration
+class TestTaskExport:
+    @pytest.mark.parametrize('result', [42, 'ok', True, 1.5])
+    async def test_when_exporting_task_with_scalar_result_as_ndjson__then_result_exported(
+        self,
+        test_app: AsyncClient,
+        result: object,
+    ) -> None:
+        # Given
+        task = await PostgresTaskFactory.create_async(status=TaskStatus.COMPLETED.value, result=result)
+
+        # When
+        response = await test_app.get('/tasks/export', params={'format': 'ndjson'})
+
+        # Then
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [(row['id'], row['result']) for row in rows] == [(str(task.id), result)]
+
+    @pytest.mark.parametrize('result', [42, 'ok', True, 1.5])
+    async def test_when_exporting_task_with_scalar_result_as_csv__then_result_exported(
+        self,
+        test_app: AsyncClient,
+        result: object,
+    ) -> None:
+        # Given
+        task = await PostgresTaskFactory.create_async(status=TaskStatus.COMPLETED.value, result=result)
+
+        # When
+        response = await test_app.get('/tasks/export', params={'format': 'csv'})
+
+        # Then
+        assert response.status_code == 200
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [(row['id'], row['result']) for row in rows] == [(str(task.id), str(result))]
@@ -1,13 +1,17 @@
 import datetime as dt
+import uuid
 
 import sqlalchemy as sa
 
 from tests.integration.factories import PostgresTaskFactory
 
+from taskiq_dashboard.domain.dto.task import StartedExecutedTask
 from taskiq_dashboard.domain.dto.task_status import TaskStatus
-from taskiq_dashboard.infrastructure.database.schemas import PostgresTask
+from taskiq_dashboard.domain.repositories import AbstractTaskRepository
+from taskiq_dashboard.infrastructure.database.schemas import PostgresTask, PostgresTaskSketches, PostgresTaskStats
 from taskiq_dashboard.infrastructure.database.session_provider import AsyncPostgresSessionProvider
 from taskiq_dashboard.infrastructure.services.cleanup_service import CleanupService
+from taskiq_dashboard.infrastructure.services.schema_service import SchemaService
 from taskiq_dashboard.infrastructure.settings import CleanupSettings
 
 
@@ -16,9 +20,7 @@ class TestCleanupService:
     async def _task_exists(session_provider: AsyncPostgresSessionProvider, task_id) -> bool:
         """Helper to check if a task exists in the database."""
         async with session_provider.session() as session:
-            result = await session.execute(
-                sa.select(PostgresTask.id).where(PostgresTask.id == task_id)
-            )
+            result = await session.execute(sa.select(PostgresTask.id).where(PostgresTask.id == task_id))
             return result.scalar_one_or_none() is not None
 
     async def test_when_cleanup_disabled__then_no_tasks_deleted(
@@ -333,6 +335,79 @@ class TestCleanupService:
         # Then
         assert deleted_count == 3
 
+    @staticmethod
+    async def _apply_task_events(task_service: AbstractTaskRepository, event_time: dt.datetime) -> None:
+        await task_service.apply_events(
+            [
+                (
+                    uuid.uuid4(),
+                    StartedExecutedTask(
+                        task_name='send_email',
+                        worker='worker',
+                        started_at=event_time,
+                        finished_at=event_time,
+                        execution_time=1.0,
+                    ),
+                )
+            ]
+        )
+
+    @staticmethod
+    async def _rollup_buckets(session_provider: AsyncPostgresSessionProvider) -> tuple[list, list]:
+        async with session_provider.session() as session:
+            stats_buckets = (await session.execute(sa.select(PostgresTaskStats.bucket))).scalars().all()
+            sketches_buckets = (await session.execute(sa.select(PostgresTaskSketches.bucket))).scalars().all()
+        return list(stats_buckets), list(sketches_buckets)
+
+    async def test_when_cleanup_by_ttl__then_stats_and_sketches_of_deleted_tasks_kept(
+        self,
+        session_provider: AsyncPostgresSessionProvider,
+        task_service: AbstractTaskRepository,
+    ) -> None:
+        # Given
+        cleanup_service = CleanupService(
+            session_provider=session_provider,
+            task_model=PostgresTask,
+            settings=CleanupSettings(is_enabled=True, ttl_days=30, stats_ttl_days=365),
+        )
+        event_time = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=60)
+        await self._apply_task_events(task_service, event_time)
+
+        # When
+        result = await cleanup_service.cleanup()
+
+        # Then
+        assert result.deleted_by_ttl == 1
+        stats_buckets, sketches_buckets = await self._rollup_buckets(session_provider)
+        assert stats_buckets == [event_time.replace(second=0, microsecond=0)]
+        assert sketches_buckets == [event_time.replace(minute=0, second=0, microsecond=0)]
+
+    async def test_when_stats_ttl_expired__then_stats_and_sketches_deleted(
+        self,
+        session_provider: AsyncPostgresSessionProvider,
+        task_service: AbstractTaskRepository,
+    ) -> None:
+        # Given
+        cleanup_service = CleanupService(
+            session_provider=session_provider,
+            task_model=PostgresTask,
+            settings=CleanupSettings(is_enabled=True, ttl_days=30, stats_ttl_days=90),
+        )
+        now = dt.datetime.now(dt.timezone.utc)
+        for event_time in (now, now - dt.timedelta(days=60), now - dt.timedelta(days=120)):
+            await self._apply_task_events(task_service, event_time)
+
+        # When
+        await cleanup_service.cleanup()
+
+        # Then
+        stats_buckets, sketches_buckets = await self._rollup_buckets(session_provider)
+        assert sorted(stats_buckets) == [
+            (now - dt.timedelta(days=60)).replace(second=0, microsecond=0),
+            now.replace(second=0, microsecond=0),
+        ]
+        assert len(sketches_buckets) == 2
+
     async def test_cleanup_by_count_direct__then_returns_deleted_count(
         self,
         session_provider: AsyncPostgresSessionProvider,
@@ -356,3 +431,84 @@ class TestCleanupService:
 
         # Then
         assert deleted_count == 3  # 5 - 2 = 3 deleted
+
+    async def test_when_more_tasks_than_batch_size__then_deleted_in_batches(
+        self,
+        session_provider: AsyncPostgresSessionProvider,
+    ) -> None:
+        # Given
+        settings = CleanupSettings(
+            is_enabled=True,
+            ttl_days=30,
+            max_tasks=2,
+            batch_size=2,
+            batch_pause_seconds=0,
+        )
+        cleanup_service = CleanupService(
+            session_provider=session_provider,
+            task_model=PostgresTask,
+            settings=settings,
+        )
+        await PostgresTaskFactory.create_batch_async(
+            5,
+            status=TaskStatus.COMPLETED.value,
+            finished_at=dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=45),
+        )
+        await PostgresTaskFactory.create_batch_async(
+            5,
+            status=TaskStatus.COMPLETED.value,
+            finished_at=dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=1),
+        )
+
+        # When
+        result = await cleanup_service.cleanup()
+
+        # Then
+        assert result.deleted_by_ttl == 5
+        assert result.deleted_by_count == 3
+        assert result.batches_count == 5  # TTL: 2 + 2 + 1, count: 2 + 1
+
+    async def test_when_partition_expired__then_partition_dropped(
+        self,
+        session_provider: AsyncPostgresSessionProvider,
+        partitioned_schema_service: SchemaService,
+    ) -> None:
+        # Given
+        settings = CleanupSettings(is_enabled=True, ttl_days=30, max_tasks=10000)
+        cleanup_service = CleanupService(
+            session_provider=session_provider,
+            task_model=PostgresTask,
+            settings=settings,
+        )
+        old_day = (dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=45)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        old_partition_name = f'{PostgresTask.__tablename__}_p{old_day:%Y%m%d}'
+        async with session_provider.session() as session:
+            await session.execute(
+                sa.text(
+                    f'CREATE TABLE {old_partition_name} PARTITION OF {PostgresTask.__tablename__} '
+                    f"FOR VALUES FROM ('{old_day.isoformat()}') TO ('{(old_day + dt.timedelta(days=1)).isoformat()}')"
+                )
+            )
+        await PostgresTaskFactory.create_batch_async(
+            3,
+            status=TaskStatus.COMPLETED.value,
+            queued_at=old_day + dt.timedelta(hours=1),
+            finished_at=old_day + dt.timedelta(hours=2),
+        )
+        recent_task = await PostgresTaskFactory.create_async(
+            status=TaskStatus.COMPLETED.value,
+            queued_at=dt.datetime.now(dt.timezone.utc),
+            finished_at=dt.datetime.now(dt.timezone.utc),
+        )
+
+        # When
+        result = await cleanup_service.cleanup()
+
+        # Then
+        assert result.deleted_by_ttl == 3
+        async with session_provider.session() as session:
+            partition = await session.execute(sa.text('SELECT to_regclass(:name)'), {'name': old_partition_name})
+            assert partition.scalar() is None
+        assert await self._task_exists(session_provider, recent_task.id)
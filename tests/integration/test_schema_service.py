@@ -0,0 +1,94 @@
+import sqlalchemy as sa
+
+from taskiq_dashboard.infrastructure.database.schemas import PostgresTask
+from taskiq_dashboard.infrastructure.database.session_provider import AsyncPostgresSessionProvider
+from taskiq_dashboard.infrastructure.services.schema_service import SchemaService
+
+
+class TestSchemaService:
+    @staticmethod
+    async def _index_names(session_provider: AsyncPostgresSessionProvider) -> set[str]:
+        """Helper to get names of indexes on the tasks table."""
+        async with session_provider.session() as session:
+            result = await session.execute(
+                sa.text('SELECT indexname FROM pg_indexes WHERE tablename = :table_name'),
+                {'table_name': PostgresTask.__tablename__},
+            )
+            return set(result.scalars().all())
+
+    async def test_when_schema_created__then_all_indexes_exist(
+        self,
+        session_provider: AsyncPostgresSessionProvider,
+    ) -> None:
+        # Given
+        schema_service = SchemaService(session_provider)
+
+        # When
+        await schema_service.create_schema()
+
+        # Then
+        index_names = await self._index_names(session_provider)
+        assert {index.name for index in PostgresTask.__table__.indexes} <= index_names
+
+    async def test_when_partitioning_enabled__then_partitions_created_ahead(
+        self,
+        session_provider: AsyncPostgresSessionProvider,
+        partitioned_schema_service: SchemaService,
+    ) -> None:
+        # Given
+        query = sa.text(
+            'SELECT child.relname FROM pg_inherits '
+            'JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid '
+            'WHERE pg_inherits.inhparent = CAST(:table_name AS regclass)'
+        )
+
+        # When
+        await partitioned_schema_service.create_partitions()
+
+        # Then
+        async with session_provider.session() as session:
+            result = await session.execute(query, {'table_name': PostgresTask.__tablename__})
+            partition_names = set(result.scalars().all())
+        assert f'{PostgresTask.__tablename__}_default' in partition_names
+        assert len(partition_names) == 1 + 3  # default, current and two premade partitions
+        assert {index.name for index in PostgresTask.__table__.indexes} <= await self._index_names(session_provider)
+
+    async def test_when_index_missing__then_index_created_on_existing_table(
+        self,
+        session_provider: AsyncPostgresSessionProvider,
+    ) -> None:
+        # Given
+        schema_service = SchemaService(session_provider)
+        async with session_provider.session() as session:
+            await session.execute(sa.text('DROP INDEX IF EXISTS ix_taskiq_dashboard__tasks_cleanup_at'))
+        assert 'ix_taskiq_dashboard__tasks_cleanup_at' not in await self._index_names(session_provider)
+
+        # When
+        await schema_service.create_schema()
+
+        # Then
+        assert 'ix_taskiq_dashboard__tasks_cleanup_at' in await self._index_names(session_provider)
+
+    async def test_when_column_missing__then_column_added_to_existing_table(
+        self,
+        session_provider: AsyncPostgresSessionProvider,
+    ) -> None:
+        # Given
+        schema_service = SchemaService(session_provider)
+        async with session_provider.session() as session:
+            await session.execute(
+                sa.text(f'ALTER TABLE {PostgresTask.__tablename__} DROP COLUMN IF EXISTS execution_time CASCADE')
+            )
+
+        # When
+        await schema_service.create_schema()
+
+        # Then
+        async with session_provider.session() as session:
+            result = await session.execute(
+                sa.text('SELECT column_name FROM information_schema.columns WHERE table_name = :table_name'),
+                {'table_name': PostgresTask.__tablename__},
+            )
+            column_names = set(result.scalars().all())
+        assert 'execution_time' in column_names
+        assert 'ix_taskiq_dashboard__tasks_execution_time' in await self._index_names(session_provider)
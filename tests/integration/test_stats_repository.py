@@ -0,0 +1,320 @@
+import datetime as dt
+import uuid
+
+import pytest
+
+from taskiq_dashboard.domain.dto.task import ExecutedTask, QueuedTask, StartedTask
+from taskiq_dashboard.domain.repositories import AbstractStatsRepository, AbstractTaskRepository
+from taskiq_dashboard.infrastructure.database.schemas import PostgresTask
+from taskiq_dashboard.infrastructure.database.session_provider import AsyncPostgresSessionProvider
+from taskiq_dashboard.infrastructure.services.cleanup_service import CleanupService
+from taskiq_dashboard.infrastructure.settings import CleanupSettings
+
+
+class TestStatsRepository:
+    @staticmethod
+    def _task_events(
+        task_name: str,
+        event_time: dt.datetime,
+        execution_time: float,
+        error: str | None = None,
+    ) -> list[tuple[uuid.UUID, QueuedTask | StartedTask | ExecutedTask]]:
+        task_id = uuid.uuid4()
+        return [
+            (task_id, QueuedTask(task_name=task_name, worker='worker', queued_at=event_time)),
+            (task_id, StartedTask(task_name=task_name, worker='worker', started_at=event_time)),
+            (
+                task_id,
+                ExecutedTask(finished_at=event_time, execution_time=execution_time, error=error, task_name=task_name),
+            ),
+        ]
+
+    async def test_when_events_applied__then_stats_aggregated_by_task_name(
+        self,
+        task_service: AbstractTaskRepository,
+        stats_repository: AbstractStatsRepository,
+    ) -> None:
+        # Given
+        now = dt.datetime.now(dt.timezone.utc)
+        await task_service.apply_events(
+            self._task_events('send_email', now, execution_time=1.0)
+            + self._task_events('send_email', now - dt.timedelta(minutes=5), execution_time=3.0, error='boom')
+            + self._task_events('process_data', now, execution_time=2.0)
+        )
+
+        # When
+        stats = await stats_repository.get_task_stats(
+            since=now - dt.timedelta(hours=1), until=now + dt.timedelta(minutes=1)
+        )
+
+        # Then
+        assert [task_stats.name for task_stats in stats] == ['process_data', 'send_email']
+        send_email_stats = stats[1]
+        assert send_email_stats.queued_count == 2
+        assert send_email_stats.started_count == 2
+        assert send_email_stats.completed_count == 1
+        assert send_email_stats.failed_count == 1
+        assert send_email_stats.duration_min == pytest.approx(1.0)
+        assert send_email_stats.duration_max == pytest.approx(3.0)
+        assert send_email_stats.duration_avg == pytest.approx(2.0)
+
+    async def test_when_event_redelivered__then_stats_counted_once(
+        self,
+        task_service: AbstractTaskRepository,
+        stats_repository: AbstractStatsRepository,
+    ) -> None:
+        # Given
+        now = dt.datetime.now(dt.timezone.utc)
+        events = self._task_events('send_email', now, execution_time=1.0)
+        await task_service.apply_events(events)
+
+        # When
+        await task_service.apply_events(events)
+
+        # Then
+        stats = await stats_repository.get_task_stats(since=now, until=now + dt.timedelta(minutes=1))
+        assert stats[0].queued_count == 1
+        assert stats[0].completed_count == 1
+
+    async def test_when_tasks_cleaned_up__then_stats_kept(
+        self,
+        task_service: AbstractTaskRepository,
+        stats_repository: AbstractStatsRepository,
+        session_provider: AsyncPostgresSessionProvider,
+    ) -> None:
+        # Given
+        now = dt.datetime.now(dt.timezone.utc)
+        await task_service.apply_events(self._task_events('send_email', now, execution_time=1.0))
+        cleanup_service = CleanupService(
+            session_provider=session_provider,
+            task_model=PostgresTask,
+            settings=CleanupSettings(max_tasks=0),
+        )
+
+        # When
+        await cleanup_service.cleanup_by_count(max_tasks=0)
+
+        # Then
+        assert await task_service.find_tasks() == []
+        stats = await stats_repository.get_task_stats(since=now, until=now + dt.timedelta(minutes=1))
+        assert stats[0].completed_count == 1
+
+    async def test_when_events_applied__then_percentiles_estimated_within_relative_accuracy(
+        self,
+        task_service: AbstractTaskRepository,
+        stats_repository: AbstractStatsRepository,
+    ) -> None:
+        # Given
+        now = dt.datetime.now(dt.timezone.utc)
+        events = []
+        for index in range(1, 101):
+            queued_at = now - dt.timedelta(hours=index % 3)
+            task_id = uuid.uuid4()
+            events += [
+                (task_id, QueuedTask(task_name='send_email', worker='worker', queued_at=queued_at)),
+                (
+                    task_id,
+                    StartedTask(
+                        task_name='send_email',
+                        worker='worker',
+                        started_at=queued_at + dt.timedelta(seconds=index / 10),
+                    ),
+                ),
+                (task_id, ExecutedTask(finished_at=queued_at, execution_time=float(index))),
+            ]
+        await task_service.apply_events(events[: len(events) // 2])
+        await task_service.apply_events(events[len(events) // 2 :])
+
+        # When
+        stats = await stats_repository.get_task_stats(
+            since=now - dt.timedelta(hours=3), until=now + dt.timedelta(minutes=1)
+        )
+
+        # Then
+        assert stats[0].duration_p50 == pytest.approx(50.0, rel=0.02)
+        assert stats[0].duration_p99 == pytest.approx(99.0, rel=0.02)
+        assert stats[0].wait_p95 == pytest.approx(9.5, rel=0.02)
+
+    async def test_when_events_delivered_out_of_order__then_stats_counted_under_task_name(
+        self,
+        task_service: AbstractTaskRepository,
+        stats_repository: AbstractStatsRepository,
+    ) -> None:
+        # Given
+        now = dt.datetime.now(dt.timezone.utc)
+        queued, started, executed = self._task_events('send_email', now, execution_time=2.0, error='boom')
+
+        # When
+        for event in (executed, started, queued):
+            await task_service.apply_events([event])
+
+        # Then
+        stats = await stats_repository.get_task_stats(since=now, until=now + dt.timedelta(minutes=1))
+        assert [task_stats.name for task_stats in stats] == ['send_email']
+        assert stats[0].queued_count == 1
+        assert stats[0].started_count == 1
+        assert stats[0].failed_count == 1
+        assert stats[0].duration_min == pytest.approx(2.0)
+        assert stats[0].duration_max == pytest.approx(2.0)
+
+    async def test_when_events_delivered_out_of_order__then_percentiles_include_them(
+        self,
+        task_service: AbstractTaskRepository,
+        stats_repository: AbstractStatsRepository,
+    ) -> None:
+        # Given
+        now = dt.datetime.now(dt.timezone.utc)
+        events = []
+        for index in range(1, 101):
+            task_id = uuid.uuid4()
+            events += [
+                (task_id, ExecutedTask(finished_at=now, execution_time=float(index), task_name='send_email')),
+                (task_id, StartedTask(task_name='send_email', worker='worker', started_at=now)),
+                (
+                    task_id,
+                    QueuedTask(
+                        task_name='send_email',
+                        worker='worker',
+                        queued_at=now - dt.timedelta(seconds=index / 10),
+                    ),
+                ),
+            ]
+
+        # When
+        for event in events:
+            await task_service.apply_events([event])
+
+        # Then
+        stats = await stats_repository.get_task_stats(since=now, until=now + dt.timedelta(minutes=1))
+        assert [task_stats.name for task_stats in stats] == ['send_email']
+        assert stats[0].duration_p50 == pytest.approx(50.0, rel=0.02)
+        assert stats[0].duration_p99 == pytest.approx(99.0, rel=0.02)
+        assert stats[0].wait_p95 == pytest.approx(9.5, rel=0.02)
+
+    async def test_when_getting_timeseries__then_events_counted_per_bucket(
+        self,
+        task_service: AbstractTaskRepository,
+        stats_repository: AbstractStatsRepository,
+    ) -> None:
+        # Given
+        now = dt.datetime.now(dt.timezone.utc).replace(second=0, microsecond=0)
+        now -= dt.timedelta(minutes=now.minute % 5)
+        await task_service.apply_events(
+            self._task_events('send_email', now - dt.timedelta(minutes=5), execution_time=1.0)
+            + self._task_events('send_email', now - dt.timedelta(minutes=5), execution_time=1.0, error='boom')
+            + self._task_events('send_email', now, execution_time=1.0)
+        )
+
+        # When
+        points = await stats_repository.get_task_timeseries(
+            since=now - dt.timedelta(minutes=10),
+            until=now + dt.timedelta(seconds=30),
+            interval=dt.timedelta(minutes=5),
+        )
+
+        # Then
+        assert [point.bucket for point in points] == [now - dt.timedelta(minutes=minutes) for minutes in (10, 5, 0)]
+        assert [point.queued_count for point in points] == [0, 2, 1]
+        assert [point.failed_count for point in points] == [0, 1, 0]
+        assert points[1].failure_rate == pytest.approx(0.5)
+
+    async def test_when_getting_timeseries_by_worker__then_only_tasks_of_worker_counted(
+        self,
+        task_service: AbstractTaskRepository,
+        stats_repository: AbstractStatsRepository,
+    ) -> None:
+        # Given
+        now = dt.datetime.now(dt.timezone.utc).replace(second=0, microsecond=0)
+        await task_service.apply_events(self._task_events('send_email', now, execution_time=1.0))
+        await task_service.apply_events(
+            [(uuid.uuid4(), QueuedTask(task_name='send_email', worker='other_worker', queued_at=now))]
+        )
+
+        # When
+        points = await stats_repository.get_task_timeseries(
+            since=now,
+            until=now + dt.timedelta(seconds=30),
+            interval=dt.timedelta(minutes=1),
+            worker='worker',
+        )
+
+        # Then
+        assert len(points) == 1
+        assert points[0].queued_count == 1
+        assert points[0].completed_count == 1
+
+    async def test_when_late_events_applied_to_cached_bucket__then_timeseries_refreshed(
+        self,
+        task_service: AbstractTaskRepository,
+        stats_repository: AbstractStatsRepository,
+    ) -> None:
+        # Given
+        hour_ago = dt.datetime.now(dt.timezone.utc).replace(minute=0, second=0, microsecond=0) - dt.timedelta(hours=1)
+        await task_service.apply_events(self._task_events('send_email', hour_ago, execution_time=1.0))
+        await stats_repository.get_task_timeseries(
+            since=hour_ago, until=hour_ago + dt.timedelta(hours=1), interval=dt.timedelta(minutes=5)
+        )
+        await task_service.apply_events(self._task_events('send_email', hour_ago, execution_time=1.0))
+
+        # When
+        points = await stats_repository.get_task_timeseries(
+            since=hour_ago, until=hour_ago + dt.timedelta(hours=1), interval=dt.timedelta(minutes=5)
+        )
+
+        # Then
+        assert points[0].queued_count == 2
+        assert points[0].completed_count == 2
+
+    async def test_when_late_event_sets_worker_of_cached_bucket__then_worker_timeseries_refreshed(
+        self,
+        task_service: AbstractTaskRepository,
+        stats_repository: AbstractStatsRepository,
+    ) -> None:
+        # Given
+        hour_ago = dt.datetime.now(dt.timezone.utc).replace(minute=0, second=0, microsecond=0) - dt.timedelta(hours=1)
+        task_id = uuid.uuid4()
+        await task_service.apply_events(
+            [(task_id, QueuedTask(task_name='send_email', worker=None, queued_at=hour_ago))],
+        )
+        await stats_repository.get_task_timeseries(
+            since=hour_ago, until=hour_ago + dt.timedelta(hours=1), interval=dt.timedelta(minutes=5), worker='worker'
+        )
+        await task_service.apply_events(
+            [
+                (
+                    task_id,
+                    StartedTask(
+                        task_name='send_email', worker='worker', started_at=hour_ago + dt.timedelta(minutes=30)
+                    ),
+                ),
+            ]
+        )
+
+        # When
+        points = await stats_repository.get_task_timeseries(
+            since=hour_ago, until=hour_ago + dt.timedelta(hours=1), interval=dt.timedelta(minutes=5), worker='worker'
+        )
+
+        # Then
+        assert points[0].queued_count == 1
+        assert points[6].started_count == 1
+
+    async def test_when_timeseries_requested_again__then_current_bucket_refreshed(
+        self,
+        task_service: AbstractTaskRepository,
+        stats_repository: AbstractStatsRepository,
+    ) -> None:
+        # Given
+        now = dt.datetime.now(dt.timezone.utc)
+        await stats_repository.get_task_timeseries(
+            since=now - dt.timedelta(hours=1), until=now, interval=dt.timedelta(minutes=1)
+        )
+        await task_service.apply_events(self._task_events('send_email', now, execution_time=1.0))
+
+        # When
+        points = await stats_repository.get_task_timeseries(
+            since=now - dt.timedelta(hours=1), until=now + dt.timedelta(seconds=1), interval=dt.timedelta(minutes=1)
+        )
+
+        # Then
+        assert points[-1].queued_count == 1
@@ -5,11 +5,20 @@ import sqlalchemy as sa
 
 from tests.integration.factories import PostgresTaskFactory
 
-from taskiq_dashboard.domain.dto.task import ExecutedTask, QueuedTask, StartedTask
+from taskiq_dashboard.domain.dto.task import (
+    ExecutedTask,
+    QueuedTask,
+    StartedExecutedTask,
+    StartedTask,
+    Task,
+    TaskCursor,
+)
 from taskiq_dashboard.domain.dto.task_status import TaskStatus
 from taskiq_dashboard.domain.repositories import AbstractTaskRepository
 from taskiq_dashboard.infrastructure.database.schemas import PostgresTask
 from taskiq_dashboard.infrastructure.database.session_provider import AsyncPostgresSessionProvider
+from taskiq_dashboard.infrastructure.repositories import TaskRepository
+from taskiq_dashboard.infrastructure.services import SchemaService
 
 
 class TestTaskService:
@@ -168,6 +177,7 @@ class TestTaskService:
         assert task_row.finished_at == executed_task.finished_at
         assert task_row.result == 'success_result'
         assert task_row.error is None
+        assert task_row.execution_time == executed_task.execution_time
 
     async def test_when_updating_task_with_executed_task_with_error__then_task_status_is_failure(
         self,
@@ -234,6 +244,39 @@ class TestTaskService:
         assert len(tasks) == 2
         assert all('send' in task.name for task in tasks)
 
+    async def test_when_finding_tasks__then_payload_not_loaded(
+        self,
+        task_service: AbstractTaskRepository,
+        session_provider: AsyncPostgresSessionProvider,
+    ) -> None:
+        # Given
+        task = await PostgresTaskFactory.create_async(kwargs={'payload': 'x' * 10_000})
+
+        # When
+        tasks = await task_service.find_tasks()
+        task_details = await task_service.get_task_by_id(task.id)
+
+        # Then
+        assert [found_task.id for found_task in tasks] == [task.id]
+        assert not isinstance(tasks[0], Task)
+        assert task_details is not None
+        assert task_details.kwargs == {'payload': 'x' * 10_000}
+
+    async def test_when_finding_tasks_with_wildcard_in_search__then_wildcard_matched_literally(
+        self,
+        task_service: AbstractTaskRepository,
+        session_provider: AsyncPostgresSessionProvider,
+    ) -> None:
+        # Given
+        await PostgresTaskFactory.create_async(name='sync_100%_done')
+        await PostgresTaskFactory.create_async(name='sync_1000_done')
+
+        # When
+        tasks = await task_service.find_tasks(name='100%')
+
+        # Then
+        assert [task.name for task in tasks] == ['sync_100%_done']
+
     async def test_when_finding_tasks_with_id_search__then_return_matching_tasks(
         self,
         task_service: AbstractTaskRepository,
@@ -278,6 +321,29 @@ class TestTaskService:
         assert page_1_ids.isdisjoint(page_2_ids)
         assert page_2_ids.isdisjoint(page_3_ids)
 
+    async def test_when_finding_tasks_with_cursor__then_pages_follow_sort_order_without_gaps(
+        self,
+        task_service: AbstractTaskRepository,
+        session_provider: AsyncPostgresSessionProvider,
+    ) -> None:
+        # Given
+        started_at = dt.datetime.now(dt.timezone.utc)
+        await PostgresTaskFactory.create_batch_async(6, started_at=started_at)
+        await PostgresTaskFactory.create_batch_async(4, started_at=started_at - dt.timedelta(minutes=1))
+        await PostgresTaskFactory.create_batch_async(3, started_at=None)
+        all_tasks = await task_service.find_tasks(sort_by='started_at', sort_order='desc', limit=100)
+
+        # When
+        pages = []
+        cursor = None
+        while page := await task_service.find_tasks(sort_by='started_at', sort_order='desc', limit=5, cursor=cursor):
+            pages.append(page)
+            cursor = TaskCursor(sort_value=page[-1].started_at, task_id=page[-1].id)
+
+        # Then
+        assert [len(page) for page in pages] == [5, 5, 3]
+        assert [task.id for page in pages for task in page] == [task.id for task in all_tasks]
+
     async def test_when_finding_tasks_sorted_by_started_at_descending__then_return_tasks_in_correct_order(
         self,
         task_service: AbstractTaskRepository,
@@ -332,6 +398,56 @@ class TestTaskService:
         finished_times = [task.finished_at for task in tasks if task.finished_at is not None]
         assert finished_times == sorted(finished_times, reverse=True)
 
+    async def test_when_finding_tasks_sorted_by_execution_time__then_slowest_finished_tasks_returned_first(
+        self,
+        task_service: AbstractTaskRepository,
+        session_provider: AsyncPostgresSessionProvider,
+    ) -> None:
+        # Given
+        for execution_time in (0.5, 3.0, 1.5):
+            await PostgresTaskFactory.create_async(execution_time=execution_time)
+        await PostgresTaskFactory.create_async(execution_time=None)
+
+        # When
+        tasks = await task_service.find_tasks(sort_by='execution_time', sort_order='desc')
+
+        # Then
+        assert [task.execution_time for task in tasks] == [3.0, 1.5, 0.5]
+
+    async def test_when_finding_tasks_with_duration_filter__then_return_tasks_within_range(
+        self,
+        task_service: AbstractTaskRepository,
+        session_provider: AsyncPostgresSessionProvider,
+    ) -> None:
+        # Given
+        for execution_time in (0.5, 1.0, 2.0, 5.0):
+            await PostgresTaskFactory.create_async(execution_time=execution_time)
+        await PostgresTaskFactory.create_async(execution_time=None)
+
+        # When
+        tasks = await task_service.find_tasks(min_duration=1.0, max_duration=2.0)
+
+        # Then
+        assert sorted(task.execution_time for task in tasks) == [1.0, 2.0]
+
+    async def test_when_streaming_tasks__then_all_matching_tasks_returned_with_payload(
+        self,
+        task_service: AbstractTaskRepository,
+    ) -> None:
+        # Given
+        await PostgresTaskFactory.create_batch_async(
+            35, name='send_email_task', status=TaskStatus.FAILURE.value, error='boom'
+        )
+        await PostgresTaskFactory.create_batch_async(5, name='send_email_task', status=TaskStatus.COMPLETED.value)
+
+        # When
+        tasks = [task async for task in task_service.stream_tasks(name='send_email', status=TaskStatus.FAILURE)]
+
+        # Then
+        assert len(tasks) == 35
+        assert all(isinstance(task, Task) and task.error == 'boom' for task in tasks)
+        assert len({task.id for task in tasks}) == 35
+
     async def test_when_finding_tasks_with_multiple_filters_applied__then_return_correct_tasks(
         self,
         task_service: AbstractTaskRepository,
@@ -492,11 +608,57 @@ class TestTaskService:
             result = await session.execute(sa.select(PostgresTask).where(PostgresTask.id == task_id))
             task_row = result.scalar_one()
 
-        # Task should now be IN_PROGRESS because started event overwrites the status
-        # This tests the actual behavior - later events overwrite earlier ones
-        assert task_row.status == TaskStatus.IN_PROGRESS
+        # started event delivered late fills in started_at but keeps the final status
+        assert task_row.status == TaskStatus.COMPLETED
         assert task_row.started_at == started_task.started_at
 
+    async def test_when_started_event_replayed_after_executed_in_batch__then_final_status_kept(
+        self,
+        task_service: AbstractTaskRepository,
+    ) -> None:
+        # Given
+        now = dt.datetime.now(dt.timezone.utc)
+        completed_task_id, failed_task_id = uuid.uuid4(), uuid.uuid4()
+        await task_service.apply_events(
+            [
+                (completed_task_id, ExecutedTask(finished_at=now, execution_time=1.0, task_name='replayed_task')),
+                (failed_task_id, ExecutedTask(finished_at=now, execution_time=1.0, error='boom')),
+            ]
+        )
+
+        # When - started events come back from the spool or a retry
+        changed_tasks = await task_service.apply_events(
+            [
+                (
+                    task_id,
+                    StartedTask(task_name='replayed_task', worker='worker', started_at=now - dt.timedelta(seconds=1)),
+                )
+                for task_id in (completed_task_id, failed_task_id)
+            ]
+        )
+
+        # Then
+        statuses = {task.id: task.status for task in changed_tasks}
+        assert statuses == {completed_task_id: TaskStatus.COMPLETED, failed_task_id: TaskStatus.FAILURE}
+
+    async def test_when_task_started_again_after_finished__then_task_in_progress(
+        self,
+        task_service: AbstractTaskRepository,
+    ) -> None:
+        # Given
+        task_id = uuid.uuid4()
+        now = dt.datetime.now(dt.timezone.utc)
+        await task_service.update_task(task_id, ExecutedTask(finished_at=now, execution_time=1.0, error='boom'))
+
+        # When - the task is retried
+        task = await task_service.update_task(
+            task_id, StartedTask(task_name='retried_task', worker='worker', started_at=now + dt.timedelta(seconds=1))
+        )
+
+        # Then
+        assert task is not None
+        assert task.status == TaskStatus.IN_PROGRESS
+
     async def test_when_multiple_out_of_order_events__then_task_reflects_latest_event_state(
         self,
         task_service: AbstractTaskRepository,
@@ -673,3 +835,158 @@ class TestTaskService:
         assert task_row.result == 'success'
         assert task_row.args == ['a', 'b']
         assert task_row.labels == {'retry': 'true'}
+
+    async def test_when_applying_events__then_all_events_applied_in_order(
+        self,
+        task_service: AbstractTaskRepository,
+        session_provider: AsyncPostgresSessionProvider,
+    ) -> None:
+        # Given
+        task_id = uuid.uuid4()
+        now = dt.datetime.now(dt.timezone.utc)
+        events = [
+            (
+                task_id,
+                QueuedTask(task_name='batched_task', worker='worker_1', queued_at=now - dt.timedelta(seconds=2)),
+            ),
+            (
+                task_id,
+                StartedTask(task_name='batched_task', worker='worker_1', started_at=now - dt.timedelta(seconds=1)),
+            ),
+            (
+                task_id,
+                ExecutedTask(finished_at=now, execution_time=1.0, return_value={'return_value': 'done'}),
+            ),
+        ]
+
+        # When
+        await task_service.apply_events(events)
+
+        # Then
+        async with session_provider.session() as session:
+            result = await session.execute(sa.select(PostgresTask).where(PostgresTask.id == task_id))
+            task_row = result.scalar_one()
+
+        assert task_row.status == TaskStatus.COMPLETED
+        assert task_row.name == 'batched_task'
+        assert task_row.queued_at == now - dt.timedelta(seconds=2)
+        assert task_row.started_at == now - dt.timedelta(seconds=1)
+        assert task_row.finished_at == now
+        assert task_row.result == 'done'
+
+    async def test_when_applying_events_out_of_order__then_events_applied_in_lifecycle_order(
+        self,
+        task_service: AbstractTaskRepository,
+        session_provider: AsyncPostgresSessionProvider,
+    ) -> None:
+        # Given
+        task_ids = [uuid.uuid4(), uuid.uuid4()]
+        now = dt.datetime.now(dt.timezone.utc)
+        events: list[tuple[uuid.UUID, QueuedTask | StartedTask | ExecutedTask]] = []
+        for task_id in task_ids:
+            events += [
+                (task_id, ExecutedTask(finished_at=now, execution_time=1.0, return_value={'return_value': 'done'})),
+                (task_id, StartedTask(task_name='batched_task', worker='worker_1', started_at=now)),
+            ]
+        events.append(events[0])  # redelivered event
+
+        # When
+        changed_tasks = await task_service.apply_events(events)
+
+        # Then
+        assert {task.id for task in changed_tasks} == set(task_ids)
+        async with session_provider.session() as session:
+            result = await session.execute(sa.select(PostgresTask).where(PostgresTask.id.in_(task_ids)))
+            task_rows = result.scalars().all()
+
+        assert len(task_rows) == 2
+        for task_row in task_rows:
+            assert task_row.status == TaskStatus.COMPLETED
+            assert task_row.name == 'batched_task'
+            assert task_row.result == 'done'
+
+    async def test_when_applying_coalesced_event__then_task_started_and_completed_with_single_write(
+        self,
+        task_service: AbstractTaskRepository,
+        session_provider: AsyncPostgresSessionProvider,
+    ) -> None:
+        # Given
+        task_id = uuid.uuid4()
+        now = dt.datetime.now(dt.timezone.utc)
+        queued = QueuedTask(task_name='short_task', worker='worker_1', queued_at=now - dt.timedelta(seconds=1))
+        started_executed = StartedExecutedTask(
+            task_name='short_task',
+            worker='worker_1',
+            args=[1],
+            started_at=now - dt.timedelta(milliseconds=20),
+            finished_at=now,
+            execution_time=0.02,
+            return_value={'return_value': 'done'},
+        )
+
+        # When
+        await task_service.apply_events([(task_id, queued), (task_id, started_executed)])
+        redelivered_tasks = await task_service.apply_events([(task_id, started_executed)])
+
+        # Then
+        assert redelivered_tasks == []
+        async with session_provider.session() as session:
+            result = await session.execute(sa.select(PostgresTask).where(PostgresTask.id == task_id))
+            task_row = result.scalar_one()
+
+        assert task_row.status == TaskStatus.COMPLETED
+        assert task_row.args == [1]
+        assert task_row.queued_at == queued.queued_at
+        assert task_row.started_at == started_executed.started_at
+        assert task_row.finished_at == now
+        assert task_row.result == 'done'
+
+    async def test_when_started_event_replayed_after_executed_in_partitioned_table__then_final_status_kept(
+        self,
+        session_provider: AsyncPostgresSessionProvider,
+        partitioned_schema_service: SchemaService,
+    ) -> None:
+        # Given
+        task_service = TaskRepository(session_provider=session_provider, task_model=PostgresTask)
+        task_id = uuid.uuid4()
+        now = dt.datetime.now(dt.timezone.utc)
+        await task_service.update_task(task_id, ExecutedTask(finished_at=now, execution_time=1.0))
+
+        # When
+        task = await task_service.update_task(
+            task_id, StartedTask(task_name='replayed_task', worker='worker', started_at=now - dt.timedelta(seconds=1))
+        )
+
+        # Then
+        assert task is not None
+        assert task.status == TaskStatus.COMPLETED
+
+    async def test_when_events_applied_to_partitioned_table__then_single_task_moved_to_its_partition(
+        self,
+        session_provider: AsyncPostgresSessionProvider,
+        partitioned_schema_service: SchemaService,
+    ) -> None:
+        # Given
+        task_service = TaskRepository(session_provider=session_provider, task_model=PostgresTask)
+        task_id = uuid.uuid4()
+        now = dt.datetime.now(dt.timezone.utc)
+        executed = ExecutedTask(finished_at=now, execution_time=1.0, return_value={'return_value': 42})
+        queued = QueuedTask(task_name='partitioned_task', worker='worker', queued_at=now)
+
+        # When
+        await task_service.update_task(task_id, executed)
+        await task_service.create_task(task_id, queued)
+        redelivered_task = await task_service.create_task(task_id, queued)
+
+        # Then
+        assert redelivered_task is None
+        async with session_provider.session() as session:
+            result = await session.execute(
+                sa.select(PostgresTask.name, sa.literal_column('tableoid::regclass::text')).where(
+                    PostgresTask.id == task_id
+                )
+            )
+            rows = result.all()
+        assert len(rows) == 1
+        assert rows[0][0] == 'partitioned_task'
+        assert rows[0][1] == f'{PostgresTask.__tablename__}_p{now:%Y%m%d}'
@@ -0,0 +1,70 @@
+from collections.abc import AsyncGenerator
+
+import fastapi
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from taskiq_dashboard.api.middlewares import AccessTokenMiddleware
+
+
+@pytest.fixture
+async def client(request: pytest.FixtureRequest) -> AsyncGenerator[AsyncClient]:
+    root_path = getattr(request, 'param', '')
+    app = fastapi.FastAPI(root_path=root_path)
+
+    @app.post('/api/tasks', status_code=204)
+    async def api_route() -> None: ...
+
+    @app.get('/')
+    async def page_route() -> dict[str, str]:
+        return {'page': 'home'}
+
+    app.add_middleware(AccessTokenMiddleware, token='supersecret')
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    ('headers', 'detail'),
+    [
+        ({}, 'Missing or invalid Authorization header'),
+        ({'access-token': 'wrong'}, 'Invalid access token'),
+    ],
+)
+async def test_when_api_called_without_valid_token__then_unauthorized(
+    client: AsyncClient,
+    headers: dict[str, str],
+    detail: str,
+) -> None:
+    # when
+    response = await client.post('/api/tasks', headers=headers)
+
+    # then
+    assert response.status_code == 401
+    assert response.json() == {'detail': detail}
+
+
+async def test_when_api_called_with_valid_token__then_request_passed(client: AsyncClient) -> None:
+    # when
+    response = await client.post('/api/tasks', headers={'access-token': 'supersecret'})
+
+    # then
+    assert response.status_code == 204
+
+
+async def test_when_page_requested_without_token__then_request_passed(client: AsyncClient) -> None:
+    # when
+    response = await client.get('/')
+
+    # then
+    assert response.status_code == 200
+    assert response.json() == {'page': 'home'}
+
+
+@pytest.mark.parametrize('client', ['/admin/taskiq'], indirect=True)
+async def test_when_api_called_under_root_path_without_token__then_unauthorized(client: AsyncClient) -> None:
+    # when
+    response = await client.post('/admin/taskiq/api/tasks')
+
+    # then
+    assert response.status_code == 401
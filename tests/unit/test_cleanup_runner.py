@@ -103,3 +103,26 @@ class TestPeriodicCleanupRunner:
 
         # Then
         assert runner._interval_seconds == 24 * 3600
+
+    async def test_when_interval_elapsed__then_partitions_created_before_cleanup(self) -> None:
+        # Given
+        calls: list[str] = []
+        mock_cleanup_service = AsyncMock()
+        mock_cleanup_service.cleanup = AsyncMock(side_effect=lambda: calls.append('cleanup'))
+        mock_schema_service = AsyncMock()
+        mock_schema_service.create_partitions = AsyncMock(side_effect=lambda: calls.append('create_partitions'))
+
+        runner = PeriodicCleanupRunner(
+            cleanup_service=mock_cleanup_service,
+            interval_hours=1,
+            schema_service=mock_schema_service,
+        )
+        runner._interval_seconds = 0.1
+
+        # When
+        await runner.start()
+        await asyncio.sleep(0.15)
+        await runner.stop()
+
+        # Then
+        assert calls[:2] == ['create_partitions', 'cleanup']
@@ -0,0 +1,162 @@
+import uuid
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock, Mock
+
+import fastapi
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from taskiq_dashboard.api.middlewares import EventIngestionMiddleware
+from taskiq_dashboard.domain.dto.task import MAX_EVENT_BATCH_SIZE, ExecutedTask, QueuedTask, StartedExecutedTask
+from taskiq_dashboard.domain.services import EventQueueFullError
+
+
+@pytest.fixture
+def event_writer() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+async def client(event_writer: AsyncMock) -> AsyncGenerator[AsyncClient]:
+    app = fastapi.FastAPI()
+
+    @app.post('/api/tasks/{task_id}/{event}')
+    async def fallback_route(task_id: uuid.UUID, event: str) -> dict[str, str]:
+        return {'handled_by': 'fastapi'}
+
+    app.state.dishka_container = Mock(get=AsyncMock(return_value=event_writer))
+    app.add_middleware(EventIngestionMiddleware)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+async def test_when_event_received__then_validated_event_written(
+    client: AsyncClient,
+    event_writer: AsyncMock,
+) -> None:
+    # given
+    task_id = uuid.uuid4()
+
+    # when
+    response = await client.post(
+        f'/api/tasks/{task_id}/queued',
+        json={'taskName': 'send_email', 'worker': 'worker', 'queuedAt': '2025-01-01T00:00:00', 'args': [1]},
+    )
+
+    # then
+    assert response.status_code == 204
+    [(written_task_id, event)] = event_writer.write.call_args.args[0]
+    assert written_task_id == task_id
+    assert isinstance(event, QueuedTask)
+    assert event.task_name == 'send_email'
+    assert event.args == [1]
+
+
+async def test_when_batch_received__then_events_written_in_order(
+    client: AsyncClient,
+    event_writer: AsyncMock,
+) -> None:
+    # given
+    task_id = uuid.uuid4()
+    body = {
+        'events': [
+            {
+                'taskId': str(task_id),
+                'event': 'queued',
+                'data': {'taskName': 'a', 'worker': 'w', 'queuedAt': '2025-01-01'},
+            },
+            {'taskId': str(task_id), 'event': 'executed', 'data': {'finishedAt': '2025-01-01', 'executionTime': 1}},
+        ]
+    }
+
+    # when
+    response = await client.post('/api/tasks/batch', json=body)
+
+    # then
+    assert response.status_code == 204
+    events = event_writer.write.call_args.args[0]
+    assert [type(event) for _, event in events] == [QueuedTask, ExecutedTask]
+
+
+async def test_when_batch_exceeds_size_limit__then_unprocessable_and_nothing_written(
+    client: AsyncClient,
+    event_writer: AsyncMock,
+) -> None:
+    # given
+    event = {'event': 'executed', 'data': {'finishedAt': '2025-01-01', 'executionTime': 1}}
+    body = {'events': [{'taskId': str(uuid.uuid4()), **event} for _ in range(MAX_EVENT_BATCH_SIZE + 1)]}
+
+    # when
+    response = await client.post('/api/tasks/batch', json=body)
+
+    # then
+    assert response.status_code == 422
+    assert response.json()['detail'][0]['type'] == 'too_long'
+    event_writer.write.assert_not_called()
+
+
+async def test_when_coalesced_event_received__then_started_and_executed_data_written(
+    client: AsyncClient,
+    event_writer: AsyncMock,
+) -> None:
+    # when
+    response = await client.post(
+        f'/api/tasks/{uuid.uuid4()}/started_executed',
+        json={
+            'taskName': 'send_email',
+            'worker': 'worker',
+            'startedAt': '2025-01-01T00:00:00',
+            'finishedAt': '2025-01-01T00:00:01',
+            'executionTime': 1,
+        },
+    )
+
+    # then
+    assert response.status_code == 204
+    [(_, event)] = event_writer.write.call_args.args[0]
+    assert isinstance(event, StartedExecutedTask)
+    assert event.started().task_name == 'send_email'
+    assert event.executed().execution_time == 1
+
+
+async def test_when_event_invalid__then_unprocessable_and_nothing_written(
+    client: AsyncClient,
+    event_writer: AsyncMock,
+) -> None:
+    # when
+    response = await client.post(f'/api/tasks/{uuid.uuid4()}/started', json={'taskName': 'a'})
+
+    # then
+    assert response.status_code == 422
+    assert {tuple(error['loc']) for error in response.json()['detail']} == {('body', 'worker'), ('body', 'startedAt')}
+    event_writer.write.assert_not_called()
+
+
+async def test_when_event_queue_full__then_service_unavailable_with_retry_after(
+    client: AsyncClient,
+    event_writer: AsyncMock,
+) -> None:
+    # given
+    event_writer.write.side_effect = EventQueueFullError(retry_after_seconds=3)
+
+    # when
+    response = await client.post(
+        f'/api/tasks/{uuid.uuid4()}/executed', json={'finishedAt': '2025-01-01', 'executionTime': 1}
+    )
+
+    # then
+    assert response.status_code == 503
+    assert response.headers['retry-after'] == '3'
+
+
+async def test_when_task_id_malformed__then_request_passed_to_application(
+    client: AsyncClient,
+    event_writer: AsyncMock,
+) -> None:
+    # when
+    response = await client.post('/api/tasks/not-a-uuid/queued', json={})
+
+    # then
+    assert response.status_code == 422
+    assert response.json()['detail'][0]['loc'] == ['path', 'task_id']
+    event_writer.write.assert_not_called()
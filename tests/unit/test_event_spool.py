@@ -0,0 +1,84 @@
+from pathlib import Path
+
+from taskiq_dashboard.infrastructure.spool import EventSpool
+
+
+def test_when_events_appended__then_read_in_order_until_removed(tmp_path: Path) -> None:
+    # given
+    spool = EventSpool(tmp_path / 'spool.db', max_bytes=1024 * 1024)
+    spool.open()
+    events = [{'taskId': str(index), 'event': 'queued', 'data': {}} for index in range(3)]
+
+    # when
+    spool.append(events)
+    spooled_events = spool.read(limit=2)
+    spool.remove([event_id for event_id, _ in spooled_events])
+
+    # then
+    assert [event for _, event in spooled_events] == events[:2]
+    assert [event for _, event in spool.read(limit=10)] == events[2:]
+    spool.close()
+
+
+def test_when_spool_reopened__then_events_kept(tmp_path: Path) -> None:
+    # given
+    spool = EventSpool(tmp_path / 'spool.db', max_bytes=1024 * 1024)
+    spool.open()
+    spool.append([{'taskId': '1', 'event': 'started', 'data': {}}])
+    spool.close()
+
+    # when
+    spool.open()
+
+    # then
+    assert spool.count() == 1
+    spool.close()
+
+
+def test_when_size_limit_exceeded__then_oldest_events_dropped(tmp_path: Path) -> None:
+    # given
+    event_size = len('{"taskId":"0","data":"xxxxxxxxxx"}')
+    spool = EventSpool(tmp_path / 'spool.db', max_bytes=event_size * 3)
+    spool.open()
+    events = [{'taskId': str(index), 'data': 'x' * 10} for index in range(5)]
+
+    # when
+    dropped_count = spool.append(events)
+
+    # then
+    assert dropped_count == 2
+    assert [event for _, event in spool.read(limit=10)] == events[2:]
+    spool.close()
+
+
+def test_when_events_are_not_ascii__then_size_limit_counted_in_bytes(tmp_path: Path) -> None:
+    # given
+    event_size = len('{"taskId":"0","data":"яяяяяяяяяя"}'.encode())
+    spool = EventSpool(tmp_path / 'spool.db', max_bytes=event_size * 4)
+    spool.open()
+    events = [{'taskId': str(index), 'data': 'я' * 10} for index in range(5)]
+
+    # when
+    dropped_count = spool.append(events)
+
+    # then
+    assert dropped_count == 1
+    assert [event for _, event in spool.read(limit=10)] == events[1:]
+    spool.close()
+
+
+def test_when_events_removed__then_their_size_freed(tmp_path: Path) -> None:
+    # given
+    event_size = len('{"taskId":"0","data":"xxxxxxxxxx"}')
+    spool = EventSpool(tmp_path / 'spool.db', max_bytes=event_size * 3)
+    spool.open()
+    spool.append([{'taskId': str(index), 'data': 'x' * 10} for index in range(3)])
+    spool.remove([event_id for event_id, _ in spool.read(limit=2)])
+
+    # when
+    dropped_count = spool.append([{'taskId': str(index), 'data': 'x' * 10} for index in range(3, 5)])
+
+    # then
+    assert dropped_count == 0
+    assert spool.count() == 3
+    spool.close()
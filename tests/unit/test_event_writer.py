@@ -0,0 +1,118 @@
+import datetime as dt
+import uuid
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import sqlalchemy as sa
+
+from taskiq_dashboard.domain.dto.task import QueuedTask
+from taskiq_dashboard.domain.services import EventQueueFullError
+from taskiq_dashboard.infrastructure.services import WriteBehindEventWriter
+from taskiq_dashboard.infrastructure.settings import IngestionSettings
+
+
+def _queued_events(count: int) -> list[tuple[uuid.UUID, QueuedTask]]:
+    queued_at = dt.datetime.now(dt.timezone.utc)
+    return [
+        (uuid.uuid4(), QueuedTask(task_name='test_task', worker='worker', queued_at=queued_at)) for _ in range(count)
+    ]
+
+
+class TestWriteBehindEventWriter:
+    async def test_when_queue_full__then_events_rejected(self) -> None:
+        # Given
+        writer = WriteBehindEventWriter(
+            task_repository=AsyncMock(),
+            task_broadcaster=Mock(),
+            settings=IngestionSettings(queue_size=3, retry_after_seconds=2),
+        )
+        await writer.write(_queued_events(2))
+
+        # When
+        with pytest.raises(EventQueueFullError) as error:
+            await writer.write(_queued_events(2))
+
+        # Then
+        assert error.value.retry_after_seconds == 2
+        metrics = writer.metrics()
+        assert metrics.queue_depth == 2
+        assert metrics.accepted_count == 2
+        assert metrics.rejected_count == 2
+
+    async def test_when_stopped__then_accepted_events_written_in_batches(self) -> None:
+        # Given
+        task_repository = AsyncMock()
+        task_repository.apply_events = AsyncMock(return_value=[])
+        writer = WriteBehindEventWriter(
+            task_repository=task_repository,
+            task_broadcaster=Mock(),
+            settings=IngestionSettings(batch_size=2, flush_interval_seconds=10),
+        )
+        events = _queued_events(5)
+        await writer.start()
+        await writer.write(events)
+
+        # When
+        await writer.stop()
+
+        # Then
+        written_batches = [call.args[0] for call in task_repository.apply_events.call_args_list]
+        assert [len(batch) for batch in written_batches] == [2, 2, 1]
+        assert [event for batch in written_batches for event in batch] == events
+        assert writer.metrics().written_count == 5
+        assert writer.metrics().queue_depth == 0
+
+    async def test_when_flush_keeps_failing__then_batch_dropped_after_max_attempts(self) -> None:
+        # Given
+        task_repository = AsyncMock()
+        task_repository.apply_events = AsyncMock(
+            side_effect=sa.exc.OperationalError('INSERT', {}, ConnectionRefusedError('Connection refused'))
+        )
+        writer = WriteBehindEventWriter(
+            task_repository=task_repository,
+            task_broadcaster=Mock(),
+            settings=IngestionSettings(max_flush_attempts=2, retry_after_seconds=0),
+        )
+        await writer.start()
+        await writer.write(_queued_events(3))
+
+        # When
+        await writer.stop()
+
+        # Then
+        assert task_repository.apply_events.call_count == 2
+        metrics = writer.metrics()
+        assert metrics.failed_flush_count == 2
+        assert metrics.dropped_count == 3
+        assert metrics.written_count == 0
+
+    async def test_when_batch_contains_failing_event__then_only_that_event_dropped(self) -> None:
+        # Given
+        events = _queued_events(7)
+        poison_event = events[4]
+        written_events: list[tuple[uuid.UUID, QueuedTask]] = []
+
+        async def apply_events(batch: list[tuple[uuid.UUID, QueuedTask]]) -> list:
+            if poison_event in batch:
+                raise sa.exc.IntegrityError('INSERT', {}, ValueError('violates check constraint'))
+            written_events.extend(batch)
+            return []
+
+        task_repository = AsyncMock()
+        task_repository.apply_events = AsyncMock(side_effect=apply_events)
+        writer = WriteBehindEventWriter(
+            task_repository=task_repository,
+            task_broadcaster=Mock(),
+            settings=IngestionSettings(max_flush_attempts=3, retry_after_seconds=0, flush_interval_seconds=10),
+        )
+        await writer.start()
+        await writer.write(events)
+
+        # When
+        await writer.stop()
+
+        # Then
+        assert written_events == [event for event in events if event is not poison_event]
+        metrics = writer.metrics()
+        assert metrics.dropped_count == 1
+        assert metrics.written_count == 6
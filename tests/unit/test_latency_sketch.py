@@ -0,0 +1,44 @@
+import pytest
+
+from taskiq_dashboard.domain.dto.sketch import RELATIVE_ACCURACY, LatencySketch
+
+
+class TestLatencySketch:
+    def test_when_sketch_empty__then_quantile_is_none(self) -> None:
+        # Given
+        sketch = LatencySketch()
+
+        # When
+        quantile = sketch.quantile(0.5)
+
+        # Then
+        assert quantile is None
+
+    @pytest.mark.parametrize('quantile', [0.5, 0.95, 0.99])
+    def test_when_values_added__then_quantile_within_relative_accuracy(self, quantile: float) -> None:
+        # Given
+        values = [0.001 * index**2 for index in range(1, 10_001)]
+        sketch = LatencySketch()
+
+        # When
+        for value in values:
+            sketch.add(value)
+
+        # Then
+        exact_value = values[int(quantile * (len(values) - 1))]
+        assert sketch.quantile(quantile) == pytest.approx(exact_value, rel=RELATIVE_ACCURACY)
+
+    def test_when_sketches_merged__then_equal_to_sketch_of_all_values(self) -> None:
+        # Given
+        values = [0.001 * index for index in range(1, 1000)]
+        first, second, combined = LatencySketch(), LatencySketch(), LatencySketch()
+        for index, value in enumerate(values):
+            (first if index % 2 else second).add(value)
+            combined.add(value)
+
+        # When
+        first.merge(second)
+
+        # Then
+        assert first.bins == combined.bins
+        assert first.count == len(values)
@@ -1,7 +1,12 @@
 import asyncio
+import gzip
+import hashlib
 import json
 import re
+import typing as tp
 from collections.abc import AsyncGenerator
+from pathlib import Path
+from unittest.mock import Mock
 
 import httpx
 import pytest
@@ -10,6 +15,8 @@ from pytest_httpx import HTTPXMock
 from taskiq import TaskiqMessage, TaskiqResult
 
 from taskiq_dashboard import DashboardMiddleware
+from taskiq_dashboard.domain.dto.task import MAX_EVENT_BATCH_SIZE, TruncatedValue
+from taskiq_dashboard.interface.middleware import CircuitBreaker, OverflowPolicy, _limit_size, _retry_after_seconds
 
 
 class TaskiqMessageFactory(ModelFactory[TaskiqMessage]):
@@ -148,3 +155,665 @@ async def test_when_basic_parameters_are_passed__then_serialization_works(
     json_payload = json.loads(payload)
     assert json_payload['args'] == parameters['args']
     assert json_payload['kwargs'] == parameters['kwargs']
+
+
+async def test_when_batching_enabled__then_events_sent_in_single_request(
+    httpx_mock: HTTPXMock,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        batch_size=3,
+        batch_interval=60,
+    )
+    await middleware.startup()
+    message = TaskiqMessageFactory.build()
+    httpx_mock.add_response(
+        method='POST',
+        url='http://test_dashboard/api/tasks/batch',
+        status_code=204,
+    )
+
+    # when
+    await middleware.post_send(message)
+    await middleware.pre_execute(message)
+    await middleware.post_execute(message, result=TaskiqResult(is_err=False, return_value=1, execution_time=1.0))
+    await asyncio.gather(*middleware._pending, return_exceptions=True)
+
+    # then
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert request.headers['access-token'] == 'supersecret'
+    events = json.loads(request.content)['events']
+    assert [event['event'] for event in events] == ['queued', 'started', 'executed']
+    assert all(event['taskId'] == message.task_id for event in events)
+    assert events[2]['data']['taskName'] == message.task_name
+    assert middleware._buffer == []
+    await middleware.shutdown()
+
+
+async def test_when_batch_is_not_full__then_events_flushed_by_timer(
+    httpx_mock: HTTPXMock,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        batch_size=100,
+        batch_interval=0.05,
+    )
+    await middleware.startup()
+    message = TaskiqMessageFactory.build()
+    httpx_mock.add_response(
+        method='POST',
+        url='http://test_dashboard/api/tasks/batch',
+        status_code=204,
+    )
+
+    # when
+    await middleware.post_send(message)
+    assert httpx_mock.get_requests() == []
+    await asyncio.sleep(0.2)
+    await asyncio.gather(*middleware._pending, return_exceptions=True)
+
+    # then
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert len(json.loads(request.content)['events']) == 1
+    await middleware.shutdown()
+
+
+async def test_when_middleware_shutdown__then_buffered_events_flushed(
+    httpx_mock: HTTPXMock,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        batch_size=100,
+        batch_interval=60,
+    )
+    await middleware.startup()
+    message = TaskiqMessageFactory.build()
+    httpx_mock.add_response(
+        method='POST',
+        url='http://test_dashboard/api/tasks/batch',
+        status_code=204,
+    )
+    await middleware.post_send(message)
+
+    # when
+    await middleware.shutdown()
+
+    # then
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert json.loads(request.content)['events'][0]['event'] == 'queued'
+    assert middleware._flush_task is None
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'content_encoding'),
+    [
+        pytest.param({'big': 'x' * 2000}, 'gzip', id='payload_above_threshold'),
+        pytest.param({}, None, id='payload_below_threshold'),
+    ],
+)
+async def test_when_compression_enabled__then_large_payloads_compressed(
+    httpx_mock: HTTPXMock,
+    kwargs: dict[str, str],
+    content_encoding: str | None,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        compression='gzip',
+        compression_threshold=1024,
+    )
+    await middleware.startup()
+    message = TaskiqMessageFactory.build(args=[], kwargs=kwargs, labels={})
+    httpx_mock.add_response(
+        method='POST',
+        url=re.compile(f'http://test_dashboard/api/tasks/{message.task_id}/.*'),
+        status_code=204,
+    )
+
+    # when
+    await middleware.post_send(message)
+    await middleware.shutdown()
+
+    # then
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert request.headers.get('content-encoding') == content_encoding
+    content = gzip.decompress(request.content) if content_encoding else request.content
+    assert json.loads(content)['kwargs'] == kwargs
+
+
+async def test_when_payload_exceeds_size_limits__then_truncated_value_sent(
+    httpx_mock: HTTPXMock,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        max_args_bytes=100,
+        max_kwargs_bytes=100,
+        max_return_value_bytes=100,
+    )
+    await middleware.startup()
+    message = TaskiqMessageFactory.build(args=['x' * 1000], kwargs={'small': 1}, labels={})
+    httpx_mock.add_response(
+        method='POST',
+        url=re.compile(f'http://test_dashboard/api/tasks/{message.task_id}/.*'),
+        status_code=204,
+        is_reusable=True,
+    )
+
+    # when
+    await middleware.post_send(message)
+    await middleware.post_execute(
+        message, result=TaskiqResult(is_err=False, return_value='y' * 1000, execution_time=1.0)
+    )
+    await middleware.shutdown()
+
+    # then
+    queued_request, executed_request = httpx_mock.get_requests()
+    queued_payload = json.loads(queued_request.content)
+    truncated_args = TruncatedValue.from_payload(queued_payload['args'])
+    assert truncated_args is not None
+    serialized_args = json.dumps(['x' * 1000]).encode()
+    assert truncated_args.size == len(serialized_args)
+    assert truncated_args.sha256 == hashlib.sha256(serialized_args).hexdigest()
+    assert truncated_args.preview == serialized_args[:100].decode()
+    assert queued_payload['kwargs'] == {'small': 1}
+    return_value = json.loads(executed_request.content)['returnValue']['return_value']
+    assert TruncatedValue.from_payload(return_value) is not None
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        None,
+        -(2**70),
+        'quotes " and backslashes \\',
+        'non-ASCII é € 😀',
+        'control \x00 \n characters',
+        [1, 0.1, True, None, 'text'],
+        {'key': ['é', {'nested': '\x01'}], 1: 2.5},
+        list(range(100)),
+    ],
+)
+def test_when_value_at_size_limit__then_truncated_only_above_it(value: tp.Any) -> None:
+    # given
+    size = len(json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode())
+
+    # when
+    value_at_limit = _limit_size(value, size)
+    value_above_limit = _limit_size(value, size - 1)
+
+    # then
+    assert value_at_limit is value
+    assert TruncatedValue.from_payload(value_above_limit) is not None
+
+
+async def test_when_task_finished_within_coalesce_window__then_single_combined_event_sent(
+    httpx_mock: HTTPXMock,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        coalesce_window=60,
+    )
+    await middleware.startup()
+    message = TaskiqMessageFactory.build(args=[1], kwargs={}, labels={})
+    httpx_mock.add_response(
+        method='POST',
+        url=f'http://test_dashboard/api/tasks/{message.task_id}/started_executed',
+        status_code=204,
+    )
+
+    # when
+    await middleware.pre_execute(message)
+    await middleware.post_execute(message, result=TaskiqResult(is_err=False, return_value=2, execution_time=0.01))
+    await middleware.shutdown()
+
+    # then
+    payload = json.loads(httpx_mock.get_request().content)
+    assert payload['args'] == [1]
+    assert payload['taskName'] == message.task_name
+    assert payload['executionTime'] == 0.01
+    assert payload['returnValue'] == {'return_value': 2}
+    assert middleware._deferred_started == {}
+
+
+async def test_when_coalesce_window_is_over__then_started_and_executed_sent_separately(
+    httpx_mock: HTTPXMock,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        coalesce_window=0.01,
+    )
+    await middleware.startup()
+    message = TaskiqMessageFactory.build()
+    httpx_mock.add_response(
+        method='POST',
+        url=re.compile(f'http://test_dashboard/api/tasks/{message.task_id}/.*'),
+        status_code=204,
+        is_reusable=True,
+    )
+
+    # when
+    await middleware.pre_execute(message)
+    await asyncio.sleep(0.1)
+    await middleware.post_execute(message, result=TaskiqResult(is_err=False, return_value=None, execution_time=0.1))
+    await middleware.shutdown()
+
+    # then
+    assert [request.url.path.rsplit('/', 1)[-1] for request in httpx_mock.get_requests()] == ['started', 'executed']
+
+
+async def test_when_started_event_redelivered_within_coalesce_window__then_only_latest_sent(
+    httpx_mock: HTTPXMock,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        coalesce_window=0.05,
+    )
+    await middleware.startup()
+    message = TaskiqMessageFactory.build()
+    httpx_mock.add_response(
+        method='POST',
+        url=f'http://test_dashboard/api/tasks/{message.task_id}/started',
+        status_code=204,
+    )
+    loop = asyncio.get_running_loop()
+    errors: list[dict] = []
+    loop.set_exception_handler(lambda _, context: errors.append(context))
+
+    # when
+    await middleware.pre_execute(message)
+    await asyncio.sleep(0.02)
+    await middleware.pre_execute(message)
+    await asyncio.sleep(0.1)
+    await asyncio.gather(*middleware._pending, return_exceptions=True)
+    await middleware.shutdown()
+
+    # then
+    assert len(httpx_mock.get_requests()) == 1
+    assert middleware._deferred_started == {}
+    assert errors == []
+    loop.set_exception_handler(None)
+
+
+async def test_when_middleware_shutdown__then_deferred_started_events_sent(
+    httpx_mock: HTTPXMock,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        coalesce_window=60,
+    )
+    await middleware.startup()
+    message = TaskiqMessageFactory.build()
+    httpx_mock.add_response(
+        method='POST',
+        url=f'http://test_dashboard/api/tasks/{message.task_id}/started',
+        status_code=204,
+    )
+    await middleware.pre_execute(message)
+
+    # when
+    await middleware.shutdown()
+
+    # then
+    assert httpx_mock.get_request() is not None
+    assert middleware._deferred_started == {}
+
+
+@pytest.mark.parametrize(
+    ('overflow_policy', 'overflow_sample_rate', 'expected_events'),
+    [
+        pytest.param('drop_oldest', 0.1, ['queued', 'executed'], id='drop_oldest'),
+        pytest.param('drop_started', 0.1, ['queued', 'executed'], id='drop_started'),
+        pytest.param('sample', 0.0, ['started', 'queued'], id='sample_nothing'),
+        pytest.param('sample', 1.0, ['queued', 'executed'], id='sample_everything'),
+    ],
+)
+async def test_when_pending_events_limit_reached__then_events_dropped_by_overflow_policy(
+    httpx_mock: HTTPXMock,
+    overflow_policy: OverflowPolicy,
+    overflow_sample_rate: float,
+    expected_events: list[str],
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        batch_size=100,
+        batch_interval=60,
+        max_pending_events=2,
+        overflow_policy=overflow_policy,
+        overflow_sample_rate=overflow_sample_rate,
+    )
+    await middleware.startup()
+    httpx_mock.add_response(method='POST', url='http://test_dashboard/api/tasks/batch', status_code=204)
+    started_message, queued_message, executed_message = TaskiqMessageFactory.batch(3)
+
+    # when
+    await middleware.pre_execute(started_message)
+    await middleware.post_send(queued_message)
+    await middleware.post_execute(
+        executed_message, result=TaskiqResult(is_err=False, return_value=None, execution_time=1.0)
+    )
+    await middleware.shutdown()
+
+    # then
+    events = json.loads(httpx_mock.get_request().content)['events']
+    assert [event['event'] for event in events] == expected_events
+    assert middleware.counters.dropped == 1
+    assert middleware.counters.sent == 2
+
+
+async def test_when_dashboard_asks_to_retry_later__then_events_sent_again_after_retry_after(
+    httpx_mock: HTTPXMock,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        batch_interval=0.05,
+    )
+    await middleware.startup()
+    message = TaskiqMessageFactory.build()
+    url = f'http://test_dashboard/api/tasks/{message.task_id}/queued'
+    httpx_mock.add_response(method='POST', url=url, status_code=429, headers={'Retry-After': '0.1'})
+    httpx_mock.add_response(method='POST', url=url, status_code=204)
+
+    # when
+    await middleware.post_send(message)
+    await asyncio.gather(*middleware._pending, return_exceptions=True)
+    assert len(middleware._buffer) == 1
+    await asyncio.sleep(0.3)
+    await middleware.shutdown()
+
+    # then
+    first_request, second_request = httpx_mock.get_requests()
+    assert first_request.content == second_request.content
+    assert middleware.counters.sent == 1
+    assert middleware.counters.dropped == 0
+
+
+async def test_when_events_piled_up_while_paused__then_sent_in_limited_batches(
+    httpx_mock: HTTPXMock,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        max_pending_events=None,
+    )
+    await middleware.startup()
+    httpx_mock.add_response(method='POST', url='http://test_dashboard/api/tasks/batch', is_reusable=True)
+    middleware._pause(60)
+    for message in TaskiqMessageFactory.batch(MAX_EVENT_BATCH_SIZE + 10):
+        await middleware.post_send(message)
+
+    # when
+    await middleware.shutdown()
+
+    # then
+    batch_sizes = [len(json.loads(request.content)['events']) for request in httpx_mock.get_requests()]
+    assert batch_sizes == [MAX_EVENT_BATCH_SIZE, 10]
+    assert middleware.counters.sent == MAX_EVENT_BATCH_SIZE + 10
+
+
+@pytest.mark.parametrize(
+    ('retry_after', 'expected_seconds'),
+    [
+        pytest.param('3', 3.0, id='seconds'),
+        pytest.param('Wed, 21 Oct 2015 07:28:00 GMT', 0.0, id='http_date_in_past'),
+        pytest.param('soon', 1.0, id='invalid'),
+        pytest.param(None, 1.0, id='missing'),
+    ],
+)
+def test_when_retry_after_header_parsed__then_delay_returned(retry_after: str | None, expected_seconds: float) -> None:
+    # given
+    headers = {} if retry_after is None else {'Retry-After': retry_after}
+
+    # when
+    seconds = _retry_after_seconds(httpx.Response(429, headers=headers))
+
+    # then
+    assert seconds == expected_seconds
+
+
+async def test_when_dashboard_unreachable__then_events_spooled_and_replayed_later(
+    httpx_mock: HTTPXMock,
+    tmp_path: Path,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        spool_path=tmp_path / 'spool.db',
+        spool_replay_interval=0.05,
+        max_retries=0,
+    )
+    await middleware.startup()
+    message = TaskiqMessageFactory.build()
+    httpx_mock.add_exception(
+        httpx.ConnectError('Connection refused'),
+        url=f'http://test_dashboard/api/tasks/{message.task_id}/queued',
+    )
+    httpx_mock.add_response(method='POST', url='http://test_dashboard/api/tasks/batch', status_code=204)
+
+    # when
+    await middleware.post_send(message)
+    await asyncio.gather(*middleware._pending, return_exceptions=True)
+    assert middleware.counters.spooled == 1
+    await asyncio.sleep(0.2)
+    await middleware.shutdown()
+
+    # then
+    _, replay_request = httpx_mock.get_requests()
+    [event] = json.loads(replay_request.content)['events']
+    assert event['taskId'] == message.task_id
+    assert event['event'] == 'queued'
+    assert middleware.counters.sent == 1
+
+
+async def test_when_request_fails__then_retried_with_backoff(
+    httpx_mock: HTTPXMock,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        max_retries=2,
+        retry_backoff=0.01,
+    )
+    await middleware.startup()
+    message = TaskiqMessageFactory.build()
+    url = f'http://test_dashboard/api/tasks/{message.task_id}/queued'
+    httpx_mock.add_exception(httpx.ConnectError('Connection refused'), url=url)
+    httpx_mock.add_response(method='POST', url=url, status_code=500)
+    httpx_mock.add_response(method='POST', url=url, status_code=204)
+
+    # when
+    await middleware.post_send(message)
+    await asyncio.gather(*middleware._pending, return_exceptions=True)
+    await middleware.shutdown()
+
+    # then
+    assert len(httpx_mock.get_requests()) == 3
+    assert middleware.counters.retries == 2
+    assert middleware.counters.sent == 1
+    assert middleware.circuit_breaker.state == 'closed'
+
+
+async def test_when_requests_keep_failing__then_circuit_opened_until_probe_succeeds(
+    httpx_mock: HTTPXMock,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        batch_interval=0.02,
+        max_retries=0,
+        circuit_breaker_threshold=1,
+        circuit_breaker_reset_timeout=0.1,
+    )
+    await middleware.startup()
+    failed_message, probe_message = TaskiqMessageFactory.batch(2)
+    httpx_mock.add_exception(
+        httpx.ConnectError('Connection refused'),
+        url=f'http://test_dashboard/api/tasks/{failed_message.task_id}/queued',
+    )
+    httpx_mock.add_response(
+        method='POST',
+        url=f'http://test_dashboard/api/tasks/{probe_message.task_id}/queued',
+        status_code=204,
+    )
+
+    # when
+    await middleware.post_send(failed_message)
+    await asyncio.gather(*middleware._pending, return_exceptions=True)
+    assert middleware.circuit_breaker.state == 'open'
+    await middleware.post_send(probe_message)
+    assert len(httpx_mock.get_requests()) == 1, 'Expected event to be buffered while the circuit is open'
+    await asyncio.sleep(0.3)
+    await middleware.shutdown()
+
+    # then
+    assert len(httpx_mock.get_requests()) == 2
+    assert middleware.circuit_breaker.state == 'closed'
+    assert middleware.counters.circuit_opened == 1
+    assert middleware.counters.failed == 1
+    assert middleware.counters.sent == 1
+
+
+async def test_when_circuit_reset_timeout_is_over_with_empty_spool__then_probe_left_for_events(
+    httpx_mock: HTTPXMock,
+    tmp_path: Path,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        spool_path=tmp_path / 'spool.db',
+        spool_replay_interval=0.01,
+        circuit_breaker_threshold=1,
+        circuit_breaker_reset_timeout=0.05,
+    )
+    await middleware.startup()
+    message = TaskiqMessageFactory.build()
+    httpx_mock.add_response(
+        method='POST',
+        url=f'http://test_dashboard/api/tasks/{message.task_id}/queued',
+        status_code=204,
+    )
+    middleware.circuit_breaker.record_failure()
+    await asyncio.sleep(0.2)
+
+    # when
+    await middleware.post_send(message)
+    await asyncio.gather(*middleware._pending, return_exceptions=True)
+
+    # then
+    assert len(httpx_mock.get_requests()) == 1
+    assert middleware.circuit_breaker.state == 'closed'
+    assert middleware._buffer == []
+    await middleware.shutdown()
+
+
+async def test_when_probe_answered_with_retry_after__then_circuit_neither_closed_nor_opened(
+    httpx_mock: HTTPXMock,
+) -> None:
+    # given
+    middleware = DashboardMiddleware(
+        url='http://test_dashboard',
+        api_token='supersecret',
+        batch_interval=0.02,
+        circuit_breaker_threshold=1,
+        circuit_breaker_reset_timeout=0.01,
+    )
+    await middleware.startup()
+    message = TaskiqMessageFactory.build()
+    url = f'http://test_dashboard/api/tasks/{message.task_id}/queued'
+    httpx_mock.add_response(method='POST', url=url, status_code=503, headers={'Retry-After': '0.1'})
+    httpx_mock.add_response(method='POST', url=url, status_code=204)
+    middleware.circuit_breaker.record_failure()
+    await asyncio.sleep(0.02)
+
+    # when
+    await middleware.post_send(message)
+    await asyncio.gather(*middleware._pending, return_exceptions=True)
+
+    # then
+    assert middleware.circuit_breaker.state == 'half_open'
+    assert not middleware.circuit_breaker.is_open(), 'Expected next request to be let through as a probe'
+    await asyncio.sleep(0.3)
+    assert len(httpx_mock.get_requests()) == 2
+    assert middleware.circuit_breaker.state == 'closed'
+    assert middleware.counters.sent == 1
+    await middleware.shutdown()
+
+
+def test_when_half_open_probe_fails__then_circuit_opened_again() -> None:
+    # given
+    circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.0)
+    circuit_breaker.record_failure()
+    circuit_breaker.record_failure()
+
+    # when
+    is_probe_allowed = circuit_breaker.allow_request()
+    is_opened_again = circuit_breaker.record_failure()
+
+    # then
+    assert is_probe_allowed
+    assert is_opened_again
+    assert circuit_breaker.state == 'open'
+
+
+@pytest.mark.parametrize(
+    ('url', 'expected_protocols'),
+    [
+        pytest.param('http://test_dashboard', {'http2': True, 'http1': False}, id='plain_http_prior_knowledge'),
+        pytest.param('https://test_dashboard', {'http2': True, 'http1': True}, id='tls_negotiated'),
+    ],
+)
+def test_when_http2_enabled__then_client_created_with_http2_and_pool_limits(
+    monkeypatch: pytest.MonkeyPatch,
+    url: str,
+    expected_protocols: dict[str, bool],
+) -> None:
+    # given
+    client_class = Mock()
+    monkeypatch.setattr(httpx, 'AsyncClient', client_class)
+    middleware = DashboardMiddleware(
+        url=url,
+        api_token='supersecret',
+        http2=True,
+        max_connections=4,
+        max_keepalive_connections=2,
+        keepalive_expiry=30.0,
+    )
+
+    # when
+    middleware._get_client()
+
+    # then
+    client_kwargs = client_class.call_args.kwargs
+    assert {protocol: client_kwargs[protocol] for protocol in ('http1', 'http2')} == expected_protocols
+    assert client_kwargs['limits'] == httpx.Limits(
+        max_connections=4, max_keepalive_connections=2, keepalive_expiry=30.0
+    )
@@ -0,0 +1,59 @@
+import gzip
+from collections.abc import AsyncGenerator
+
+import fastapi
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from taskiq_dashboard.api.middlewares import RequestDecompressionMiddleware
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[AsyncClient]:
+    app = fastapi.FastAPI()
+
+    @app.post('/api/tasks/batch')
+    async def api_route(body: dict[str, str]) -> dict[str, str]:
+        return body
+
+    app.add_middleware(RequestDecompressionMiddleware, max_body_size=1024)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url='http://test') as client:
+        yield client
+
+
+async def test_when_body_compressed__then_route_receives_decompressed_body(client: AsyncClient) -> None:
+    # when
+    response = await client.post(
+        '/api/tasks/batch',
+        headers={'content-type': 'application/json', 'content-encoding': 'gzip'},
+        content=gzip.compress(b'{"key": "value"}'),
+    )
+
+    # then
+    assert response.status_code == 200
+    assert response.json() == {'key': 'value'}
+
+
+@pytest.mark.parametrize(
+    ('content_encoding', 'content', 'status_code'),
+    [
+        pytest.param('gzip', gzip.compress(b' ' * 2048), 413, id='decompressed_body_too_large'),
+        pytest.param('gzip', b'not gzip', 400, id='corrupted_body'),
+        pytest.param('br', b'{}', 415, id='unsupported_encoding'),
+    ],
+)
+async def test_when_body_cannot_be_decompressed__then_request_rejected(
+    client: AsyncClient,
+    content_encoding: str,
+    content: bytes,
+    status_code: int,
+) -> None:
+    # when
+    response = await client.post(
+        '/api/tasks/batch',
+        headers={'content-type': 'application/json', 'content-encoding': content_encoding},
+        content=content,
+    )
+
+    # then
+    assert response.status_code == status_code
@@ -0,0 +1,58 @@
+import datetime as dt
+import uuid
+
+from taskiq_dashboard.domain.dto.task import TaskSummary
+from taskiq_dashboard.domain.dto.task_status import TaskStatus
+from taskiq_dashboard.infrastructure.services import InMemoryTaskBroadcaster
+
+
+def _task_summary(name: str = 'test_task') -> TaskSummary:
+    return TaskSummary(
+        id=uuid.uuid4(),
+        name=name,
+        status=TaskStatus.QUEUED,
+        worker='test_worker',
+        queued_at=dt.datetime.now(dt.timezone.utc),
+        started_at=None,
+        finished_at=None,
+    )
+
+
+class TestInMemoryTaskBroadcaster:
+    async def test_when_tasks_published__then_every_subscriber_receives_them(self) -> None:
+        # Given
+        broadcaster = InMemoryTaskBroadcaster()
+        task = _task_summary()
+
+        # When
+        async with broadcaster.subscribe() as first, broadcaster.subscribe() as second:
+            broadcaster.publish([task])
+
+            # Then
+            assert await anext(first) == task
+            assert await anext(second) == task
+
+    async def test_when_subscriber_queue_full__then_new_tasks_dropped(self) -> None:
+        # Given
+        broadcaster = InMemoryTaskBroadcaster(queue_size=1)
+        first_task, second_task = _task_summary('first'), _task_summary('second')
+
+        async with broadcaster.subscribe() as tasks:
+            # When
+            broadcaster.publish([first_task, second_task])
+
+            # Then
+            assert await anext(tasks) == first_task
+            assert tasks.queue.empty()  # ty: ignore[unresolved-attribute]
+
+    async def test_when_subscription_closed__then_tasks_not_delivered(self) -> None:
+        # Given
+        broadcaster = InMemoryTaskBroadcaster()
+        async with broadcaster.subscribe():
+            pass
+
+        # When
+        broadcaster.publish([_task_summary()])
+
+        # Then
+        assert not broadcaster._subscriptions